@@ -0,0 +1,69 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the startup time of a short-lived process that imports
+tensornetwork and contracts a small numpy network with `ncon`. Each
+measurement runs in a fresh interpreter. The lazy default is compared to
+eagerly importing all backends and optional subsystems (the behaviour
+of `import tensornetwork` before backends and subsystems were loaded on
+first use).
+"""
+import subprocess
+import sys
+import numpy as np
+
+LAZY = """
+import time
+t0 = time.time()
+import numpy as np
+import tensornetwork as tn
+tn.ncon([np.ones((2, 2)), np.ones((2, 2))], [[-1, 1], [1, -2]])
+print(time.time() - t0)
+"""
+
+EAGER = """
+import time
+t0 = time.time()
+import importlib
+import numpy as np
+import tensornetwork as tn
+from tensornetwork.backends import backend_factory
+for name in tn._LAZY_ATTRIBUTES:
+  getattr(tn, name)
+for module_name, _ in backend_factory._BACKENDS.values():
+  importlib.import_module(module_name)
+tn.ncon([np.ones((2, 2)), np.ones((2, 2))], [[-1, 1], [1, -2]])
+print(time.time() - t0)
+"""
+
+
+def time_startup(code, num_runs):
+  times = [
+      float(subprocess.check_output([sys.executable, '-c', code]))
+      for _ in range(num_runs)
+  ]
+  return np.median(times)
+
+
+def main(num_runs=10):
+  print(f'median over {num_runs} fresh interpreters')
+  print('import tensornetwork + ncon (lazy):  {:.1f} ms'.format(
+      1E3 * time_startup(LAZY, num_runs)))
+  print('import tensornetwork + ncon (eager): {:.1f} ms'.format(
+      1E3 * time_startup(EAGER, num_runs)))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,66 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the steady-state call overhead of `tn.jit`. A small
+function is called repeatedly, such that the runtime is dominated by
+the dispatch overhead of the jitted wrapper. The cached wrapper returned
+by `tn.jit` is compared to building a new jitted function at every call
+(the behaviour of `tn.jit` before jitted functions were cached).
+"""
+import time
+import functools
+import tensornetwork as tn
+from tensornetwork.backends import backend_factory
+
+
+def time_calls(fun, args, num_calls):
+  fun(*args)  # compile
+  t0 = time.time()
+  for _ in range(num_calls):
+    res = fun(*args)
+  if hasattr(res, 'block_until_ready'):
+    res.block_until_ready()
+  return (time.time() - t0) / num_calls
+
+
+def main(backend='jax', num_calls=2000):
+  backend_obj = backend_factory.get_backend(backend)
+  x = backend_obj.randn((8,), seed=10)
+
+  def fun(x):
+    return backend_obj.multiply(x, x) + x
+
+  def uncached(x):
+    return backend_obj.jit(fun)(x)
+
+  cached = tn.jit(fun, backend=backend)
+
+  @functools.partial(tn.jit, backend_argnum=1)
+  def cached_argnum(x, the_backend):
+    _ = the_backend
+    return fun(x)
+
+  print(f'backend: {backend}, {num_calls} calls')
+  print('uncached:               {:.2f} us/call'.format(
+      1E6 * time_calls(uncached, (x,), num_calls)))
+  print('tn.jit:                 {:.2f} us/call'.format(
+      1E6 * time_calls(cached, (x,), num_calls)))
+  print('tn.jit(backend_argnum): {:.2f} us/call'.format(
+      1E6 * time_calls(cached_argnum, (x, backend), num_calls)))
+  print('cache info:', cached.cache_info())
+
+
+if __name__ == '__main__':
+  main()
@@ -1,3 +1,6 @@
+import importlib
+import sys
+from typing import TYPE_CHECKING
 from tensornetwork.network_components import (AbstractNode, CopyNode, Edge,
                                               Node, NodeCollection)
 from tensornetwork.network_operations import (
@@ -27,18 +30,79 @@ from tensornetwork.network_components import (
     get_all_nondangling, get_all_dangling, get_parallel_edges, get_shared_edges,
     outer_product, outer_product_final_nodes, slice_edge, split_edge)
 from tensornetwork.backends.abstract_backend import AbstractBackend
+from tensornetwork.backends.backend_factory import register_backend
 from tensornetwork.network_components import connect, disconnect
 from tensornetwork.ncon_interface import ncon
+from tensornetwork.precision import PrecisionPolicy
 from tensornetwork.version import __version__
-from tensornetwork.visualization.graphviz import to_graphviz
-from tensornetwork import contractors
-from tensornetwork.utils import load_nodes, save_nodes
-from tensornetwork.matrixproductstates.infinite_mps import InfiniteMPS
-from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
-from tensornetwork.matrixproductstates.dmrg import FiniteDMRG
-from tensornetwork.matrixproductstates.mpo import FiniteTFI, FiniteXXZ
 from tensornetwork.backend_contextmanager import DefaultBackend, set_default_backend
-from tensornetwork import block_sparse
-from tensornetwork.block_sparse.blocksparsetensor import BlockSparseTensor, ChargeArray
-from tensornetwork.block_sparse.index import Index
-from tensornetwork.block_sparse.charge import U1Charge, BaseCharge, Z2Charge, ZNCharge
+
+# Optional subsystems are imported on first attribute access, such that
+# `import tensornetwork` does not pay for graphviz, h5py, opt_einsum or
+# the MPS and block-sparse modules. Maps attribute names to
+# `(module, attribute)`, where `attribute = None` refers to the module itself.
+_LAZY_ATTRIBUTES = {
+    "to_graphviz": ("tensornetwork.visualization.graphviz", "to_graphviz"),
+    "contractors": ("tensornetwork.contractors", None),
+    "load_nodes": ("tensornetwork.utils", "load_nodes"),
+    "save_nodes": ("tensornetwork.utils", "save_nodes"),
+    "InfiniteMPS": ("tensornetwork.matrixproductstates.infinite_mps",
+                    "InfiniteMPS"),
+    "FiniteMPS": ("tensornetwork.matrixproductstates.finite_mps", "FiniteMPS"),
+    "FiniteDMRG": ("tensornetwork.matrixproductstates.dmrg", "FiniteDMRG"),
+    "FiniteTDVP": ("tensornetwork.matrixproductstates.tdvp", "FiniteTDVP"),
+    "FinitePurifiedMPS": ("tensornetwork.matrixproductstates.purification",
+                          "FinitePurifiedMPS"),
+    "FiniteTFI": ("tensornetwork.matrixproductstates.mpo", "FiniteTFI"),
+    "FiniteXXZ": ("tensornetwork.matrixproductstates.mpo", "FiniteXXZ"),
+    "block_sparse": ("tensornetwork.block_sparse", None),
+    "BlockSparseTensor": ("tensornetwork.block_sparse.blocksparsetensor",
+                          "BlockSparseTensor"),
+    "ChargeArray": ("tensornetwork.block_sparse.blocksparsetensor",
+                    "ChargeArray"),
+    "Index": ("tensornetwork.block_sparse.index", "Index"),
+    "U1Charge": ("tensornetwork.block_sparse.charge", "U1Charge"),
+    "BaseCharge": ("tensornetwork.block_sparse.charge", "BaseCharge"),
+    "Z2Charge": ("tensornetwork.block_sparse.charge", "Z2Charge"),
+    "ZNCharge": ("tensornetwork.block_sparse.charge", "ZNCharge"),
+}
+
+if TYPE_CHECKING:
+  # static analysis tools do not evaluate `__getattr__`
+  from tensornetwork.visualization.graphviz import to_graphviz
+  from tensornetwork import contractors
+  from tensornetwork.utils import load_nodes, save_nodes
+  from tensornetwork.matrixproductstates.infinite_mps import InfiniteMPS
+  from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
+  from tensornetwork.matrixproductstates.dmrg import FiniteDMRG
+  from tensornetwork.matrixproductstates.tdvp import FiniteTDVP
+  from tensornetwork.matrixproductstates.purification import FinitePurifiedMPS
+  from tensornetwork.matrixproductstates.mpo import FiniteTFI, FiniteXXZ
+  from tensornetwork import block_sparse
+  from tensornetwork.block_sparse.blocksparsetensor import (BlockSparseTensor,
+                                                            ChargeArray)
+  from tensornetwork.block_sparse.index import Index
+  from tensornetwork.block_sparse.charge import (U1Charge, BaseCharge,
+                                                 Z2Charge, ZNCharge)
+
+
+def __getattr__(name):
+  if name not in _LAZY_ATTRIBUTES:
+    raise AttributeError("module '{}' has no attribute '{}'".format(
+        __name__, name))
+  module_name, attribute = _LAZY_ATTRIBUTES[name]
+  value = importlib.import_module(module_name)
+  if attribute is not None:
+    value = getattr(value, attribute)
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+# module level `__getattr__` requires python >= 3.7 (PEP 562)
+if sys.version_info < (3, 7):
+  for _name in _LAZY_ATTRIBUTES:
+    __getattr__(_name)
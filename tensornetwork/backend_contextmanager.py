@@ -44,6 +44,6 @@ def set_default_backend(backend: Union[Text, AbstractBackend]) -> None:
   if not isinstance(backend, (Text, AbstractBackend)):
     raise ValueError("Item passed to set_default_backend "
                      "must be Text or BaseBackend")
-  if isinstance(backend, Text) and backend not in backend_factory._BACKENDS:
+  if isinstance(backend, Text) and not backend_factory.has_backend(backend):
     raise ValueError(f"Backend '{backend}' was not found.")
   _default_backend_stack.default_backend = backend
@@ -20,6 +20,15 @@ Tensor = Any
 
 
 class AbstractBackend:
+  # Capability flags, consulted e.g. by `ncon` and `tn.jit` to choose fast
+  # paths. Backends override the defaults as class attributes.
+  #   supports_jit: `jit` compiles functions (as opposed to returning them).
+  #   supports_batched_matmul: `matmul` broadcasts over leading batch
+  #     dimensions.
+  #   supports_inplace: tensors are mutable and can be updated in place.
+  supports_jit = False
+  supports_batched_matmul = False
+  supports_inplace = False
 
   def __init__(self) -> None:
     self.name = 'abstract backend'
@@ -79,7 +88,9 @@ class AbstractBackend:
       pivot_axis: int = -1,
       max_singular_values: Optional[int] = None,
       max_truncation_error: Optional[float] = None,
-      relative: Optional[bool] = False
+      relative: Optional[bool] = False,
+      method: Text = 'full',
+      seed: Optional[int] = None
   ) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
     """Computes the singular value decomposition (SVD) of a tensor.
 
@@ -113,6 +124,14 @@ class AbstractBackend:
     ```
     Note that the output ordering matches numpy.linalg.svd rather than tf.svd.
 
+    By default (`method='full'`), the full SVD is computed and truncated
+    afterwards. If only few singular values are kept, `method='randomized'`
+    (randomized range finding) or `method='lanczos'` (Krylov SVD) avoid the
+    cost of the full SVD. Both require `max_singular_values` and fall back to
+    the full SVD if it is not small compared to the matrix dimensions.
+    Otherwise, `max_truncation_error` and `s_rest` only take the singular
+    values computed by the method into account.
+
     Args:
       tensor: A tensor to be decomposed.
       pivot_axis: Where to split the tensor's axes before flattening into a
@@ -122,6 +141,10 @@ class AbstractBackend:
       max_truncation_error: The maximum allowed truncation error or `None` to
         not do any truncation.
       relative: Multiply `max_truncation_err` with the largest singular value.
+      method: The SVD algorithm, one of `'full'`, `'randomized'` or
+        `'lanczos'`.
+      seed: Seed for the random starting matrix of `method='randomized'` and
+        `method='lanczos'`. If `None`, a nondeterministic seed is used.
 
     Returns:
       u: Left tensor factor.
@@ -565,6 +588,68 @@ class AbstractBackend:
     raise NotImplementedError("Backend '{}' has not implemented divide.".format(
         self.name))
 
+  def axpy(self, alpha: Any, x: Tensor, y: Tensor) -> Tensor:
+    """Compute `alpha * x + y`.
+
+    Backends with `supports_inplace` overwrite `y` with the result whenever
+    possible. All other backends return a new tensor, hence the returned
+    tensor has to be used in any case.
+    Args:
+      alpha: A scalar.
+      x: A tensor.
+      y: A tensor of the same shape as `x`.
+    Returns:
+      Tensor: The result, possibly stored in `y`.
+    """
+    return self.addition(y, alpha * x)
+
+  def scal(self, alpha: Any, x: Tensor) -> Tensor:
+    """Compute `alpha * x`.
+
+    Backends with `supports_inplace` overwrite `x` with the result whenever
+    possible. All other backends return a new tensor, hence the returned
+    tensor has to be used in any case.
+    Args:
+      alpha: A scalar.
+      x: A tensor.
+    Returns:
+      Tensor: The result, possibly stored in `x`.
+    """
+    return alpha * x
+
+  def tensordot_into(self, a: Tensor, b: Tensor,
+                     axes: Sequence[Sequence[int]], out: Tensor) -> Tensor:
+    """Do a tensordot of tensors `a` and `b` over the given axes and store
+    the result in `out`.
+
+    Backends with `supports_inplace` write into `out`. All other backends
+    return a new tensor, hence the returned tensor has to be used in
+    any case.
+    Args:
+      a: A tensor.
+      b: Another tensor.
+      axes: Two lists of integers. These values are the contraction
+        axes.
+      out: A tensor with the shape of the result.
+    Returns:
+      Tensor: The result, possibly stored in `out`.
+    """
+    del out
+    return self.tensordot(a, b, axes)
+
+  def cast(self, tensor: Tensor, dtype: Type[np.number]) -> Tensor:
+    """Cast the elements of `tensor` to `dtype`.
+
+    Args:
+      tensor: A tensor.
+      dtype: The new dtype. Backends accept numpy dtypes in addition
+        to their native dtypes.
+    Returns:
+      Tensor: The cast tensor.
+    """
+    raise NotImplementedError("Backend '{}' has not implemented cast.".format(
+        self.name))
+
   def index_update(self, tensor: Tensor, mask: Tensor,
                    assignee: Tensor) -> Tensor:
     """Update `tensor` at elements defined by `mask` with value `assignee`.
@@ -12,37 +12,114 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Union, Text
-from tensornetwork.backends.tensorflow import tensorflow_backend
-from tensornetwork.backends.numpy import numpy_backend
-from tensornetwork.backends.jax import jax_backend
-from tensornetwork.backends.shell import shell_backend
-from tensornetwork.backends.pytorch import pytorch_backend
-from tensornetwork.backends.symmetric import symmetric_backend
+import importlib
+from typing import Callable, Union, Text
 from tensornetwork.backends import abstract_backend
+
+# backend modules are only imported once the backend is first requested.
+# Values are either `(module, class)` import paths or callables returning
+# an `AbstractBackend`, see `register_backend`.
 _BACKENDS = {
-    "tensorflow": tensorflow_backend.TensorFlowBackend,
-    "numpy": numpy_backend.NumPyBackend,
-    "jax": jax_backend.JaxBackend,
-    "shell": shell_backend.ShellBackend,
-    "pytorch": pytorch_backend.PyTorchBackend,
-    "symmetric": symmetric_backend.SymmetricBackend
+    "tensorflow": ("tensornetwork.backends.tensorflow.tensorflow_backend",
+                   "TensorFlowBackend"),
+    "numpy": ("tensornetwork.backends.numpy.numpy_backend", "NumPyBackend"),
+    "jax": ("tensornetwork.backends.jax.jax_backend", "JaxBackend"),
+    "shell": ("tensornetwork.backends.shell.shell_backend", "ShellBackend"),
+    "pytorch": ("tensornetwork.backends.pytorch.pytorch_backend",
+                "PyTorchBackend"),
+    "symmetric": ("tensornetwork.backends.symmetric.symmetric_backend",
+                  "SymmetricBackend")
 }
 
 #we instantiate each backend only once and store it here
 _INSTANTIATED_BACKENDS = dict()
 
+# third party packages can provide backends through this entry point group
+ENTRY_POINT_GROUP = "tensornetwork.backends"
+# set to `True` once the entry points have been added to `_BACKENDS`
+_ENTRY_POINTS_STATE = {"loaded": False}
+
+
+def _load_entry_points() -> None:
+  """Add the backends advertised under the `ENTRY_POINT_GROUP` entry point
+  group of installed packages to the registry. An entry point has to refer
+  to a callable returning an `AbstractBackend`, and is only loaded once
+  its backend is requested. Backends registered with `register_backend`
+  take precedence.
+  """
+  if _ENTRY_POINTS_STATE["loaded"]:
+    return
+  _ENTRY_POINTS_STATE["loaded"] = True
+  try:
+    #pylint: disable=import-outside-toplevel
+    from importlib import metadata
+  except ImportError:  # python < 3.8
+    return
+  entry_points = metadata.entry_points()
+  if hasattr(entry_points, "select"):
+    entry_points = entry_points.select(group=ENTRY_POINT_GROUP)
+  else:
+    entry_points = entry_points.get(ENTRY_POINT_GROUP, [])
+  for entry_point in entry_points:
+    if entry_point.name not in _BACKENDS:
+      _BACKENDS[entry_point.name] = (
+          lambda entry_point=entry_point: entry_point.load()())
+
+
+def register_backend(name: Text,
+                     factory: Callable[[], abstract_backend.AbstractBackend],
+                     overwrite: bool = False) -> None:
+  """Register a backend under `name`, such that it can be used like the
+  built-in backends, e.g. `tn.Node(tensor, backend=name)`.
+
+  Args:
+    name: The name of the backend.
+    factory: A callable (typically a subclass of `AbstractBackend`)
+      returning the backend object. It is called once, the first time the
+      backend is requested.
+    overwrite: If `True`, replace a backend that is already registered
+      under `name`.
+  Raises:
+    ValueError: If a backend is already registered under `name` and
+      `overwrite` is `False`.
+    TypeError: If `factory` is not callable.
+  """
+  if not callable(factory):
+    raise TypeError("`factory` has to be callable, got {}".format(
+        type(factory)))
+  if name in _BACKENDS and not overwrite:
+    raise ValueError("Backend '{}' already exists. Use `overwrite=True` "
+                     "to replace it.".format(name))
+  _BACKENDS[name] = factory
+  _INSTANTIATED_BACKENDS.pop(name, None)
+
+
+def has_backend(name: Text) -> bool:
+  """Return `True` if a backend is registered under `name`."""
+  if name not in _BACKENDS:
+    _load_entry_points()
+  return name in _BACKENDS
+
 
 def get_backend(
     backend: Union[Text, abstract_backend.AbstractBackend]
 ) -> abstract_backend.AbstractBackend:
   if isinstance(backend, abstract_backend.AbstractBackend):
     return backend
-  if backend not in _BACKENDS:
+  if not has_backend(backend):
     raise ValueError("Backend '{}' does not exist".format(backend))
 
   if backend in _INSTANTIATED_BACKENDS:
     return _INSTANTIATED_BACKENDS[backend]
 
-  _INSTANTIATED_BACKENDS[backend] = _BACKENDS[backend]()
-  return _INSTANTIATED_BACKENDS[backend]
+  factory = _BACKENDS[backend]
+  if isinstance(factory, tuple):
+    module_name, class_name = factory
+    backend_obj = getattr(importlib.import_module(module_name), class_name)()
+  else:
+    backend_obj = factory()
+    if not isinstance(backend_obj, abstract_backend.AbstractBackend):
+      raise TypeError("Backend '{}' has to be an `AbstractBackend`, "
+                      "got {}".format(backend, type(backend_obj)))
+  _INSTANTIATED_BACKENDS[backend] = backend_obj
+  return backend_obj
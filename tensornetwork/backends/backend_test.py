@@ -17,9 +17,19 @@ def clean_tensornetwork_modules():
 @pytest.fixture(autouse=True)
 def clean_backend_import():
   #never do this outside testing
+  modules = {
+      name: module
+      for name, module in sys.modules.items()
+      if name.startswith('tensornetwork')
+  }
+  instantiated_backends = dict(backend_factory._INSTANTIATED_BACKENDS)
   clean_tensornetwork_modules()
   yield  # use as teardown
   clean_tensornetwork_modules()
+  # backends are imported lazily, so later tests have to see the same
+  # modules and backend objects they were collected with
+  sys.modules.update(modules)
+  backend_factory._INSTANTIATED_BACKENDS = instantiated_backends
 
 
 @pytest.fixture
@@ -152,6 +162,110 @@ def test_basic_network_without_backends_raises_error():
     Node(np.ones((2, 2)), backend="pytorch")
 
 
+def test_backends_are_imported_lazily():
+  #pylint: disable=import-outside-toplevel
+  #pylint: disable=reimported
+  import tensornetwork
+  from tensornetwork.backends import backend_factory as factory
+  assert 'tensornetwork.backends.numpy.numpy_backend' not in sys.modules
+  assert 'tensornetwork.backends.jax.jax_backend' not in sys.modules
+  backend = factory.get_backend('numpy')
+  assert backend.name == 'numpy'
+  assert factory.get_backend('numpy') is backend
+  assert 'tensornetwork.backends.numpy.numpy_backend' in sys.modules
+  assert 'tensornetwork.backends.jax.jax_backend' not in sys.modules
+  assert 'tensornetwork.backends.symmetric.symmetric_backend' not in sys.modules
+
+
+def test_optional_subsystems_are_imported_lazily():
+  #pylint: disable=import-outside-toplevel
+  #pylint: disable=reimported
+  import tensornetwork
+  assert 'tensornetwork.matrixproductstates.finite_mps' not in sys.modules
+  assert 'tensornetwork.block_sparse' not in sys.modules
+  assert 'tensornetwork.visualization.graphviz' not in sys.modules
+  assert 'FiniteMPS' in dir(tensornetwork)
+  from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
+  assert tensornetwork.FiniteMPS is FiniteMPS
+  from tensornetwork import U1Charge
+  assert U1Charge is tensornetwork.block_sparse.U1Charge
+  with pytest.raises(AttributeError):
+    _ = tensornetwork.nonexistent_attribute
+
+
+def test_register_backend(monkeypatch):
+  #pylint: disable=import-outside-toplevel
+  import tensornetwork as tn
+  from tensornetwork.backends import backend_factory as factory
+  from tensornetwork.backends.numpy.numpy_backend import NumPyBackend
+  # keep the registered test backends out of the global registry
+  monkeypatch.setattr(factory, "_BACKENDS", dict(factory._BACKENDS))
+  monkeypatch.setattr(factory, "_INSTANTIATED_BACKENDS",
+                      dict(factory._INSTANTIATED_BACKENDS))
+
+  class CustomBackend(NumPyBackend):
+
+    def __init__(self):
+      super().__init__()
+      self.name = "custom"
+
+  tn.register_backend("custom", CustomBackend)
+  backend = factory.get_backend("custom")
+  assert isinstance(backend, CustomBackend)
+  assert factory.get_backend("custom") is backend
+  assert backend.supports_inplace
+  node = tn.Node(np.ones((2, 2)), backend="custom")
+  assert node.backend is backend
+  result = tn.ncon([np.ones((2, 2)), np.ones((2, 2))], [[-1, 1], [1, -2]],
+                   backend="custom")
+  np.testing.assert_allclose(result, 2 * np.ones((2, 2)))
+  tn.set_default_backend("custom")
+  tn.set_default_backend("numpy")
+
+  with pytest.raises(ValueError, match="Backend 'custom' already exists"):
+    tn.register_backend("custom", CustomBackend)
+  tn.register_backend("custom", CustomBackend, overwrite=True)
+  assert factory.get_backend("custom") is not backend
+  with pytest.raises(TypeError):
+    tn.register_backend("other", 1)
+  tn.register_backend("other", lambda: 1)
+  with pytest.raises(TypeError, match="has to be an `AbstractBackend`"):
+    factory.get_backend("other")
+
+
+def test_backend_entry_points(monkeypatch):
+  metadata = pytest.importorskip("importlib.metadata")
+  #pylint: disable=import-outside-toplevel
+  from tensornetwork.backends import backend_factory as factory
+  from tensornetwork.backends.numpy.numpy_backend import NumPyBackend
+  entry_point = metadata.EntryPoint(
+      name="plugin",
+      value="tensornetwork.backends.numpy.numpy_backend:NumPyBackend",
+      group=factory.ENTRY_POINT_GROUP)
+
+  def entry_points():
+    return {factory.ENTRY_POINT_GROUP: [entry_point]}
+
+  monkeypatch.setattr(metadata, "entry_points", entry_points)
+  monkeypatch.setattr(factory, "_BACKENDS", dict(factory._BACKENDS))
+  monkeypatch.setitem(factory._ENTRY_POINTS_STATE, "loaded", False)
+  assert not factory.has_backend("nonexistent")
+  assert factory.has_backend("plugin")
+  assert isinstance(factory.get_backend("plugin"), NumPyBackend)
+
+
+def test_backend_capabilities():
+  #pylint: disable=import-outside-toplevel
+  from tensornetwork.backends import backend_factory as factory
+  assert not AbstractBackend.supports_jit
+  assert factory.get_backend("jax").supports_jit
+  assert not factory.get_backend("numpy").supports_jit
+  assert factory.get_backend("numpy").supports_batched_matmul
+  assert factory.get_backend("numpy").supports_inplace
+  assert not factory.get_backend("jax").supports_inplace
+  assert not factory.get_backend("symmetric").supports_batched_matmul
+
+
 def test_abstract_backend_name():
   backend = AbstractBackend()
   assert backend.name == "abstract backend"
@@ -0,0 +1,43 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Backend independent helpers of the tensor decompositions."""
+
+from typing import Optional, Text
+
+SVD_METHODS = ('full', 'randomized', 'lanczos')
+# number of additional vectors used by the truncated SVD methods
+OVERSAMPLING = 10
+# number of power iterations of the randomized range finder
+POWER_ITERATIONS = 2
+
+
+def num_svd_vectors(method: Text, max_singular_values: Optional[int]) -> int:
+  """The number of vectors used by a truncated SVD `method` to compute
+  `max_singular_values` singular values.
+
+  Raises:
+    ValueError: If `method` is unknown, or if a truncated method is used
+      without `max_singular_values`.
+  """
+  if method not in SVD_METHODS:
+    raise ValueError("method = {} not supported; use one of {}".format(
+        method, SVD_METHODS))
+  if method == 'full':
+    return 0
+  if max_singular_values is None:
+    raise ValueError(
+        "method = '{}' requires `max_singular_values`".format(method))
+  if method == 'randomized':
+    return max_singular_values + OVERSAMPLING
+  return 2 * max_singular_values + OVERSAMPLING
@@ -16,13 +16,18 @@
 Decorator functions that depend on the backend.
 """
 from typing import Union, Iterable, Optional, Text, Callable
+import collections
 import functools
+import weakref
 import tensornetwork.backends.abstract_backend as abstract_backend
 import tensornetwork.backends as backends
 import tensornetwork.backend_contextmanager as backend_contextmanager
 
 AbstractBackend = abstract_backend.AbstractBackend
 
+JitCacheInfo = collections.namedtuple('JitCacheInfo',
+                                      ['hits', 'misses', 'currsize'])
+
 def jit(fun: Callable,
         backend: Union[Text, AbstractBackend] = None,
         backend_argnum: Optional[int] = None,
@@ -47,6 +52,14 @@ def jit(fun: Callable,
     args: Arguments to `fun`.
     kwargs: Keyword arguments to `fun`.
 
+  The jitted function is built once per backend object and cached on the
+  returned wrapper, so repeated calls reuse the same compiled function.
+  Differently configured backend objects with the same name get separate
+  cache entries.
+  The wrapper exposes `cache_info()`, which returns a `JitCacheInfo`
+  with the number of cache hits, misses and the current cache size,
+  and `clear_cache()`, which empties the cache.
+
   Raises:
     ValueError: If backend_argnum is specified but backend is not None.
 
@@ -62,6 +75,20 @@ def jit(fun: Callable,
     argnum_mode = True
     static_argnums = tuple(list(static_argnums) + [backend_argnum,])
 
+  # keyed by the backend objects themselves, such that backends with the
+  # same name but a different configuration do not share compiled functions
+  cache = weakref.WeakKeyDictionary()
+  stats = {'hits': 0, 'misses': 0}
+
+  def get_jitted(backend_obj):
+    if backend_obj in cache:
+      stats['hits'] += 1
+    else:
+      stats['misses'] += 1
+      cache[backend_obj] = backend_obj.jit(fun, static_argnums=static_argnums,
+                                           device=device, backend=xla_backend)
+    return cache[backend_obj]
+
   if not argnum_mode:
     if backend is None:
       backend = backend_contextmanager.get_default_backend()
@@ -69,21 +96,37 @@ def jit(fun: Callable,
 
     @functools.wraps(fun)
     def wrapper(*args, **kwargs):
-      jitted = backend_obj.jit(fun, static_argnums=static_argnums,
-                               device=device, backend=xla_backend)
-      return jitted(*args, **kwargs)
+      return get_jitted(backend_obj)(*args, **kwargs)
   else:
+    # backends labelled by strings are only resolved once
+    resolved_backends = {}
+
     @functools.wraps(fun)
     def wrapper(*args, **kwargs):
       backend = args[backend_argnum]
-      try:
-        backend_obj = backends.backend_factory.get_backend(backend)
-      except ValueError:
-        errstr = (f"backend_argnum={backend_argnum} was specified"
-                  f"but the corresponding argument {args[backend_argnum]}"
-                  f"did not specify a backend.")
-        raise ValueError(errstr)
-      jitted = backend_obj.jit(fun, static_argnums=static_argnums,
-                               device=device, backend=xla_backend)
-      return jitted(*args, **kwargs)
+      if isinstance(backend, AbstractBackend):
+        backend_obj = backend
+      elif isinstance(backend, str) and backend in resolved_backends:
+        backend_obj = resolved_backends[backend]
+      else:
+        try:
+          backend_obj = backends.backend_factory.get_backend(backend)
+        except ValueError:
+          errstr = (f"backend_argnum={backend_argnum} was specified"
+                    f"but the corresponding argument {args[backend_argnum]}"
+                    f"did not specify a backend.")
+          raise ValueError(errstr)
+        resolved_backends[backend] = backend_obj
+      return get_jitted(backend_obj)(*args, **kwargs)
+
+  def cache_info() -> JitCacheInfo:
+    return JitCacheInfo(stats['hits'], stats['misses'], len(cache))
+
+  def clear_cache() -> None:
+    cache.clear()
+    stats['hits'] = 0
+    stats['misses'] = 0
+
+  wrapper.cache_info = cache_info
+  wrapper.clear_cache = clear_cache
   return wrapper
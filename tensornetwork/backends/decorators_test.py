@@ -119,3 +119,100 @@ def test_jit_backend_and_backend_obj_raises_error(backend):
       _ = the_backend
       return fun(x, A, y)
     _ = fun_jit(x, A, y, backend)
+
+
+def test_jit_cache(backend):
+  """
+  Tests that tn.jit builds the jitted function only once per backend.
+  """
+  x, y, A, fun = jittest_init(backend)
+  fun_jit = tensornetwork.jit(fun, backend=backend)
+  res1 = fun(x, A, y)
+  for _ in range(3):
+    np.testing.assert_allclose(res1, fun_jit(x, A, y))
+  info = fun_jit.cache_info()
+  assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+  fun_jit.clear_cache()
+  info = fun_jit.cache_info()
+  assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_jit_cache_backend_argnum(backend):
+  """
+  Tests that tn.jit caches one jitted function per backend when the backend
+  is supplied via backend_argnum.
+  """
+  x, y, A, fun = jittest_init(backend)
+
+  @functools.partial(tensornetwork.jit, backend_argnum=3)
+  def fun_jit(x, A, y, the_backend):
+    _ = the_backend
+    return fun(x, A, y)
+  backend_obj = backends.backend_factory.get_backend(backend)
+  res1 = fun(x, A, y)
+  np.testing.assert_allclose(res1, fun_jit(x, A, y, backend))
+  np.testing.assert_allclose(res1, fun_jit(x, A, y, backend))
+  np.testing.assert_allclose(res1, fun_jit(x, A, y, backend_obj))
+  info = fun_jit.cache_info()
+  assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+
+def test_jit_cache_backend_objects():
+  """
+  Tests that tn.jit does not share jitted functions between different
+  backend objects with the same name.
+  """
+  #pylint: disable=import-outside-toplevel
+  from tensornetwork.backends.jax.jax_backend import JaxBackend
+  backend1, backend2 = JaxBackend(), JaxBackend(dtype=np.float64)
+
+  @functools.partial(tensornetwork.jit, backend_argnum=1)
+  def fun_jit(x, the_backend):
+    return the_backend.multiply(x, x)
+  x = np.ones(4)
+  np.testing.assert_allclose(fun_jit(x, backend1), x)
+  np.testing.assert_allclose(fun_jit(x, backend2), x)
+  np.testing.assert_allclose(fun_jit(x, backend2), x)
+  info = fun_jit.cache_info()
+  assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+def test_jit_custom_backend_without_flag():
+  """
+  Tests that tn.jit uses the `jit` of a backend even if it does not set
+  `supports_jit`.
+  """
+  #pylint: disable=import-outside-toplevel
+  from tensornetwork.backends.numpy.numpy_backend import NumPyBackend
+  jitted = []
+
+  class CompilingBackend(NumPyBackend):
+
+    def jit(self, fun, *args, **kwargs):
+      jitted.append(fun)
+      return fun
+
+  backend = CompilingBackend()
+  assert not backend.supports_jit
+  fun_jit = tensornetwork.jit(lambda x: 2 * x, backend=backend)
+  np.testing.assert_allclose(fun_jit(np.ones(2)), 2 * np.ones(2))
+  np.testing.assert_allclose(fun_jit(np.ones(2)), 2 * np.ones(2))
+  assert len(jitted) == 1
+
+
+def test_jit_cache_traces_once():
+  """
+  Tests that repeated calls of a jitted closure do not retrace it.
+  """
+  backend_obj = backends.backend_factory.get_backend('jax')
+  num_traces = []
+
+  def fun(x):
+    num_traces.append(1)
+    return backend_obj.multiply(x, x)
+  fun_jit = tensornetwork.jit(fun, backend='jax')
+  x = backend_obj.randn((4,), seed=11)
+  for _ in range(3):
+    np.testing.assert_allclose(fun_jit(x), fun(x))
+  # one trace by `fun_jit`, one call of `fun` per iteration
+  assert len(num_traces) == 4
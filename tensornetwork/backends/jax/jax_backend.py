@@ -29,6 +29,8 @@ _CACHED_FUNCTIONS = {}
 
 class JaxBackend(abstract_backend.AbstractBackend):
   """See abstract_backend.AbstractBackend for documentation."""
+  supports_jit = True
+  supports_batched_matmul = True
 
   def __init__(self, dtype: Optional[np.dtype] = None) -> None:
     # pylint: disable=global-variable-undefined
@@ -74,7 +76,9 @@ class JaxBackend(abstract_backend.AbstractBackend):
       pivot_axis: int = -1,
       max_singular_values: Optional[int] = None,
       max_truncation_error: Optional[float] = None,
-      relative: Optional[bool] = False
+      relative: Optional[bool] = False,
+      method: Text = 'full',
+      seed: Optional[int] = None
   ) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
     return decompositions.svd(
         jnp,
@@ -82,7 +86,9 @@ class JaxBackend(abstract_backend.AbstractBackend):
         pivot_axis,
         max_singular_values,
         max_truncation_error,
-        relative=relative)
+        relative=relative,
+        method=method,
+        seed=seed)
 
   def qr(
       self,
@@ -604,6 +610,9 @@ class JaxBackend(abstract_backend.AbstractBackend):
   def divide(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
     return tensor1 / tensor2
 
+  def cast(self, tensor: Tensor, dtype: Type[np.number]) -> Tensor:
+    return tensor.astype(dtype)
+
   def index_update(self, tensor: Tensor, mask: Tensor,
                    assignee: Tensor) -> Tensor:
     return libjax.ops.index_update(tensor, mask, assignee)
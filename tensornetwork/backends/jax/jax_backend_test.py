@@ -847,3 +847,15 @@ def test_pivot(dtype):
   expected = tensor.reshape((cols, rows))
   actual = backend.pivot(tensor, pivot_axis=2)
   np.testing.assert_allclose(expected, actual)
+
+
+def test_axpy_scal_tensordot_into():
+  backend = jax_backend.JaxBackend()
+  a = backend.randn((2, 3), dtype=np.float64, seed=10)
+  b = backend.randn((3, 4), dtype=np.float64, seed=11)
+  y = backend.randn((2, 3), dtype=np.float64, seed=12)
+  np.testing.assert_allclose(backend.axpy(2.0, a, y), y + 2.0 * a)
+  np.testing.assert_allclose(backend.scal(3.0, a), 3.0 * a)
+  out = backend.zeros((2, 4), dtype=np.float64)
+  np.testing.assert_allclose(
+      backend.tensordot_into(a, b, 1, out), np.tensordot(a, b, 1))
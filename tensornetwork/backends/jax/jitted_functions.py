@@ -150,6 +150,141 @@ def _generate_jitted_eigsh_lanczos(jax):
   return jax_lanczos
 
 
+def _generate_jitted_dmrg_sweep(jax):
+  """
+  Helper function to generate the jitted single-site DMRG sweep kernel used
+  in `BaseDMRG.run_one_site_jitted`. The function `jax_dmrg_sweep` returned
+  by this higher-order function has the following call signature:
+  ```
+  (env, center), (tensors, envs, energies) = jax_dmrg_sweep(env: Tensor,
+                                                      center: Tensor,
+                                                      mpo_tensors: Tensor,
+                                                      other_envs: Tensor,
+                                                      neighbors: Tensor,
+                                                      ncv: int,
+                                                      delta: float,
+                                                      right: bool)
+  ```
+  The kernel optimizes `n` consecutive sites, where `n` is the size of the
+  leading dimension of `mpo_tensors`, `other_envs` and `neighbors`.
+  For a sweep from left to right (`right=True`), the `k`-th site is
+  optimized using the local Hamiltonian made up of the left environment
+  `env`, `mpo_tensors[k]` and the right environment `other_envs[k]`,
+  starting from the center tensor `center`. The optimized tensor is
+  split into a left-orthogonal tensor `tensors[k]` and a matrix which
+  is absorbed into the next tensor `neighbors[k]`, which becomes the new
+  `center`. The left environment of the next site, `envs[k]`, becomes the
+  new `env`. Sweeps from right to left (`right=False`) proceed
+  from the last to the first site, with the roles of left and right
+  exchanged.
+  If the shapes of all tensors are identical (uniform bond dimensions),
+  the sites are iterated over with `jax.lax.scan`. Otherwise, `n` has
+  to be 1.
+
+  `env`: The environment of the first optimized site, of shape (w, D, D).
+  `center`: The center tensor at the first optimized site.
+  `mpo_tensors`: The stacked mpo tensors of the optimized sites.
+  `other_envs`: The stacked (fixed) environments on the opposite side.
+  `neighbors`: The stacked mps tensors to the right (for `right=True`) or
+    to the left (for `right=False`) of the optimized sites.
+  `ncv`: Number of krylov iterations of the local Lanczos solver.
+  `delta`: Convergence parameter: if the norm of the current Lanczos vector
+    falls below `delta`, the Lanczos iteration is stopped.
+  `right`: The sweep direction.
+
+  Args:
+    jax: The `jax` module.
+  Returns:
+    Callable: A jitted function that does a partial DMRG sweep.
+  """
+  jnp = jax.numpy
+
+  def matvec(mps_tensor, L, mpo_tensor, R):
+    return jnp.einsum('wax,asc,wvys,vcz->xyz', L, mps_tensor, mpo_tensor, R)
+
+  def add_left_layer(L, mps_tensor, mpo_tensor):
+    return jnp.einsum('wab,asc,wvts,bte->vce', L, mps_tensor, mpo_tensor,
+                      jnp.conj(mps_tensor))
+
+  def add_right_layer(R, mps_tensor, mpo_tensor):
+    return jnp.einsum('vab,csa,wvts,etb->wce', R, mps_tensor, mpo_tensor,
+                      jnp.conj(mps_tensor))
+
+  def lanczos(L, mpo_tensor, R, init, ncv, delta):
+    """
+    Lanczos iteration with a fixed number `ncv` of steps. Steps after
+    the norm of a Krylov vector fell below `delta` are masked out.
+    """
+    shape = init.shape
+    real_dtype = jnp.real(init).dtype
+    v0 = jnp.ravel(init) / jnp.linalg.norm(init)
+
+    def body(carry, _):
+      vector, previous, previous_norm, active = carry
+      Av = jnp.ravel(matvec(jnp.reshape(vector, shape), L, mpo_tensor, R))
+      diag_element = jnp.real(jnp.vdot(vector, Av))
+      residual = Av - diag_element * vector - previous_norm * previous
+      norm = jnp.linalg.norm(residual)
+      next_active = jnp.logical_and(active, norm > delta)
+      next_vector = jnp.where(next_active,
+                              residual / jnp.where(norm > delta, norm, 1.0),
+                              jnp.zeros_like(residual))
+      return (next_vector, vector, norm, next_active), (vector, diag_element,
+                                                         norm, active)
+
+    init_carry = (v0, jnp.zeros_like(v0), jnp.zeros((), real_dtype),
+                  jnp.array(True))
+    _, (krylov_vecs, diags, norms, active) = jax.lax.scan(
+        body, init_carry, None, length=ncv)
+    # shift masked-out diagonal elements above the spectrum of the
+    # tridiagonal matrix of the active steps
+    bound = jnp.max(jnp.where(active, jnp.abs(diags) + 2 * norms, 0.0)) + 1.0
+    diags = jnp.where(active, diags, bound)
+    off_diags = jnp.where(active[1:], norms[:-1], 0.0)
+    A_tridiag = jnp.diag(diags) + jnp.diag(off_diags, 1) + jnp.diag(
+        off_diags, -1)
+    eigvals, U = jnp.linalg.eigh(A_tridiag)
+    state = jnp.dot(U[:, 0].astype(krylov_vecs.dtype), krylov_vecs)
+    return eigvals[0], jnp.reshape(state / jnp.linalg.norm(state), shape)
+
+  def step_right(carry, x, ncv, delta):
+    L, center = carry
+    mpo_tensor, R, neighbor = x
+    energy, state = lanczos(L, mpo_tensor, R, center, ncv, delta)
+    Dl, d, Dr = state.shape
+    Q, R_matrix = jnp.linalg.qr(jnp.reshape(state, (Dl * d, Dr)))
+    Q = jnp.reshape(Q, (Dl, d, Q.shape[1]))
+    new_center = jnp.tensordot(R_matrix, neighbor, ([1], [0]))
+    new_L = add_left_layer(L, Q, mpo_tensor)
+    return (new_L, new_center), (Q, new_L, energy)
+
+  def step_left(carry, x, ncv, delta):
+    R, center = carry
+    mpo_tensor, L, neighbor = x
+    energy, state = lanczos(L, mpo_tensor, R, center, ncv, delta)
+    Dl, d, Dr = state.shape
+    Q, R_matrix = jnp.linalg.qr(jnp.transpose(jnp.reshape(state,
+                                                          (Dl, d * Dr))))
+    Q = jnp.reshape(jnp.transpose(Q), (Q.shape[1], d, Dr))
+    new_center = jnp.tensordot(neighbor, jnp.transpose(R_matrix), ([2], [0]))
+    new_R = add_right_layer(R, Q, mpo_tensor)
+    return (new_R, new_center), (Q, new_R, energy)
+
+  @partial(jax.jit, static_argnums=(5, 7))
+  def jax_dmrg_sweep(env, center, mpo_tensors, other_envs, neighbors, ncv,
+                     delta, right):
+    step = partial(step_right if right else step_left, ncv=ncv, delta=delta)
+    if mpo_tensors.shape[0] == 1:
+      carry, outputs = step((env, center),
+                            (mpo_tensors[0], other_envs[0], neighbors[0]))
+      return carry, jax.tree_util.tree_map(lambda y: y[None], outputs)
+    return jax.lax.scan(step, (env, center),
+                        (mpo_tensors, other_envs, neighbors),
+                        reverse=not right)
+
+  return jax_dmrg_sweep
+
+
 def _generate_arnoldi_factorization(jax):
   """
   Helper function to create a jitted arnoldi factorization.
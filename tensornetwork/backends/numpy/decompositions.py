@@ -13,10 +13,87 @@
 # limitations under the License.
 """Tensor Decomposition Numpy Implementation."""
 
-from typing import Optional, Any, Tuple
+from typing import Optional, Any, Tuple, Text
 import numpy
+from tensornetwork.backends.decomposition_utils import (num_svd_vectors,
+                                                        POWER_ITERATIONS)
 Tensor = Any
 
+def _random_matrix(np, shape: Tuple[int, ...], dtype: Any,
+                   seed: Optional[int] = None) -> Tensor:
+  # use a private generator such that the global random state of the
+  # caller is left untouched
+  random_state = numpy.random.RandomState(seed)
+  matrix = random_state.randn(*shape)
+  if numpy.issubdtype(dtype, numpy.complexfloating):
+    matrix = matrix + 1j * random_state.randn(*shape)
+  return np.asarray(matrix.astype(dtype))
+
+
+def _randomized_svd(np, matrix: Tensor, num_vecs: int,
+                    seed: Optional[int] = None
+                   ) -> Tuple[Tensor, Tensor, Tensor]:
+  """Randomized SVD of `matrix` (Halko, Martinsson and Tropp,
+  arXiv:0909.4061), using a randomized range finder with `num_vecs`
+  vectors and `POWER_ITERATIONS` power iterations.
+  """
+  omega = _random_matrix(np, (matrix.shape[1], num_vecs), matrix.dtype,
+                         seed)
+  q, _ = np.linalg.qr(matrix @ omega)
+  for _ in range(POWER_ITERATIONS):
+    q, _ = np.linalg.qr(np.conj(matrix.T) @ q)
+    q, _ = np.linalg.qr(matrix @ q)
+  u, s, vh = np.linalg.svd(np.conj(q.T) @ matrix, full_matrices=False)
+  return q @ u, s, vh
+
+
+def _lanczos_svd(np, matrix: Tensor, num_vecs: int,
+                 seed: Optional[int] = None) -> Tuple[Tensor, Tensor, Tensor]:
+  """Krylov SVD of `matrix` from `num_vecs` steps of Golub-Kahan-Lanczos
+  bidiagonalization with full reorthogonalization. The largest singular
+  values of the bidiagonal projection converge first. Falls back to a full
+  SVD if `matrix` vanishes (numerically).
+  """
+  def orthogonalize(vector, basis):
+    basis = np.stack(basis, axis=1)
+    for _ in range(2):
+      vector = vector - basis @ (np.conj(basis.T) @ vector)
+    return vector
+
+  eps = numpy.finfo(matrix.dtype).eps * numpy.sqrt(max(matrix.shape))
+  scale = np.linalg.norm(matrix)
+  v = _random_matrix(np, (matrix.shape[1],), matrix.dtype, seed)
+  vs = [v / np.linalg.norm(v)]
+  us, alphas, betas = [], [], []
+  for step in range(num_vecs):
+    u = matrix @ vs[-1]
+    if step > 0:
+      u = orthogonalize(u - betas[-1] * us[-1], us)
+    alpha = np.linalg.norm(u)
+    if alpha <= eps * (alphas[0] if alphas else scale):
+      # `vs[-1]` is (numerically) in the kernel of `matrix`
+      vs.pop()
+      break
+    us.append(u / alpha)
+    alphas.append(alpha)
+    if step == num_vecs - 1:
+      break
+    v = orthogonalize(np.conj(matrix.T) @ us[-1] - alpha * vs[-1], vs)
+    beta = np.linalg.norm(v)
+    if beta <= eps * alphas[0]:
+      # found an invariant subspace
+      break
+    vs.append(v / beta)
+    betas.append(beta)
+  if not alphas:
+    return np.linalg.svd(matrix, full_matrices=False)
+  bidiagonal = np.diag(np.stack(alphas))
+  if betas:
+    bidiagonal = bidiagonal + np.diag(np.stack(betas[:len(alphas) - 1]), 1)
+  u, s, vh = np.linalg.svd(bidiagonal, full_matrices=False)
+  return (np.stack(us, axis=1) @ u.astype(matrix.dtype), s,
+          vh.astype(matrix.dtype) @ np.conj(np.stack(vs, axis=1).T))
+
 
 def svd(
     np,  # TODO: Typing
@@ -24,16 +101,25 @@ def svd(
     pivot_axis: int,
     max_singular_values: Optional[int] = None,
     max_truncation_error: Optional[float] = None,
-    relative: Optional[bool] = False) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    relative: Optional[bool] = False,
+    method: Text = 'full',
+    seed: Optional[int] = None) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
   """Computes the singular value decomposition (SVD) of a tensor.
 
   See tensornetwork.backends.tensorflow.decompositions for details.
   """
+  num_vecs = num_svd_vectors(method, max_singular_values)
   left_dims = tensor.shape[:pivot_axis]
   right_dims = tensor.shape[pivot_axis:]
 
   tensor = np.reshape(tensor, [numpy.prod(left_dims), numpy.prod(right_dims)])
-  u, s, vh = np.linalg.svd(tensor, full_matrices=False)
+  if 0 < num_vecs < min(tensor.shape):
+    if method == 'randomized':
+      u, s, vh = _randomized_svd(np, tensor, num_vecs, seed)
+    else:
+      u, s, vh = _lanczos_svd(np, tensor, num_vecs, seed)
+  else:
+    u, s, vh = np.linalg.svd(tensor, full_matrices=False)
 
   if max_singular_values is None:
     max_singular_values = np.size(s)
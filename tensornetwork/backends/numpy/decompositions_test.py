@@ -104,6 +104,68 @@ class DecompositionsTest(tf.test.TestCase):
     np.testing.assert_almost_equal(trunc_sv_absolute, [0.1])
     np.testing.assert_almost_equal(trunc_sv_relative, [0.2, 0.1])
 
+  def test_truncated_methods(self):
+    np.random.seed(10)
+    unitary1, _ = np.linalg.qr(np.random.randn(60, 50))
+    unitary2, _ = np.linalg.qr(np.random.randn(50, 50))
+    singular_values = 0.5**np.arange(50)
+    val = unitary1.dot(np.diag(singular_values).dot(unitary2.T))
+    for method in ['randomized', 'lanczos']:
+      u, s, vh, _ = decompositions.svd(
+          np, np.reshape(val, (6, 10, 50)), 2, max_singular_values=4,
+          method=method)
+      self.assertEqual(u.shape, (6, 10, 4))
+      self.assertEqual(vh.shape, (4, 50))
+      self.assertAllClose(s, singular_values[:4])
+      self.assertAllClose(
+          np.reshape(u, (60, 4)).dot(np.diag(s)).dot(vh),
+          unitary1[:, :4].dot(np.diag(s)).dot(unitary2[:, :4].T))
+
+  def test_truncated_methods_vanishing_matrix(self):
+    np.random.seed(10)
+    unitary1, _ = np.linalg.qr(np.random.randn(60, 50))
+    unitary2, _ = np.linalg.qr(np.random.randn(50, 50))
+    singular_values = 1E-20 * 0.5**np.arange(50)
+    val = unitary1.dot(np.diag(singular_values).dot(unitary2.T))
+    for method in ['randomized', 'lanczos']:
+      u, s, vh, _ = decompositions.svd(
+          np, val, 1, max_singular_values=4, method=method)
+      self.assertEqual(u.shape, (60, 4))
+      self.assertEqual(vh.shape, (4, 50))
+      np.testing.assert_allclose(s, singular_values[:4], rtol=1E-6)
+      u, s, vh, _ = decompositions.svd(
+          np, np.zeros((60, 50)), 1, max_singular_values=4, method=method)
+      self.assertEqual(u.shape, (60, 4))
+      self.assertEqual(vh.shape, (4, 50))
+      self.assertAllClose(s, np.zeros(4))
+
+  def test_truncated_methods_keep_global_random_state(self):
+    val = np.random.rand(30, 30)
+    for method in ['randomized', 'lanczos']:
+      np.random.seed(10)
+      expected = np.random.rand()
+      np.random.seed(10)
+      decompositions.svd(np, val, 1, max_singular_values=4, method=method)
+      self.assertEqual(np.random.rand(), expected)
+
+  def test_truncated_methods_seed(self):
+    val = np.random.rand(30, 30)
+    for method in ['randomized', 'lanczos']:
+      u1, s1, vh1, _ = decompositions.svd(
+          np, val, 1, max_singular_values=4, method=method, seed=10)
+      u2, s2, vh2, _ = decompositions.svd(
+          np, val, 1, max_singular_values=4, method=method, seed=10)
+      np.testing.assert_array_equal(u1, u2)
+      np.testing.assert_array_equal(s1, s2)
+      np.testing.assert_array_equal(vh1, vh2)
+
+  def test_truncated_methods_raises(self):
+    val = np.random.rand(10, 10)
+    with self.assertRaises(ValueError):
+      decompositions.svd(np, val, 1, method='randomized')
+    with self.assertRaises(ValueError):
+      decompositions.svd(np, val, 1, max_singular_values=2, method='qr')
+
 
 if __name__ == '__main__':
   tf.test.main()
@@ -12,21 +12,99 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #pyling: disable=line-too-long
+import concurrent.futures
+import os
 from typing import Optional, Any, Sequence, Tuple, Callable, List, Text, Type
 from tensornetwork.backends import abstract_backend
 from tensornetwork.backends.numpy import decompositions
 import numpy as np
-import scipy as sp
-import scipy.sparse.linalg
 Tensor = Any
 
 int_to_string = np.array(list(map(chr, list(range(65, 91)))))
+_EINSUM_METHODS = ('numpy', 'opt_einsum', 'threaded')
+# BLAS axpy routines, keyed by dtype character
+_BLAS_AXPY = {}
+
+
+def _threaded_einsum(expression: str, tensors: Sequence[Tensor],
+                     optimize: bool, num_threads: int) -> Tensor:
+  """Evaluate `expression` by splitting the largest output axis into
+  `num_threads` chunks, which are contracted concurrently with
+  `np.einsum` (which releases the GIL in its inner loops and BLAS calls).
+  Falls back to a single `np.einsum` call if there is nothing to split.
+  """
+  expression = expression.replace(' ', '')
+  if '...' in expression or num_threads < 2:
+    return np.einsum(expression, *tensors, optimize=optimize)
+  if '->' in expression:
+    inputs, output = expression.split('->')
+  else:
+    inputs = expression
+    labels = inputs.replace(',', '')
+    output = ''.join(sorted(l for l in set(labels) if labels.count(l) == 1))
+  terms = inputs.split(',')
+  dims = {}
+  for term, tensor in zip(terms, tensors):
+    dims.update(zip(term, np.shape(tensor)))
+  # labels repeated within a single term (diagonals) cannot be sliced
+  candidates = [
+      l for l in output if all(term.count(l) <= 1 for term in terms)
+  ]
+  if not candidates:
+    return np.einsum(expression, *tensors, optimize=optimize)
+  label = max(candidates, key=lambda l: dims[l])
+  num_chunks = min(num_threads, dims[label])
+  if num_chunks < 2:
+    return np.einsum(expression, *tensors, optimize=optimize)
+
+  bounds = np.linspace(0, dims[label], num_chunks + 1).astype(np.int64)
+  expression = '{}->{}'.format(inputs, output)
+
+  def contract_chunk(start, stop):
+    sliced = []
+    for term, tensor in zip(terms, tensors):
+      if label in term:
+        index = [slice(None)] * len(term)
+        index[term.index(label)] = slice(start, stop)
+        tensor = tensor[tuple(index)]
+      sliced.append(tensor)
+    return np.einsum(expression, *sliced, optimize=optimize)
+
+  with concurrent.futures.ThreadPoolExecutor(num_chunks) as executor:
+    chunks = list(executor.map(contract_chunk, bounds[:-1], bounds[1:]))
+  return np.concatenate(chunks, axis=output.index(label))
+
+
 class NumPyBackend(abstract_backend.AbstractBackend):
   """See base_backend.BaseBackend for documentation."""
+  supports_batched_matmul = True
+  supports_inplace = True
 
-  def __init__(self) -> None:
+  def __init__(self,
+               einsum_method: Text = 'numpy',
+               num_threads: Optional[int] = None) -> None:
+    """
+    Args:
+      einsum_method: How `einsum` expressions are evaluated. `'numpy'`
+        calls `np.einsum`. `'opt_einsum'` calls `opt_einsum.contract`,
+        which dispatches pairwise contractions to (multithreaded) BLAS.
+        `'threaded'` splits the largest output axis into `num_threads`
+        chunks and evaluates them with `np.einsum` in a thread pool.
+      num_threads: The number of threads used by the `'threaded'`
+        method. Defaults to `os.cpu_count()`.
+    Raises:
+      ValueError: If `einsum_method` is unknown or `num_threads < 1`.
+    """
     super(NumPyBackend, self).__init__()
     self.name = "numpy"
+    if einsum_method not in _EINSUM_METHODS:
+      raise ValueError("einsum_method = {} not supported; use one of {}".format(
+          einsum_method, _EINSUM_METHODS))
+    if num_threads is not None and num_threads < 1:
+      raise ValueError("num_threads = {} has to be positive".format(
+          num_threads))
+    self.einsum_method = einsum_method
+    self.num_threads = num_threads
 
   def tensordot(self, a: Tensor, b: Tensor,
                 axes: Sequence[Sequence[int]]) -> Tensor:
@@ -95,6 +173,13 @@ class NumPyBackend(abstract_backend.AbstractBackend):
              expression: str,
              *tensors: Tensor,
              optimize: bool = True) -> Tensor:
+    if self.einsum_method == 'opt_einsum':
+      import opt_einsum  # pylint: disable=import-outside-toplevel
+      return opt_einsum.contract(
+          expression, *tensors, optimize='auto' if optimize else False)
+    if self.einsum_method == 'threaded':
+      num_threads = self.num_threads or os.cpu_count() or 1
+      return _threaded_einsum(expression, tensors, optimize, num_threads)
     return np.einsum(expression, *tensors, optimize=optimize)
 
   def norm(self, tensor: Tensor) -> Tensor:
@@ -230,11 +315,12 @@ class NumPyBackend(abstract_backend.AbstractBackend):
 
     #initial_state is an np.ndarray of rank 1, so we can
     #savely deduce the shape from it
-    lop = sp.sparse.linalg.LinearOperator(
+    import scipy.sparse.linalg  # pylint: disable=import-outside-toplevel
+    lop = scipy.sparse.linalg.LinearOperator(
         dtype=initial_state.dtype,
         shape=(np.prod(initial_state.shape), np.prod(initial_state.shape)),
         matvec=matvec)
-    eta, U = sp.sparse.linalg.eigs(
+    eta, U = scipy.sparse.linalg.eigs(
         A=lop,
         k=numeig,
         which=which,
@@ -375,8 +461,9 @@ class NumPyBackend(abstract_backend.AbstractBackend):
       return Avec
 
     A_shape = (b.size, b.size)
-    A_op = sp.sparse.linalg.LinearOperator(matvec=matvec, shape=A_shape)
-    x, info = sp.sparse.linalg.gmres(A_op, b, x0=x0, tol=tol, atol=atol,
+    import scipy.sparse.linalg  # pylint: disable=import-outside-toplevel
+    A_op = scipy.sparse.linalg.LinearOperator(matvec=matvec, shape=A_shape)
+    x, info = scipy.sparse.linalg.gmres(A_op, b, x0=x0, tol=tol, atol=atol,
                                      restart=num_krylov_vectors,
                                      maxiter=maxiter, M=M)
     if info < 0:
@@ -451,60 +538,223 @@ class NumPyBackend(abstract_backend.AbstractBackend):
       raise TypeError("Expected a `np.ndarray`. Got {}".format(
           type(initial_state)))
 
+    import scipy.linalg  # pylint: disable=import-outside-toplevel
     vector_n = initial_state
     Z = self.norm(vector_n)
     vector_n /= Z
-    norms_vector_n = []
-    diag_elements = []
-    krylov_vecs = []
+    # Krylov vectors are stored as rows of a preallocated array, and the
+    # tridiagonal operator is kept as its diagonal (`alphas`) and
+    # off-diagonal (`betas`)
+    krylov_vecs = None
+    alphas = np.empty(num_krylov_vecs, dtype=np.float64)
+    betas = np.empty(num_krylov_vecs, dtype=np.float64)
     first = True
     eigvalsold = []
+    numvecs = 0
     for it in range(num_krylov_vecs):
       #normalize the current vector:
       norm_vector_n = self.norm(vector_n)
       if abs(norm_vector_n) < delta:
         break
-      norms_vector_n.append(norm_vector_n)
-      vector_n = vector_n / norms_vector_n[-1]
-      #store the Lanczos vector for later
-      if reorthogonalize:
-        for v in krylov_vecs:
-          vector_n -= np.dot(np.ravel(np.conj(v)), np.ravel(vector_n)) * v
-      krylov_vecs.append(vector_n)
+      betas[it] = np.real(norm_vector_n)
+      vector_n = self.scal(1.0 / norm_vector_n, vector_n)
+      if it > 0 and reorthogonalize:
+        vecs = krylov_vecs[:it]
+        vector_n -= np.tensordot(
+            np.dot(np.conj(vecs), np.ravel(vector_n)), vecs,
+            axes=1).reshape(vector_n.shape)
       A_vector_n = A(vector_n, *args)
-      diag_elements.append(
-          np.dot(np.ravel(np.conj(vector_n)), np.ravel(A_vector_n)))
+      if krylov_vecs is None:
+        krylov_vecs = np.empty(
+            (num_krylov_vecs, vector_n.size),
+            dtype=np.result_type(vector_n, A_vector_n))
+      #store the Lanczos vector for later
+      krylov_vecs[it, :] = np.ravel(vector_n)
+      numvecs = it + 1
+      alpha = np.dot(np.ravel(np.conj(vector_n)), np.ravel(A_vector_n))
+      alphas[it] = np.real(alpha)
 
-      if ((it > 0) and (it % ndiag) == 0) and (len(diag_elements) >= numeig):
+      if ((it > 0) and (it % ndiag) == 0) and (numvecs >= numeig):
         #diagonalize the effective Hamiltonian
-        A_tridiag = np.diag(diag_elements) + np.diag(
-            norms_vector_n[1:], 1) + np.diag(np.conj(norms_vector_n[1:]), -1)
-        eigvals, u = np.linalg.eigh(A_tridiag)
+        # pylint: disable=no-member
+        eigvals = scipy.linalg.eigh_tridiagonal(
+            alphas[:numvecs], betas[1:numvecs], eigvals_only=True,
+            select='i', select_range=(0, numeig - 1))
         if not first:
           if np.linalg.norm(eigvals[0:numeig] - eigvalsold[0:numeig]) < tol:
             break
         first = False
         eigvalsold = eigvals[0:numeig]
+      A_vector_n = self.axpy(-alpha, vector_n, A_vector_n)
       if it > 0:
-        A_vector_n -= (krylov_vecs[-1] * diag_elements[-1])
-        A_vector_n -= (krylov_vecs[-2] * norms_vector_n[-1])
-      else:
-        A_vector_n -= (krylov_vecs[-1] * diag_elements[-1])
+        A_vector_n = self.axpy(
+            -betas[it], np.reshape(krylov_vecs[it - 1], vector_n.shape),
+            A_vector_n)
       vector_n = A_vector_n
 
-    A_tridiag = np.diag(diag_elements) + np.diag(
-        norms_vector_n[1:], 1) + np.diag(np.conj(norms_vector_n[1:]), -1)
-    eigvals, u = np.linalg.eigh(A_tridiag)
+    # pylint: disable=no-member
+    eigvals, u = scipy.linalg.eigh_tridiagonal(alphas[:numvecs],
+                                               betas[1:numvecs])
+    eigvals = np.array(eigvals).astype(krylov_vecs.dtype)
     eigenvectors = []
-    eigvals = np.array(eigvals).astype(A_tridiag.dtype)
-
     for n2 in range(min(numeig, len(eigvals))):
-      state = self.zeros(initial_state.shape, initial_state.dtype)
-      for n1, vec in enumerate(krylov_vecs):
-        state += vec * u[n1, n2]
+      state = np.reshape(
+          np.dot(u[:, n2], krylov_vecs[:numvecs]), initial_state.shape)
       eigenvectors.append(state / np.linalg.norm(state))
     return eigvals[0:numeig], eigenvectors
 
+  def eigsh_thick_restart_lanczos(
+      self,
+      A: Callable,
+      args: Optional[List[Tensor]] = None,
+      initial_state: Optional[Tensor] = None,
+      shape: Optional[Tuple] = None,
+      dtype: Optional[Type[np.number]] = None,
+      num_krylov_vecs: int = 20,
+      numeig: int = 1,
+      block_size: int = 1,
+      tol: float = 1E-8,
+      delta: float = 1E-12,
+      maxiter: int = 20) -> Tuple[Tensor, List]:
+    """
+    Thick-restart (block) Lanczos method for finding the lowest
+    eigenvector-eigenvalue pairs of a hermitian linear operator `A`.
+
+    The Krylov basis is stored in a preallocated array of
+    `num_krylov_vecs + block_size` vectors, and is fully reorthogonalized.
+    Once it is full, the basis is compressed to the lowest Ritz vectors
+    and the last residual block (thick restart), such that memory stays
+    bounded independent of the number of iterations. For
+    `block_size > 1`, `A` is applied to blocks of `block_size` vectors,
+    which can speed up convergence for (nearly) degenerate eigenvalues.
+
+    Args:
+      A: A (sparse) implementation of a hermitian linear operator.
+         Call signature of `A` is `res = A(vector, *args)`, where `vector`
+         can be an arbitrary `Tensor`, and `res.shape` has to be `vector.shape`.
+      args: A list of arguments to `A`.
+      initial_state: An initial vector for the Lanczos algorithm. If `None`,
+        a random initial `Tensor` is created using the `backend.randn` method.
+        For `block_size > 1`, the starting block is completed with random
+        vectors.
+      shape: The shape of the input-dimension of `A`.
+      dtype: The dtype of the input `A`. If both no `initial_state` is provided,
+        a random initial state with shape `shape` and dtype `dtype` is created.
+      num_krylov_vecs: The maximal size of the Krylov basis.
+      numeig: The nummber of eigenvector-eigenvalue pairs to be computed.
+      block_size: The number of vectors `A` is applied to in each step.
+      tol: Convergence is reached once the residual norms of the lowest
+        `numeig` Ritz pairs are smaller than `tol`.
+      delta: If the residual block has an L2 norm smaller than `delta`, an
+        invariant subspace has been found and the iteration is stopped.
+      maxiter: The maximal number of restarts.
+    Returns:
+      (eigvals, eigvecs)
+       eigvals: A list of `numeig` lowest eigenvalues
+       eigvecs: A list of `numeig` lowest eigenvectors
+    """
+    if args is None:
+      args = []
+    if block_size < 1:
+      raise ValueError('`block_size` >= 1 required!')
+    if num_krylov_vecs < numeig + block_size:
+      raise ValueError('`num_krylov_vecs` >= `numeig` + `block_size` '
+                       'required!')
+    if initial_state is None:
+      if (shape is None) or (dtype is None):
+        raise ValueError("if no `initial_state` is passed, then `shape` and"
+                         "`dtype` have to be provided")
+      initial_state = self.randn(shape, dtype)
+
+    if not isinstance(initial_state, np.ndarray):
+      raise TypeError("Expected a `np.ndarray`. Got {}".format(
+          type(initial_state)))
+
+    shape = initial_state.shape
+    size = initial_state.size
+    p = block_size
+    m = num_krylov_vecs
+    if size <= m + p:
+      # the Krylov basis would span the full space
+      unit_vecs = np.eye(size, dtype=initial_state.dtype)
+      matrix = np.stack([
+          np.ravel(A(np.reshape(unit_vecs[n], shape), *args))
+          for n in range(size)
+      ],
+                        axis=1)
+      eigvals, u = np.linalg.eigh((matrix + np.conj(matrix.T)) / 2)
+      eigenvectors = [np.reshape(u[:, n], shape) for n in range(numeig)]
+      return eigvals[0:numeig].astype(matrix.dtype), eigenvectors
+
+    start = np.empty((p, size), dtype=initial_state.dtype)
+    start[0] = np.ravel(initial_state)
+    for n in range(1, p):
+      start[n] = np.ravel(self.randn(shape, initial_state.dtype))
+    q, _ = np.linalg.qr(start.T)
+    krylov_vecs = np.zeros((m + p, size), dtype=q.dtype)
+    krylov_vecs[:p] = q.T
+    # projection of `A` onto the Krylov basis
+    H = np.zeros((m + p, m + p), dtype=q.dtype)
+
+    j = 0
+    for it in range(maxiter):
+      while j + p <= m:
+        block = krylov_vecs[j:j + p]
+        Ablock = np.stack([
+            np.ravel(A(np.reshape(block[n], shape), *args)) for n in range(p)
+        ])
+        if Ablock.dtype != krylov_vecs.dtype:
+          dtype = np.result_type(krylov_vecs, Ablock)
+          krylov_vecs = krylov_vecs.astype(dtype)
+          H = H.astype(dtype)
+        basis = krylov_vecs[:j + p]
+        # two passes of classical Gram-Schmidt
+        for _ in range(2):
+          overlaps = np.dot(np.conj(basis), Ablock.T)
+          Ablock = Ablock - np.dot(overlaps.T, basis)
+          H[:j + p, j:j + p] += overlaps
+        q, r = np.linalg.qr(Ablock.T)
+        deficient = np.abs(np.diag(r)) < delta
+        if np.any(deficient):
+          # replace linearly dependent directions by random ones
+          q[:, deficient] = np.reshape(
+              self.randn((size * np.sum(deficient),), krylov_vecs.dtype),
+              (size, -1))
+          for _ in range(2):
+            q -= np.dot(basis.T, np.dot(np.conj(basis), q))
+          q, _ = np.linalg.qr(q)
+          r = np.dot(np.conj(q.T), Ablock.T)
+        krylov_vecs[j + p:j + 2 * p] = q.T
+        H[j + p:j + 2 * p, j:j + p] = r
+        j += p
+        if np.linalg.norm(r) < delta:
+          break
+
+      # Rayleigh-Ritz step
+      Hm = H[:j, :j]
+      eigvals, u = np.linalg.eigh((Hm + np.conj(Hm.T)) / 2)
+      coupling = np.dot(H[j:j + p, j - p:j], u[j - p:j])
+      residuals = np.linalg.norm(coupling, axis=0)
+      if (np.all(residuals[:numeig] < tol) or
+          np.linalg.norm(H[j:j + p, j - p:j]) < delta or it == maxiter - 1):
+        break
+
+      # thick restart: keep the lowest Ritz vectors and the residual block
+      keep = min(j - p, max(numeig, (m - p) // 2))
+      ritz_vecs = np.dot(u[:, :keep].T, krylov_vecs[:j])
+      krylov_vecs[keep:keep + p] = krylov_vecs[j:j + p]
+      krylov_vecs[:keep] = ritz_vecs
+      H[:] = 0.0
+      H[:keep, :keep] = np.diag(eigvals[:keep])
+      H[keep:keep + p, :keep] = coupling[:, :keep]
+      j = keep
+
+    eigenvectors = []
+    for n in range(numeig):
+      state = np.reshape(np.dot(u[:, n], krylov_vecs[:j]), shape)
+      eigenvectors.append(state / np.linalg.norm(state))
+    return eigvals[0:numeig].astype(krylov_vecs.dtype), eigenvectors
+
   def addition(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
     return tensor1 + tensor2
 
@@ -517,6 +767,55 @@ class NumPyBackend(abstract_backend.AbstractBackend):
   def divide(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
     return tensor1 / tensor2
 
+  def cast(self, tensor: Tensor, dtype: Type[np.number]) -> Tensor:
+    return tensor.astype(dtype, copy=False)
+
+  def axpy(self, alpha: Any, x: Tensor, y: Tensor) -> Tensor:
+    dtype = np.result_type(alpha, x, y)
+    if (dtype != y.dtype) or (x.shape != y.shape) or not y.flags.writeable:
+      return y + alpha * x
+    if (x.flags.c_contiguous and y.flags.c_contiguous and
+        dtype.char in 'fdFD'):
+      blas_axpy = _BLAS_AXPY.get(dtype.char)
+      if blas_axpy is None:
+        import scipy.linalg.blas  # pylint: disable=import-outside-toplevel
+        blas_axpy = scipy.linalg.blas.get_blas_funcs('axpy', dtype=dtype)
+        _BLAS_AXPY[dtype.char] = blas_axpy
+      blas_axpy(np.ravel(x), np.ravel(y), a=alpha)
+    else:
+      y += alpha * x
+    return y
+
+  def scal(self, alpha: Any, x: Tensor) -> Tensor:
+    if (np.result_type(alpha, x) != x.dtype) or not x.flags.writeable:
+      return alpha * x
+    x *= alpha
+    return x
+
+  def tensordot_into(self, a: Tensor, b: Tensor,
+                     axes: Sequence[Sequence[int]], out: Tensor) -> Tensor:
+    if isinstance(axes, int):
+      axes = (list(range(a.ndim - axes, a.ndim)), list(range(axes)))
+    axes_a = [n % a.ndim for n in axes[0]]
+    axes_b = [n % b.ndim for n in axes[1]]
+    free_a = [n for n in range(a.ndim) if n not in axes_a]
+    free_b = [n for n in range(b.ndim) if n not in axes_b]
+    shape = tuple([a.shape[n] for n in free_a] + [b.shape[n] for n in free_b])
+    if out.shape != shape:
+      raise ValueError("`out` has shape {}, but the result of tensordot "
+                       "has shape {}".format(out.shape, shape))
+    if (out.dtype != np.result_type(a, b)) or not out.flags.c_contiguous:
+      out[...] = np.tensordot(a, b, (axes_a, axes_b))
+      return out
+    rows = int(np.prod([a.shape[n] for n in free_a]))
+    cols = int(np.prod([b.shape[n] for n in free_b]))
+    inner = int(np.prod([a.shape[n] for n in axes_a]))
+    np.matmul(
+        np.reshape(np.transpose(a, free_a + axes_a), (rows, inner)),
+        np.reshape(np.transpose(b, axes_b + free_b), (inner, cols)),
+        out=np.reshape(out, (rows, cols)))
+    return out
+
   def index_update(self, tensor: Tensor, mask: Tensor,
                    assignee: Tensor) -> Tensor:
     t = np.copy(tensor)
@@ -566,8 +865,8 @@ class NumPyBackend(abstract_backend.AbstractBackend):
       raise ValueError("input to numpy backend method `expm` only supports"
                        " N*N matrix, {x}*{y} matrix is given".format(
                            x=matrix.shape[0], y=matrix.shape[1]))
-    # pylint: disable=no-member
-    return sp.linalg.expm(matrix)
+    import scipy.linalg  # pylint: disable=import-outside-toplevel
+    return scipy.linalg.expm(matrix)
 
   def jit(self, fun: Callable, *args: List, **kwargs: dict) -> Callable:
     return fun
@@ -589,7 +888,9 @@ class NumPyBackend(abstract_backend.AbstractBackend):
       pivot_axis: int = -1,
       max_singular_values: Optional[int] = None,
       max_truncation_error: Optional[float] = None,
-      relative: Optional[bool] = False
+      relative: Optional[bool] = False,
+      method: Text = 'full',
+      seed: Optional[int] = None
   ) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
     return decompositions.svd(
         np,
@@ -597,7 +898,9 @@ class NumPyBackend(abstract_backend.AbstractBackend):
         pivot_axis,
         max_singular_values,
         max_truncation_error,
-        relative=relative)
+        relative=relative,
+        method=method,
+        seed=seed)
 
   def qr(
       self,
@@ -119,6 +119,32 @@ def test_einsum():
   np.testing.assert_allclose(expected, actual)
 
 
+@pytest.mark.parametrize("einsum_method", ['numpy', 'opt_einsum', 'threaded'])
+@pytest.mark.parametrize("expression, shapes", [
+    ('ijk,kjl->il', [(7, 8, 9), (9, 8, 5)]),
+    ('ijk,kjl', [(7, 8, 9), (9, 8, 5)]),
+    ('ijk,kjl->', [(7, 8, 9), (9, 8, 5)]),
+    ('iij->ij', [(6, 6, 3)]),
+    ('ab,ac,ad->bcd', [(5, 4), (5, 6), (5, 3)]),
+])
+def test_einsum_methods(einsum_method, expression, shapes):
+  backend = numpy_backend.NumPyBackend(
+      einsum_method=einsum_method, num_threads=3)
+  tensors = [
+      backend.randn(shape, dtype=np.float64, seed=n)
+      for n, shape in enumerate(shapes)
+  ]
+  actual = backend.einsum(expression, *tensors)
+  np.testing.assert_allclose(actual, np.einsum(expression, *tensors))
+
+
+def test_einsum_methods_raises():
+  with pytest.raises(ValueError):
+    numpy_backend.NumPyBackend(einsum_method='cuda')
+  with pytest.raises(ValueError):
+    numpy_backend.NumPyBackend(einsum_method='threaded', num_threads=0)
+
+
 def test_convert_bad_test():
   backend = numpy_backend.NumPyBackend()
   with pytest.raises(TypeError):
@@ -401,6 +427,75 @@ def test_eigsh_lanczos_raises():
     backend.eigsh_lanczos(lambda x: x, initial_state=[1, 2, 3])
 
 
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+@pytest.mark.parametrize("block_size", [1, 2, 3])
+@pytest.mark.parametrize("D", [8, 100])
+def test_eigsh_thick_restart_lanczos(dtype, block_size, D):
+  backend = numpy_backend.NumPyBackend()
+  numeig = 3
+  tmp = backend.randn((D, D), dtype=dtype, seed=10)
+  H = tmp + backend.transpose(backend.conj(tmp), (1, 0))
+
+  def mv(x, mat):
+    return np.dot(mat, x)
+
+  eta1, U1 = backend.eigsh_thick_restart_lanczos(
+      mv, [H],
+      shape=(D,),
+      dtype=dtype,
+      numeig=numeig,
+      num_krylov_vecs=20,
+      block_size=block_size,
+      maxiter=100,
+      tol=1E-10)
+  eta2, U2 = np.linalg.eigh(H)
+  assert eta1.dtype == dtype
+  np.testing.assert_allclose(eta1, eta2[0:numeig])
+  for n in range(numeig):
+    np.testing.assert_allclose(np.abs(np.vdot(U2[:, n], U1[n])), 1.0)
+
+
+def test_eigsh_thick_restart_lanczos_degenerate():
+  backend = numpy_backend.NumPyBackend()
+  D = 30
+  tmp = backend.randn((D, D), dtype=np.float64, seed=10)
+  H = np.kron(tmp + tmp.T, np.eye(2))
+
+  def mv(x, mat):
+    return np.dot(mat, x)
+
+  eta1, _ = backend.eigsh_thick_restart_lanczos(
+      mv, [H],
+      shape=(2 * D,),
+      dtype=np.float64,
+      numeig=2,
+      num_krylov_vecs=12,
+      block_size=2,
+      maxiter=100,
+      tol=1E-10)
+  eta2 = np.linalg.eigvalsh(H)
+  np.testing.assert_allclose(eta1, eta2[0:2])
+
+
+def test_eigsh_thick_restart_lanczos_raises():
+  backend = numpy_backend.NumPyBackend()
+  with pytest.raises(ValueError, match='`block_size` >= 1 required!'):
+    backend.eigsh_thick_restart_lanczos(lambda x: x, block_size=0)
+  with pytest.raises(
+      ValueError,
+      match='`num_krylov_vecs` >= `numeig` \\+ `block_size` required!'):
+    backend.eigsh_thick_restart_lanczos(
+        lambda x: x, numeig=2, block_size=2, num_krylov_vecs=3)
+  with pytest.raises(
+      ValueError,
+      match="if no `initial_state` is passed, then `shape` and"
+      "`dtype` have to be provided"):
+    backend.eigsh_thick_restart_lanczos(lambda x: x, shape=(10,), dtype=None)
+  with pytest.raises(
+      TypeError, match="Expected a `np.ndarray`. Got <class 'list'>"):
+    backend.eigsh_thick_restart_lanczos(lambda x: x, initial_state=[1, 2, 3])
+
+
 def test_gmres_raises():
   backend = numpy_backend.NumPyBackend()
   dummy_mv = lambda x: x
@@ -545,6 +640,88 @@ def test_divide(a, b, expected):
   assert tensor1.dtype == tensor2.dtype == result.dtype
 
 
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.complex128])
+def test_axpy(dtype):
+  backend = numpy_backend.NumPyBackend()
+  x = backend.randn((4, 5), dtype=dtype, seed=10)
+  y = backend.randn((4, 5), dtype=dtype, seed=11)
+  expected = y + 2.0 * x
+  result = backend.axpy(2.0, x, y)
+  assert result is y
+  np.testing.assert_allclose(result, expected, rtol=1E-5)
+
+
+def test_axpy_non_contiguous():
+  backend = numpy_backend.NumPyBackend()
+  x = backend.randn((5, 4), dtype=np.float64, seed=10).T
+  y = backend.randn((4, 5), dtype=np.float64, seed=11)
+  expected = y + 2.0 * x
+  result = backend.axpy(2.0, x, y)
+  assert result is y
+  np.testing.assert_allclose(result, expected)
+
+
+def test_axpy_dtype_promotion():
+  backend = numpy_backend.NumPyBackend()
+  x = backend.randn((4, 5), dtype=np.float64, seed=10)
+  y = backend.randn((4, 5), dtype=np.float64, seed=11)
+  expected = y + 1.0j * x
+  result = backend.axpy(1.0j, x, y)
+  assert result is not y
+  assert result.dtype == np.complex128
+  np.testing.assert_allclose(result, expected)
+
+
+def test_scal():
+  backend = numpy_backend.NumPyBackend()
+  x = backend.randn((4, 5), dtype=np.float64, seed=10)
+  expected = 3.0 * x
+  result = backend.scal(3.0, x)
+  assert result is x
+  np.testing.assert_allclose(result, expected)
+  result = backend.scal(1.0j, x)
+  assert result is not x
+  np.testing.assert_allclose(result, 1.0j * expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_tensordot_into(dtype):
+  backend = numpy_backend.NumPyBackend()
+  a = backend.randn((2, 3, 4), dtype=dtype, seed=10)
+  b = backend.randn((4, 3, 5), dtype=dtype, seed=11)
+  out = np.empty((2, 5), dtype=dtype)
+  result = backend.tensordot_into(a, b, ([1, 2], [1, 0]), out)
+  assert result is out
+  np.testing.assert_allclose(result,
+                             np.tensordot(a, b, ([1, 2], [1, 0])))
+
+
+def test_tensordot_into_fallback():
+  backend = numpy_backend.NumPyBackend()
+  a = backend.randn((2, 3), dtype=np.float64, seed=10)
+  b = backend.randn((3, 4), dtype=np.float64, seed=11)
+  out = np.empty((4, 2), dtype=np.complex128).T
+  result = backend.tensordot_into(a, b, 1, out)
+  assert result is out
+  np.testing.assert_allclose(result, a @ b)
+
+
+def test_cast():
+  backend = numpy_backend.NumPyBackend()
+  a = backend.randn((2, 3), dtype=np.float64, seed=10)
+  result = backend.cast(a, np.float32)
+  assert result.dtype == np.float32
+  np.testing.assert_allclose(result, a, rtol=1E-6)
+
+
+def test_tensordot_into_raises():
+  backend = numpy_backend.NumPyBackend()
+  a = backend.randn((2, 3), dtype=np.float64, seed=10)
+  b = backend.randn((3, 4), dtype=np.float64, seed=11)
+  with pytest.raises(ValueError):
+    backend.tensordot_into(a, b, 1, np.empty((2, 3)))
+
+
 def find(which, vector):
   if which == 'LM':
     index = np.argmax(np.abs(vector))
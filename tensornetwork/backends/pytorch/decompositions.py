@@ -13,19 +13,102 @@
 # limitations under the License.
 """Tensor Decomposition Implementations."""
 
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, Text
 import numpy as np
+from tensornetwork.backends.decomposition_utils import (num_svd_vectors,
+                                                        POWER_ITERATIONS)
 
 Tensor = Any
 
 
+def _random_matrix(torch: Any, shape: Tuple[int, ...], dtype: Any,
+                   seed: Optional[int] = None) -> Tensor:
+  # use a private generator such that the global random state of the
+  # caller is left untouched
+  generator = torch.Generator()
+  if seed is None:
+    generator.seed()
+  else:
+    generator.manual_seed(seed)
+  return torch.randn(*shape, dtype=dtype, generator=generator)
+
+
+def _randomized_svd(torch: Any, matrix: Tensor, num_vecs: int,
+                    seed: Optional[int] = None
+                   ) -> Tuple[Tensor, Tensor, Tensor]:
+  """Randomized SVD of `matrix`, see
+  `tensornetwork.backends.numpy.decompositions._randomized_svd`. Returns
+  `u, s, v` with `matrix ~ u @ diag(s) @ v^T`.
+  """
+  omega = _random_matrix(torch, (matrix.shape[1], num_vecs), matrix.dtype,
+                         seed)
+  q, _ = torch.linalg.qr(matrix @ omega)
+  for _ in range(POWER_ITERATIONS):
+    q, _ = torch.linalg.qr(matrix.conj().transpose(0, 1) @ q)
+    q, _ = torch.linalg.qr(matrix @ q)
+  u, s, vh = torch.linalg.svd(
+      q.conj().transpose(0, 1) @ matrix, full_matrices=False)
+  return q @ u, s, vh.transpose(0, 1)
+
+
+def _lanczos_svd(torch: Any, matrix: Tensor, num_vecs: int,
+                 seed: Optional[int] = None) -> Tuple[Tensor, Tensor, Tensor]:
+  """Krylov SVD of `matrix`, see
+  `tensornetwork.backends.numpy.decompositions._lanczos_svd`. Returns
+  `u, s, v` with `matrix ~ u @ diag(s) @ v^T`. Falls back to a full SVD if
+  `matrix` vanishes (numerically).
+  """
+  def orthogonalize(vector, basis):
+    basis = torch.stack(basis, dim=1)
+    for _ in range(2):
+      vector = vector - basis @ (basis.conj().transpose(0, 1) @ vector)
+    return vector
+
+  eps = torch.finfo(matrix.dtype).eps * np.sqrt(max(matrix.shape))
+  scale = torch.norm(matrix)
+  v = _random_matrix(torch, (matrix.shape[1],), matrix.dtype, seed)
+  vs = [v / torch.norm(v)]
+  us, alphas, betas = [], [], []
+  for step in range(num_vecs):
+    u = matrix @ vs[-1]
+    if step > 0:
+      u = orthogonalize(u - betas[-1] * us[-1], us)
+    alpha = torch.norm(u)
+    if alpha <= eps * (alphas[0] if alphas else scale):
+      vs.pop()
+      break
+    us.append(u / alpha)
+    alphas.append(alpha)
+    if step == num_vecs - 1:
+      break
+    v = orthogonalize(matrix.conj().transpose(0, 1) @ us[-1] - alpha * vs[-1],
+                      vs)
+    beta = torch.norm(v)
+    if beta <= eps * alphas[0]:
+      break
+    vs.append(v / beta)
+    betas.append(beta)
+  if not alphas:
+    u, s, vh = torch.linalg.svd(matrix, full_matrices=False)
+    return u, s, vh.transpose(0, 1)
+  bidiagonal = torch.diag(torch.stack(alphas))
+  if betas:
+    bidiagonal = bidiagonal + torch.diag(
+        torch.stack(betas[:len(alphas) - 1]), 1)
+  u, s, vh = torch.linalg.svd(bidiagonal, full_matrices=False)
+  vh = vh.to(matrix.dtype) @ torch.stack(vs, dim=1).conj().transpose(0, 1)
+  return torch.stack(us, dim=1) @ u.to(matrix.dtype), s, vh.transpose(0, 1)
+
+
 def svd(
     torch: Any,
     tensor: Tensor,
     pivot_axis: int,
     max_singular_values: Optional[int] = None,
     max_truncation_error: Optional[float] = None,
-    relative: Optional[bool] = False) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    relative: Optional[bool] = False,
+    method: Text = 'full',
+    seed: Optional[int] = None) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
   """Computes the singular value decomposition (SVD) of a tensor.
 
   The SVD is performed by treating the tensor as a matrix, with an effective
@@ -68,6 +151,10 @@ def svd(
     max_truncation_error: The maximum allowed truncation error or `None` to not
       do any truncation.
     relative: Multiply `max_truncation_err` with the largest singular value.
+    method: The SVD algorithm, see `tensornetwork.backends.tensorflow.
+      decompositions.svd`.
+    seed: Seed for the random starting matrix of `method='randomized'` and
+      `method='lanczos'`. If `None`, a nondeterministic seed is used.
 
   Returns:
     u: Left tensor factor.
@@ -76,11 +163,18 @@ def svd(
     s_rest: Vector of discarded singular values (length zero if no
             truncation).
   """
+  num_vecs = num_svd_vectors(method, max_singular_values)
   left_dims = list(tensor.shape)[:pivot_axis]
   right_dims = list(tensor.shape)[pivot_axis:]
 
   tensor = torch.reshape(tensor, (np.prod(left_dims), np.prod(right_dims)))
-  u, s, v = torch.svd(tensor)
+  if 0 < num_vecs < min(tensor.shape):
+    if method == 'randomized':
+      u, s, v = _randomized_svd(torch, tensor, num_vecs, seed)
+    else:
+      u, s, v = _lanczos_svd(torch, tensor, num_vecs, seed)
+  else:
+    u, s, v = torch.svd(tensor)
 
   if max_singular_values is None:
     max_singular_values = s.nelement()
@@ -105,3 +105,52 @@ def test_max_truncation_error_relative():
       relative=True)
   np.testing.assert_almost_equal(trunc_sv_absolute, [0.1])
   np.testing.assert_almost_equal(trunc_sv_relative, [0.2, 0.1])
+
+
+def test_truncated_methods():
+  np.random.seed(10)
+  unitary1, _ = np.linalg.qr(np.random.randn(60, 50))
+  unitary2, _ = np.linalg.qr(np.random.randn(50, 50))
+  singular_values = 0.5**np.arange(50)
+  val = unitary1.dot(np.diag(singular_values).dot(unitary2.T))
+  for method in ['randomized', 'lanczos']:
+    u, s, vh, _ = decompositions.svd(
+        torch, torch.tensor(val), 1, max_singular_values=4, method=method)
+    assert u.shape == (60, 4)
+    assert vh.shape == (4, 50)
+    np.testing.assert_array_almost_equal(s, singular_values[:4])
+    np.testing.assert_array_almost_equal(
+        u.mm(torch.diag(s)).mm(vh),
+        unitary1[:, :4].dot(np.diag(s)).dot(unitary2[:, :4].T))
+
+
+def test_truncated_methods_vanishing_matrix():
+  np.random.seed(10)
+  unitary1, _ = np.linalg.qr(np.random.randn(60, 50))
+  unitary2, _ = np.linalg.qr(np.random.randn(50, 50))
+  singular_values = 1E-20 * 0.5**np.arange(50)
+  val = unitary1.dot(np.diag(singular_values).dot(unitary2.T))
+  for method in ['randomized', 'lanczos']:
+    u, s, vh, _ = decompositions.svd(
+        torch, torch.tensor(val), 1, max_singular_values=4, method=method)
+    assert u.shape == (60, 4)
+    assert vh.shape == (4, 50)
+    np.testing.assert_allclose(s, singular_values[:4], rtol=1E-6)
+    u, s, vh, _ = decompositions.svd(
+        torch, torch.zeros(60, 50, dtype=torch.float64), 1,
+        max_singular_values=4, method=method)
+    assert u.shape == (60, 4)
+    assert vh.shape == (4, 50)
+    np.testing.assert_array_almost_equal(s, np.zeros(4))
+
+
+def test_truncated_methods_seed():
+  val = torch.tensor(np.random.rand(30, 30))
+  for method in ['randomized', 'lanczos']:
+    u1, s1, vh1, _ = decompositions.svd(
+        torch, val, 1, max_singular_values=4, method=method, seed=10)
+    u2, s2, vh2, _ = decompositions.svd(
+        torch, val, 1, max_singular_values=4, method=method, seed=10)
+    np.testing.assert_array_equal(u1, u2)
+    np.testing.assert_array_equal(s1, s2)
+    np.testing.assert_array_equal(vh1, vh2)
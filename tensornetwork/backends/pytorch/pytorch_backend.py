@@ -26,6 +26,9 @@ Tensor = Any
 
 class PyTorchBackend(abstract_backend.AbstractBackend):
   """See base_backend.BaseBackend for documentation."""
+  supports_batched_matmul = True
+  supports_inplace = True
+
 
   def __init__(self) -> None:
     super(PyTorchBackend, self).__init__()
@@ -66,7 +69,9 @@ class PyTorchBackend(abstract_backend.AbstractBackend):
       pivot_axis: int = -1,
       max_singular_values: Optional[int] = None,
       max_truncation_error: Optional[float] = None,
-      relative: Optional[bool] = False
+      relative: Optional[bool] = False,
+      method: Text = 'full',
+      seed: Optional[int] = None
   ) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
     return decompositions.svd(
         torchlib,
@@ -74,7 +79,9 @@ class PyTorchBackend(abstract_backend.AbstractBackend):
         pivot_axis,
         max_singular_values,
         max_truncation_error,
-        relative=relative)
+        relative=relative,
+        method=method,
+        seed=seed)
 
   def qr(
       self,
@@ -307,6 +314,33 @@ class PyTorchBackend(abstract_backend.AbstractBackend):
   def divide(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
     return tensor1 / tensor2
 
+  def cast(self, tensor: Tensor, dtype: Type[np.number]) -> Tensor:
+    if not isinstance(dtype, torchlib.dtype):
+      dtype = torchlib.from_numpy(np.empty(0, dtype=dtype)).dtype
+    return tensor.to(dtype)
+
+  def _is_writeable(self, tensor: Tensor) -> bool:
+    # in-place updates would break autograd
+    return not (torchlib.is_grad_enabled() and tensor.requires_grad)
+
+  def axpy(self, alpha: Any, x: Tensor, y: Tensor) -> Tensor:
+    dtype = torchlib.promote_types(torchlib.result_type(x, alpha), y.dtype)
+    if (dtype != y.dtype) or (x.shape != y.shape) or not self._is_writeable(y):
+      return y + alpha * x
+    return y.add_(x, alpha=alpha)
+
+  def scal(self, alpha: Any, x: Tensor) -> Tensor:
+    if (torchlib.result_type(x, alpha) != x.dtype or
+        not self._is_writeable(x)):
+      return alpha * x
+    return x.mul_(alpha)
+
+  def tensordot_into(self, a: Tensor, b: Tensor,
+                     axes: Sequence[Sequence[int]], out: Tensor) -> Tensor:
+    if not self._is_writeable(out):
+      return torchlib.tensordot(a, b, dims=axes)
+    return torchlib.tensordot(a, b, dims=axes, out=out)
+
   def index_update(self, tensor: Tensor, mask: Tensor,
                    assignee: Tensor) -> Tensor:
     #make a copy
@@ -428,6 +428,35 @@ def test_divide(a, b, expected):
   assert tensor1.dtype == tensor2.dtype == result.dtype
 
 
+def test_axpy():
+  backend = pytorch_backend.PyTorchBackend()
+  x = backend.randn((4, 5), dtype=torch.float64, seed=10)
+  y = backend.randn((4, 5), dtype=torch.float64, seed=11)
+  expected = y + 2.0 * x
+  result = backend.axpy(2.0, x, y)
+  assert result is y
+  np.testing.assert_allclose(result, expected)
+
+
+def test_scal():
+  backend = pytorch_backend.PyTorchBackend()
+  x = backend.randn((4, 5), dtype=torch.float64, seed=10)
+  expected = 3.0 * x
+  result = backend.scal(3.0, x)
+  assert result is x
+  np.testing.assert_allclose(result, expected)
+
+
+def test_tensordot_into():
+  backend = pytorch_backend.PyTorchBackend()
+  a = backend.randn((2, 3, 4), dtype=torch.float64, seed=10)
+  b = backend.randn((4, 3, 5), dtype=torch.float64, seed=11)
+  out = torch.empty((2, 5), dtype=torch.float64)
+  result = backend.tensordot_into(a, b, ([1, 2], [1, 0]), out)
+  np.testing.assert_allclose(out, torch.tensordot(a, b, ([1, 2], [1, 0])))
+  np.testing.assert_allclose(result, out)
+
+
 def test_eigh():
   dtype = torch.float64
   backend = pytorch_backend.PyTorchBackend()
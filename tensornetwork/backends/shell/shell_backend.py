@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import functools
 import operator
+import weakref
 from tensornetwork.backends import abstract_backend
 #pylint: disable=line-too-long
-from typing import Optional, Sequence, Tuple, List, Any, Union, Type, Callable, Text
+from typing import Optional, Sequence, Tuple, List, Any, Union, Type, Callable, Text, Dict
 import numpy as np
 
 
@@ -30,23 +32,200 @@ class ShellTensor:
     self.shape = new_shape
     return self
 
+  def _broadcast(self, other: Any) -> "ShellTensor":
+    """Elementwise arithmetic with a shell tensor or a scalar."""
+    shape = np.broadcast(
+        np.broadcast_to(0.0, self.shape),
+        np.broadcast_to(0.0, getattr(other, 'shape', ()))).shape
+    return ShellTensor(shape, self.dtype)
+
+  __add__ = __radd__ = __sub__ = __rsub__ = _broadcast
+  __mul__ = __rmul__ = __truediv__ = __rtruediv__ = _broadcast
+
+  def __neg__(self) -> "ShellTensor":
+    return ShellTensor(self.shape, self.dtype)
+
+  def __abs__(self) -> "ShellTensor":
+    return ShellTensor(self.shape, self.dtype)
+
+  # Shell tensors carry no data. In Python control flow their values
+  # behave like `nan`, such that data-dependent loops (e.g. convergence
+  # checks) run for the maximal number of iterations.
+  def __float__(self) -> float:
+    return float('nan')
+
+  def __complex__(self) -> complex:
+    return complex('nan')
+
+  def _compare(self, other: Any) -> bool:
+    del other
+    return False
+
+  __lt__ = __le__ = __gt__ = __ge__ = _compare
+
 
 Tensor = Any
 
 
+CostRecord = collections.namedtuple('CostRecord', [
+    'operation', 'input_shapes', 'output_shapes', 'flops', 'bytes_moved',
+    'live_memory'
+])
+
+
+class CostTrace:
+  """A trace of the operations executed by a `ShellBackend`.
+
+  Every recorded operation is stored as a `CostRecord` in `records`, with
+  the shapes of its inputs and outputs, an estimate of its floating point
+  operations (a multiply-add counts as two FLOPs), the number of bytes
+  read and written, and the memory held by live tensors after the
+  operation. Live memory counts all shell tensors allocated while the
+  trace is active which have not been garbage collected yet; `peak_memory`
+  is its maximum. Tensors allocated before the trace became active are
+  not counted.
+
+  Use `ShellBackend.record_costs` to create a trace:
+
+  .. code-block:: python
+
+    backend = tn.backends.backend_factory.get_backend('shell')
+    with backend.record_costs(itemsize=16) as trace:
+      mps = tn.FiniteMPS.random([2] * 10, [64] * 9, dtype=np.complex128,
+                                backend=backend)
+      mps.measure_local_operator([np.eye(2)] * 10, range(10))
+    print(trace.flops, trace.peak_memory)
+
+  Args:
+    backend: The `ShellBackend` whose operations are recorded.
+    itemsize: The number of bytes per tensor element.
+  """
+
+  def __init__(self, backend: "ShellBackend", itemsize: int = 8) -> None:
+    self.backend = backend
+    self.itemsize = itemsize
+    self.records = []
+    self.live_memory = 0
+    self.peak_memory = 0
+    self._allocated = weakref.WeakSet()
+
+  def __enter__(self) -> "CostTrace":
+    self.backend._cost_traces.append(self)
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+    self.backend._cost_traces.remove(self)
+
+  @property
+  def flops(self) -> int:
+    """The total number of FLOPs of all recorded operations."""
+    return sum(record.flops for record in self.records)
+
+  @property
+  def bytes_moved(self) -> int:
+    """The total number of bytes read and written by all recorded
+    operations."""
+    return sum(record.bytes_moved for record in self.records)
+
+  def summary(self) -> Dict[Text, Dict[Text, int]]:
+    """The number of calls, FLOPs and bytes moved of each operation."""
+    summary = {}
+    for record in self.records:
+      entry = summary.setdefault(record.operation, {
+          'calls': 0,
+          'flops': 0,
+          'bytes_moved': 0
+      })
+      entry['calls'] += 1
+      entry['flops'] += record.flops
+      entry['bytes_moved'] += record.bytes_moved
+    return summary
+
+  def _nbytes(self, shape: Sequence[int]) -> int:
+    return int(np.prod(shape, dtype=np.int64)) * self.itemsize
+
+  def _release(self, nbytes: int) -> None:
+    self.live_memory -= nbytes
+
+  def record(self, operation: Text, input_shapes: Sequence[Tuple[int, ...]],
+             outputs: Sequence[ShellTensor], flops: int) -> None:
+    """Record an operation. Outputs which are not tracked yet are added
+    to the live memory; tensors modified in place (e.g. by `transpose`)
+    are only counted once."""
+    for tensor in outputs:
+      if tensor not in self._allocated:
+        self._allocated.add(tensor)
+        nbytes = self._nbytes(tensor.shape)
+        self.live_memory += nbytes
+        weakref.finalize(tensor, self._release, nbytes)
+    self.peak_memory = max(self.peak_memory, self.live_memory)
+    output_shapes = [tuple(tensor.shape) for tensor in outputs]
+    self.records.append(
+        CostRecord(
+            operation=operation,
+            input_shapes=[tuple(shape) for shape in input_shapes],
+            output_shapes=output_shapes,
+            flops=int(flops),
+            bytes_moved=sum(
+                self._nbytes(shape)
+                for shape in list(input_shapes) + output_shapes),
+            live_memory=self.live_memory))
+
+
+def _svd_flops(m: int, n: int) -> int:
+  """The FLOPs of a thin SVD of an `m x n` matrix (Golub-Reinsch)."""
+  m, n = int(max(m, n)), int(min(m, n))
+  return int(14 * m * n**2 + 8 * n**3)
+
+
+def _qr_flops(m: int, n: int) -> int:
+  """The FLOPs of a thin Householder QR decomposition of an `m x n`
+  matrix, including the explicit computation of `Q`."""
+  m, n = int(max(m, n)), int(min(m, n))
+  return int(4 * m * n**2 - 4 * n**3 // 3)
+
+
 class ShellBackend(abstract_backend.AbstractBackend):
   """See base_backend.BaseBackend for documentation."""
+  supports_batched_matmul = True
 
   def __init__(self) -> None:
     super(ShellBackend, self).__init__()
     self.name = "shell"
+    self._cost_traces = []
+
+  def record_costs(self, itemsize: int = 8) -> CostTrace:
+    """Return a `CostTrace` which records all operations of this backend
+    while it is used as a context manager. See `CostTrace`.
+
+    Args:
+      itemsize: The number of bytes per tensor element.
+    Returns:
+      CostTrace: The trace.
+    """
+    return CostTrace(self, itemsize)
+
+  def _record(self,
+              operation: Text,
+              input_shapes: Sequence[Tuple[int, ...]],
+              outputs: Union[Tensor, Sequence[Tensor]],
+              flops: int = 0) -> Union[Tensor, Sequence[Tensor]]:
+    """Record `operation` in all active cost traces and return
+    `outputs`."""
+    tensors = outputs if isinstance(outputs, (tuple, list)) else [outputs]
+    for trace in self._cost_traces:
+      trace.record(operation, input_shapes, tensors, flops)
+    return outputs
 
   def tensordot(self, a: Tensor, b: Tensor,
                 axes: Sequence[Sequence[int]]) -> Tensor:
     # Does not work when axis < 0
     gen_a = (x for i, x in enumerate(a.shape) if i not in axes[0])
     gen_b = (x for i, x in enumerate(b.shape) if i not in axes[1])
-    return ShellTensor(tuple(self._concat_generators(gen_a, gen_b)))
+    result = ShellTensor(tuple(self._concat_generators(gen_a, gen_b)))
+    contracted = self.shape_product([a.shape[i] for i in axes[0]] + [1])
+    flops = 2 * self.shape_product(result.shape + (1,)) * contracted
+    return self._record('tensordot', [a.shape, b.shape], result, flops)
 
   def _concat_generators(self, *gen):
     """Concatenates Python generators."""
@@ -58,9 +237,10 @@ class ShellBackend(abstract_backend.AbstractBackend):
     return tensor
 
   def transpose(self, tensor: Tensor, perm: Sequence[int]) -> Tensor:
+    input_shape = tensor.shape
     shape = tuple(tensor.shape[i] for i in perm)
     tensor = tensor.reshape(tuple(shape))
-    return tensor
+    return self._record('transpose', [input_shape], tensor)
 
   def svd(
       self,
@@ -68,8 +248,11 @@ class ShellBackend(abstract_backend.AbstractBackend):
       pivot_axis: int = -1,
       max_singular_values: Optional[int] = None,
       max_truncation_error: Optional[float] = None,
-      relative: Optional[bool] = False
+      relative: Optional[bool] = False,
+      method: Text = 'full',
+      seed: Optional[int] = None
   ) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    del method, seed
     if max_truncation_error is not None:
       raise NotImplementedError("SVD with truncation shape cannot be "
                                 "calculated without explicit tensor values.")
@@ -87,7 +270,10 @@ class ShellBackend(abstract_backend.AbstractBackend):
     vh = ShellTensor((dim_s,) + right_dims)
     s = ShellTensor((dim_s,))
     s_rest = ShellTensor((dim_s0 - dim_s,))
-    return u, s, vh, s_rest
+    flops = _svd_flops(
+        functools.reduce(operator.mul, left_dims),
+        functools.reduce(operator.mul, right_dims))
+    return self._record('svd', [tensor.shape], (u, s, vh, s_rest), flops)
 
   def qr(self, tensor: Tensor, pivot_axis: int = -1,
          non_negative_diagonal: bool = False) -> Tuple[Tensor, Tensor]:
@@ -96,7 +282,8 @@ class ShellBackend(abstract_backend.AbstractBackend):
     center_dim = min(np.prod(left_dims), np.prod(right_dims))
     q = ShellTensor(left_dims + (center_dim,))
     r = ShellTensor((center_dim,) + right_dims)
-    return q, r
+    flops = _qr_flops(np.prod(left_dims), np.prod(right_dims))
+    return self._record('qr', [tensor.shape], (q, r), flops)
 
   def rq(self, tensor: Tensor, pivot_axis: int = -1,
          non_negative_diagonal: bool = False) -> Tuple[Tensor, Tensor]:
@@ -105,7 +292,8 @@ class ShellBackend(abstract_backend.AbstractBackend):
     center_dim = min(np.prod(left_dims), np.prod(right_dims))
     q = ShellTensor(left_dims + (center_dim,))
     r = ShellTensor((center_dim,) + right_dims)
-    return q, r
+    flops = _qr_flops(np.prod(left_dims), np.prod(right_dims))
+    return self._record('rq', [tensor.shape], (q, r), flops)
 
   def shape_concat(self, values: Sequence[Tensor], axis: int) -> Tensor:
     shape = values[0].shape
@@ -143,10 +331,14 @@ class ShellBackend(abstract_backend.AbstractBackend):
 
   def convert_to_tensor(self, tensor: Any) -> Tensor:
     shell_tensor = ShellTensor(tuple(tensor.shape))
-    return shell_tensor
+    if isinstance(tensor, ShellTensor):
+      return shell_tensor
+    return self._record('convert_to_tensor', [], shell_tensor)
 
   def outer_product(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
-    return ShellTensor(tensor1.shape + tensor2.shape)
+    result = ShellTensor(tensor1.shape + tensor2.shape)
+    return self._record('outer_product', [tensor1.shape, tensor2.shape],
+                        result, self.shape_product(result.shape + (1,)))
 
   #pylint: disable=unused-argument
   def einsum(self,
@@ -156,7 +348,22 @@ class ShellBackend(abstract_backend.AbstractBackend):
     expr_list = expression.split(",")
     expr_list[-1], res = expr_list[-1].split("->")
     shape = tuple(self._find_char(expr_list, char, tensors) for char in res)
-    return ShellTensor(shape)
+    return self._record('einsum', [t.shape for t in tensors], ShellTensor(shape),
+                        self._einsum_flops(expression, tensors, optimize))
+
+  def _einsum_flops(self, expression: str, tensors: Sequence[Tensor],
+                    optimize: bool) -> int:
+    """The FLOPs of `einsum`, estimated with `opt_einsum` along the
+    contraction path used for `optimize`."""
+    if not self._cost_traces:
+      return 0
+    # pylint: disable=import-outside-toplevel
+    import opt_einsum
+    _, info = opt_einsum.contract_path(
+        expression,
+        *[np.broadcast_to(0.0, t.shape) for t in tensors],
+        optimize='auto' if optimize else False)
+    return int(info.opt_cost)
 
   def _find_char(self, expr_list: List[str], char: str,
                  tensors: Sequence[Tensor]) -> int:
@@ -179,7 +386,8 @@ class ShellBackend(abstract_backend.AbstractBackend):
                      "in input.")
 
   def norm(self, tensor: Tensor) -> Tensor:
-    return ShellTensor(())
+    return self._record('norm', [tensor.shape], ShellTensor(()),
+                        2 * self.shape_product(tensor.shape + (1,)))
 
   def eye(self,
           N: int,
@@ -187,38 +395,40 @@ class ShellBackend(abstract_backend.AbstractBackend):
           M: Optional[int] = None) -> Tensor:
     if not M:
       M = N
-    return ShellTensor((N, M))
+    return self._record('eye', [], ShellTensor((N, M)))
 
   def ones(self,
            shape: Tuple[int, ...],
            dtype: Optional[Type[np.number]] = None) -> Tensor:
-    return ShellTensor(shape)
+    return self._record('ones', [], ShellTensor(shape))
 
   def zeros(self,
             shape: Tuple[int, ...],
             dtype: Optional[Type[np.number]] = None) -> Tensor:
 
-    return ShellTensor(shape)
+    return self._record('zeros', [], ShellTensor(shape))
 
   def randn(self,
             shape: Tuple[int, ...],
             dtype: Optional[Type[np.number]] = None,
             seed: Optional[int] = None) -> Tensor:
-    return ShellTensor(shape)
+    return self._record('randn', [], ShellTensor(shape))
 
   def random_uniform(self,
                      shape: Tuple[int, ...],
                      boundaries: Optional[Tuple[float, float]] = (0.0, 1.0),
                      dtype: Optional[Type[np.number]] = None,
                      seed: Optional[int] = None) -> Tensor:
-    return ShellTensor(shape)
+    return self._record('random_uniform', [], ShellTensor(shape))
 
   def conj(self, tensor: Tensor) -> Tensor:
     return tensor
 
   def eigh(self, matrix: Tensor) -> Tuple[Tensor, Tensor]:
     shape = matrix.shape
-    return ShellTensor((shape[0],)), ShellTensor(shape)
+    return self._record('eigh', [shape],
+                        (ShellTensor((shape[0],)), ShellTensor(shape)),
+                        9 * shape[0]**3)
 
   def eigs(self,
            A: Callable,
@@ -246,10 +456,24 @@ class ShellBackend(abstract_backend.AbstractBackend):
     if not isinstance(initial_state, ShellTensor):
       raise TypeError("Expected a `ShellTensor`. Got {}".format(
           type(initial_state)))
-
+    self._record_krylov_costs('eigs', A, args, initial_state, num_krylov_vecs)
     return [ShellTensor(tuple()) for _ in range(numeig)
            ], [ShellTensor(initial_state.shape) for _ in range(numeig)]
 
+  def _record_krylov_costs(self, operation: Text, A: Callable,
+                           args: List[Tensor], initial_state: Tensor,
+                           num_krylov_vecs: int) -> None:
+    """Record the costs of a Krylov method with `num_krylov_vecs`
+    iterations: one application of `A` per iteration (recorded by the
+    operations of `A`), and the orthogonalization of the Krylov vectors."""
+    if not self._cost_traces:
+      return
+    for _ in range(num_krylov_vecs):
+      A(initial_state, *args)
+    size = self.shape_product(tuple(initial_state.shape) + (1,))
+    self._record(operation, [initial_state.shape], [],
+                 2 * size * num_krylov_vecs * (num_krylov_vecs + 1))
+
   def eigsh_lanczos(self,
                     A: Callable,
                     args: Optional[List[Tensor]] = None,
@@ -280,7 +504,8 @@ class ShellBackend(abstract_backend.AbstractBackend):
     if not isinstance(initial_state, ShellTensor):
       raise TypeError("Expected a `ShellTensor`. Got {}".format(
           type(initial_state)))
-
+    self._record_krylov_costs('eigsh_lanczos', A, args, initial_state,
+                              num_krylov_vecs)
     return [ShellTensor(tuple()) for _ in range(numeig)
            ], [ShellTensor(initial_state.shape) for _ in range(numeig)]
 
@@ -294,11 +519,24 @@ class ShellBackend(abstract_backend.AbstractBackend):
   def multiply(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
     a = np.ones(tensor1.shape)
     b = np.ones(tensor2.shape)
-    return ShellTensor((a * b).shape)
+    shape = (a * b).shape
+    return self._record('multiply', [tensor1.shape, tensor2.shape],
+                        ShellTensor(shape), self.shape_product(shape + (1,)))
 
   def divide(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
     raise NotImplementedError("Shell tensor has not implemented add( / )")
 
+  def axpy(self, alpha: Any, x: Tensor, y: Tensor) -> Tensor:
+    return self._record('axpy', [x.shape, y.shape], ShellTensor(y.shape),
+                        2 * self.shape_product(x.shape + (1,)))
+
+  def scal(self, alpha: Any, x: Tensor) -> Tensor:
+    return self._record('scal', [x.shape], ShellTensor(x.shape),
+                        self.shape_product(x.shape + (1,)))
+
+  def cast(self, tensor: Tensor, dtype: Type[np.number]) -> Tensor:
+    return self._record('cast', [tensor.shape], ShellTensor(tensor.shape))
+
   def index_update(self, tensor: Tensor, mask: Tensor,
                    assignee: Tensor) -> Tensor:
     return ShellTensor(tensor.shape)
@@ -308,7 +546,8 @@ class ShellBackend(abstract_backend.AbstractBackend):
       raise ValueError(
           "input to shell backend method `inv` has shape {}. Only matrices are supported."
           .format(matrix.shape))
-    return ShellTensor(matrix.shape)
+    return self._record('inv', [matrix.shape], ShellTensor(matrix.shape),
+                        2 * matrix.shape[0]**3)
 
   def broadcast_right_multiplication(self, tensor1: Tensor,
                                      tensor2: Tensor) -> Tensor:
@@ -348,7 +587,8 @@ class ShellBackend(abstract_backend.AbstractBackend):
     else:
       newshape = np.array(tensor.shape)
       newshape[np.array(axis)] = 1
-    return ShellTensor(newshape)
+    return self._record('sum', [tensor.shape], ShellTensor(newshape),
+                        self.shape_product(tuple(tensor.shape) + (1,)))
 
   def matmul(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
     shape1 = np.array(tensor1.shape)[:-2]
@@ -356,4 +596,6 @@ class ShellBackend(abstract_backend.AbstractBackend):
     if not np.array_equal(shape1, shape2):
       raise ValueError("shape mismatch for matmul")
     new_shape = np.append(shape1, [tensor1.shape[-2], tensor2.shape[-1]])
-    return ShellTensor(new_shape)
+    return self._record(
+        'matmul', [tensor1.shape, tensor2.shape], ShellTensor(new_shape),
+        2 * self.shape_product(tuple(new_shape)) * tensor1.shape[-1])
@@ -462,3 +462,109 @@ def test_pivot():
   rows = 16
   actual = backend.pivot(tensor, pivot_axis=2)
   np.testing.assert_allclose(actual.shape, (cols, rows))
+
+
+def test_record_costs():
+  backend = shell_backend.ShellBackend()
+  a = backend.randn((10, 20))
+  with backend.record_costs(itemsize=16) as trace:
+    b = backend.randn((20, 30))
+    c = backend.tensordot(a, b, [[1], [0]])
+    c = backend.transpose(c, [1, 0])
+    u, s, vh, _ = backend.svd(c, 1)
+    q, r = backend.qr(c, 1)
+  assert [record.operation for record in trace.records
+         ] == ['randn', 'tensordot', 'transpose', 'svd', 'qr']
+  assert trace.records[1].input_shapes == [(10, 20), (20, 30)]
+  assert trace.records[1].output_shapes == [(10, 30)]
+  assert trace.records[1].flops == 2 * 10 * 20 * 30
+  assert trace.records[1].bytes_moved == 16 * (200 + 600 + 300)
+  assert trace.records[2].input_shapes == [(10, 30)]
+  assert trace.records[2].output_shapes == [(30, 10)]
+  assert trace.records[2].flops == 0
+  assert trace.records[3].flops == 14 * 30 * 10**2 + 8 * 10**3
+  assert trace.records[4].flops == 4 * 30 * 10**2 - 4 * 10**3 // 3
+  assert trace.flops == sum(record.flops for record in trace.records)
+  summary = trace.summary()
+  assert summary['tensordot'] == {
+      'calls': 1,
+      'flops': 12000,
+      'bytes_moved': 17600
+  }
+  # `a` was allocated before the trace; `c` was transposed in place
+  live = 16 * (600 + 300 + 2 * 300 + 10 + 2 * 100)
+  assert trace.live_memory == live
+  del b, u, s, vh, q, r
+  assert trace.live_memory == 16 * 300
+  assert trace.peak_memory == live
+  # operations after the trace was closed are not recorded
+  backend.tensordot(a, c, [[1], [1]])
+  assert len(trace.records) == 5
+
+
+def test_record_costs_einsum():
+  backend = shell_backend.ShellBackend()
+  a = backend.randn((10, 20))
+  b = backend.randn((20, 30))
+  with backend.record_costs() as trace:
+    backend.einsum('ij,jk->ik', a, b)
+  assert trace.records[0].output_shapes == [(10, 30)]
+  assert trace.records[0].flops == 2 * 10 * 20 * 30
+
+
+def test_record_costs_eigsh_lanczos():
+  backend = shell_backend.ShellBackend()
+  matrix = backend.randn((10, 10))
+  init = backend.randn((10,))
+
+  def matvec(vector, matrix):
+    return backend.tensordot(matrix, vector, [[1], [0]])
+
+  with backend.record_costs() as trace:
+    backend.eigsh_lanczos(matvec, [matrix], init, num_krylov_vecs=5)
+  assert [record.operation for record in trace.records
+         ] == ['tensordot'] * 5 + ['eigsh_lanczos']
+
+
+def test_record_costs_dmrg_and_measurements():
+  #pylint: disable=import-outside-toplevel
+  from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
+  from tensornetwork.matrixproductstates.mpo import FiniteXXZ
+  from tensornetwork.matrixproductstates.dmrg import FiniteDMRG
+  from tensornetwork.backends import backend_factory
+  # the mps classes partially resolve their backend by name
+  backend = backend_factory.get_backend('shell')
+  N, D = 6, 8
+  with backend.record_costs() as trace:
+    mpo = FiniteXXZ(
+        Jz=np.ones(N - 1),
+        Jxy=np.ones(N - 1),
+        Bz=np.zeros(N),
+        dtype=np.float64,
+        backend=backend)
+    mps = FiniteMPS.random([2] * N, [D] * (N - 1),
+                           dtype=np.float64,
+                           backend=backend)
+    FiniteDMRG(mps, mpo).run_one_site(num_sweeps=1, num_krylov_vecs=4)
+  summary = trace.summary()
+  # one local optimization per site and sweep direction
+  assert summary['eigsh_lanczos']['calls'] == 2 * N - 2
+  assert summary['tensordot']['flops'] > 0
+  assert trace.peak_memory >= trace.live_memory > 0
+
+  with backend.record_costs() as trace:
+    result = mps.measure_local_operator([np.eye(2)] * N, list(range(N)))
+  assert len(result) == N
+  assert trace.summary()['tensordot']['calls'] > 0
+  assert trace.flops > 0
+
+
+def test_shell_tensor_arithmetic():
+  a = shell_backend.ShellTensor((2, 3))
+  b = shell_backend.ShellTensor((3,))
+  assert (a + b).shape == (2, 3)
+  assert (2.0 * a / b - b).shape == (2, 3)
+  assert abs(-a).shape == (2, 3)
+  scalar = shell_backend.ShellTensor(())
+  assert np.isnan(float(scalar))
+  assert (scalar < 1.0) is False
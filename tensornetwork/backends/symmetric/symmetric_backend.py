@@ -49,8 +49,14 @@ class SymmetricBackend(abstract_backend.AbstractBackend):
       pivot_axis: int = -1,
       max_singular_values: Optional[int] = None,
       max_truncation_error: Optional[float] = None,
-      relative: Optional[bool] = False
+      relative: Optional[bool] = False,
+      method: Text = 'full',
+      seed: Optional[int] = None
   ) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    del seed
+    if method != 'full':
+      raise NotImplementedError(
+          "Backend '{}' only supports method = 'full'".format(self.name))
     return decompositions.svd(self.bs, tensor, pivot_axis, max_singular_values,
                               max_truncation_error, relative)
 
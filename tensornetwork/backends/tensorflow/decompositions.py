@@ -13,18 +13,106 @@
 # limitations under the License.
 """Tensor Decomposition Implementations."""
 
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, Text
+import numpy as np
+from tensornetwork.backends.decomposition_utils import (num_svd_vectors,
+                                                        POWER_ITERATIONS)
 
 Tensor = Any
 
 
+def _random_matrix(tf: Any, shape: Tuple[int, ...], dtype: Any,
+                   seed: Optional[int] = None) -> Tensor:
+  # use a private generator such that the global random state of the
+  # caller is left untouched
+  if seed is None:
+    generator = tf.random.Generator.from_non_deterministic_state()
+  else:
+    generator = tf.random.Generator.from_seed(seed)
+  if dtype.is_complex:
+    return tf.complex(
+        generator.normal(shape, dtype=dtype.real_dtype),
+        generator.normal(shape, dtype=dtype.real_dtype))
+  return generator.normal(shape, dtype=dtype)
+
+
+def _randomized_svd(tf: Any, matrix: Tensor, num_vecs: int,
+                    seed: Optional[int] = None
+                   ) -> Tuple[Tensor, Tensor, Tensor]:
+  """Randomized SVD of `matrix`, see
+  `tensornetwork.backends.numpy.decompositions._randomized_svd`. Returns
+  `s, u, v` with `matrix ~ u @ diag(s) @ v^H`.
+  """
+  omega = _random_matrix(tf, (matrix.shape[1], num_vecs), matrix.dtype,
+                         seed)
+  q, _ = tf.linalg.qr(matrix @ omega)
+  for _ in range(POWER_ITERATIONS):
+    q, _ = tf.linalg.qr(tf.linalg.adjoint(matrix) @ q)
+    q, _ = tf.linalg.qr(matrix @ q)
+  s, u, v = tf.linalg.svd(tf.linalg.adjoint(q) @ matrix)
+  return s, q @ u, v
+
+
+def _lanczos_svd(tf: Any, matrix: Tensor, num_vecs: int,
+                 seed: Optional[int] = None) -> Tuple[Tensor, Tensor, Tensor]:
+  """Krylov SVD of `matrix`, see
+  `tensornetwork.backends.numpy.decompositions._lanczos_svd`. Returns
+  `s, u, v` with `matrix ~ u @ diag(s) @ v^H`. Falls back to a full SVD if
+  `matrix` vanishes (numerically).
+  """
+  def orthogonalize(vector, basis):
+    basis = tf.concat(basis, axis=1)
+    for _ in range(2):
+      vector = vector - basis @ (tf.linalg.adjoint(basis) @ vector)
+    return vector
+
+  def norm(vector):
+    return tf.cast(tf.norm(vector), matrix.dtype)
+
+  eps = np.finfo(matrix.dtype.as_numpy_dtype).eps * np.sqrt(
+      max(matrix.shape))
+  scale = tf.norm(matrix)
+  v = _random_matrix(tf, (matrix.shape[1], 1), matrix.dtype, seed)
+  vs = [v / norm(v)]
+  us, alphas, betas = [], [], []
+  for step in range(num_vecs):
+    u = matrix @ vs[-1]
+    if step > 0:
+      u = orthogonalize(u - betas[-1] * us[-1], us)
+    alpha = norm(u)
+    if abs(alpha) <= eps * (abs(alphas[0]) if alphas else abs(scale)):
+      vs.pop()
+      break
+    us.append(u / alpha)
+    alphas.append(alpha)
+    if step == num_vecs - 1:
+      break
+    v = orthogonalize(tf.linalg.adjoint(matrix) @ us[-1] - alpha * vs[-1], vs)
+    beta = norm(v)
+    if abs(beta) <= eps * abs(alphas[0]):
+      break
+    vs.append(v / beta)
+    betas.append(beta)
+  if not alphas:
+    return tf.linalg.svd(matrix)
+  bidiagonal = tf.linalg.diag(tf.stack(alphas))
+  if betas:
+    bidiagonal = bidiagonal + tf.linalg.diag(
+        tf.stack(betas[:len(alphas) - 1]), k=1,
+        num_rows=len(alphas), num_cols=len(alphas))
+  s, u, v = tf.linalg.svd(bidiagonal)
+  return (s, tf.concat(us, axis=1) @ u, tf.concat(vs, axis=1) @ v)
+
+
 def svd(
     tf: Any,
     tensor: Tensor,
     pivot_axis: int,
     max_singular_values: Optional[int] = None,
     max_truncation_error: Optional[float] = None,
-    relative: Optional[bool] = False) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
+    relative: Optional[bool] = False,
+    method: Text = 'full',
+    seed: Optional[int] = None) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
   """Computes the singular value decomposition (SVD) of a tensor.
 
   The SVD is performed by treating the tensor as a matrix, with an effective
@@ -57,6 +145,16 @@ def svd(
   ```
   Note that the output ordering matches numpy.linalg.svd rather than tf.svd.
 
+  By default (`method='full'`), the full SVD is computed and truncated
+  afterwards. If only few singular values are kept, `method='randomized'`
+  (randomized range finding) or `method='lanczos'` (Golub-Kahan-Lanczos
+  bidiagonalization) compute the leading singular values directly. Both
+  methods require `max_singular_values`, and fall back to the full SVD if
+  the number of kept singular values is not small compared to the matrix
+  dimensions. In this case, `max_truncation_error` and `s_rest` only take
+  the singular values computed by the method into account. The `'lanczos'`
+  method requires concrete values and cannot be jitted.
+
   Args:
     tf: The tensorflow module.
     tensor: A tensor to be decomposed.
@@ -67,6 +165,10 @@ def svd(
     max_truncation_error: The maximum allowed truncation error or `None` to not
       do any truncation.
     relative: Multiply `max_truncation_err` with the largest singular value.
+    method: The SVD algorithm, one of `'full'`, `'randomized'` or
+      `'lanczos'`.
+    seed: Seed for the random starting matrix of `method='randomized'` and
+      `method='lanczos'`. If `None`, a nondeterministic seed is used.
 
   Returns:
     u: Left tensor factor.
@@ -74,14 +176,24 @@ def svd(
     vh: Right tensor factor.
     s_rest: Vector of discarded singular values (length zero if no
             truncation).
+  Raises:
+    ValueError: If `method` is unknown, or if `method` is not `'full'` and
+      `max_singular_values` is `None`.
   """
+  num_vecs = num_svd_vectors(method, max_singular_values)
   left_dims = tf.shape(tensor)[:pivot_axis]
   right_dims = tf.shape(tensor)[pivot_axis:]
 
   tensor = tf.reshape(tensor,
                       [tf.reduce_prod(left_dims),
                        tf.reduce_prod(right_dims)])
-  s, u, v = tf.linalg.svd(tensor)
+  if 0 < num_vecs < min(tensor.shape):
+    if method == 'randomized':
+      s, u, v = _randomized_svd(tf, tensor, num_vecs, seed)
+    else:
+      s, u, v = _lanczos_svd(tf, tensor, num_vecs, seed)
+  else:
+    s, u, v = tf.linalg.svd(tensor)
 
   if max_singular_values is None:
     max_singular_values = tf.size(s, out_type=tf.int64)
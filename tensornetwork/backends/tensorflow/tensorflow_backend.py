@@ -27,6 +27,7 @@ Tensor = Any
 
 class TensorFlowBackend(abstract_backend.AbstractBackend):
   """See base_backend.BaseBackend for documentation."""
+  supports_batched_matmul = True
 
   def __init__(self) -> None:
     # pylint: disable=global-variable-undefined
@@ -64,7 +65,9 @@ class TensorFlowBackend(abstract_backend.AbstractBackend):
       pivot_axis: int = -1,
       max_singular_values: Optional[int] = None,
       max_truncation_error: Optional[float] = None,
-      relative: Optional[bool] = False
+      relative: Optional[bool] = False,
+      method: Text = 'full',
+      seed: Optional[int] = None
   ) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
     return decompositions.svd(
         tf,
@@ -72,7 +75,9 @@ class TensorFlowBackend(abstract_backend.AbstractBackend):
         pivot_axis,
         max_singular_values,
         max_truncation_error,
-        relative=relative)
+        relative=relative,
+        method=method,
+        seed=seed)
 
   def qr(self, tensor: Tensor, pivot_axis: int = -1,
          non_negative_diagonal: bool = False) -> Tuple[Tensor, Tensor]:
@@ -196,6 +201,9 @@ class TensorFlowBackend(abstract_backend.AbstractBackend):
   def divide(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
     return tensor1 / tensor2
 
+  def cast(self, tensor: Tensor, dtype: Type[np.number]) -> Tensor:
+    return tf.cast(tensor, dtype)
+
   def index_update(self, tensor: Tensor, mask: Tensor,
                    assignee: Tensor) -> Tensor:
     #returns a copy (unfortunately)
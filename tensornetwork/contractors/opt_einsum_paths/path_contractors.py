@@ -15,14 +15,16 @@
 """Contractors based on `opt_einsum`'s path algorithms."""
 
 import functools
+import numpy as np
 import opt_einsum
 # pylint: disable=line-too-long
 from tensornetwork.network_operations import check_connected, get_all_edges, get_subgraph_dangling
 # pylint: disable=line-too-long
 from tensornetwork.network_components import get_all_nondangling, contract_parallel, contract_between
-from tensornetwork.network_components import Edge, AbstractNode
+from tensornetwork.network_components import Edge, AbstractNode, get_shared_edges
 from tensornetwork.contractors.opt_einsum_paths import utils
-from typing import Any, Optional, Sequence, Iterable
+from tensornetwork.precision import PrecisionPolicy
+from typing import Any, Dict, Optional, Sequence, Iterable
 
 #TODO (martin): add return types of functions back once TensorNetwork is gone
 #               remove _base_network
@@ -32,7 +34,8 @@ from typing import Any, Optional, Sequence, Iterable
 def base(nodes: Iterable[AbstractNode],
          algorithm: utils.Algorithm,
          output_edge_order: Optional[Sequence[Edge]] = None,
-         ignore_edge_order: bool = False) -> AbstractNode:
+         ignore_edge_order: bool = False,
+         precision: Optional[PrecisionPolicy] = None) -> AbstractNode:
   """Base method for all `opt_einsum` contractors.
 
   Args:
@@ -45,6 +48,9 @@ def base(nodes: Iterable[AbstractNode],
       `output_edge_order` must be pronvided.
     ignore_edge_order: An option to ignore the output edge
       order.
+    precision: An optional `PrecisionPolicy`. If given, the tensors of
+      `nodes` are cast to the storage dtype of the policy, and the final
+      node holds a tensor of the accumulation dtype.
 
   Returns:
     Final node after full contraction.
@@ -66,37 +72,80 @@ def base(nodes: Iterable[AbstractNode],
       raise ValueError("output edges are not equal to the remaining "
                        "non-contracted edges of the final node.")
 
+  backend, labels, inputs, network_structure = None, None, None, None
+  accumulate_dtype = None
+  if precision is not None:
+    backend = list(nodes_set)[0].backend
+    labels = _get_ncon_labels(edges)
+    inputs = [node.tensor for node in nodes_set]
+    network_structure = [[labels[e] for e in node.edges] for node in nodes_set]
+    accumulate_dtype = np.result_type(
+        *[precision.get_accumulate_dtype(t.dtype) for t in inputs]).type
+    for node, tensor in zip(nodes_set,
+                            precision.to_storage(inputs, backend)):
+      node.tensor = tensor
+
   for edge in edges:
     if not edge.is_disabled:  #if its disabled we already contracted it
       if edge.is_trace():
         nodes_set.remove(edge.node1)
-        nodes_set.add(contract_parallel(edge))
+        if precision is not None:
+          # traces are accumulated in higher precision
+          dtype = edge.node1.tensor.dtype
+          edge.node1.tensor = backend.cast(
+              edge.node1.tensor, precision.get_accumulate_dtype(dtype))
+          new_node = contract_parallel(edge)
+          new_node.tensor = backend.cast(new_node.tensor, dtype)
+        else:
+          new_node = contract_parallel(edge)
+        nodes_set.add(new_node)
 
   if len(nodes_set) == 1:
     # There's nothing to contract.
-    if ignore_edge_order:
-      return list(nodes_set)[0]
-    return list(nodes_set)[0].reorder_edges(output_edge_order)
-
-  # Then apply `opt_einsum`'s algorithm
-  path, nodes = utils.get_path(nodes_set, algorithm)
-  for a, b in path:
-    new_node = contract_between(nodes[a], nodes[b], allow_outer_product=True)
-    nodes.append(new_node)
-    nodes = utils.multi_remove(nodes, [a, b])
+    final_node = list(nodes_set)[0]
+  else:
+    # Then apply `opt_einsum`'s algorithm
+    path, nodes = utils.get_path(nodes_set, algorithm)
+    for a, b in path:
+      if precision is not None and (len(get_shared_edges(
+          nodes[a], nodes[b])) == len(nodes[a].edges) == len(nodes[b].edges)):
+        # a contraction to a scalar is a reduction
+        nodes[a].tensor = backend.cast(nodes[a].tensor, accumulate_dtype)
+        nodes[b].tensor = backend.cast(nodes[b].tensor, accumulate_dtype)
+      new_node = contract_between(nodes[a], nodes[b], allow_outer_product=True)
+      nodes.append(new_node)
+      nodes = utils.multi_remove(nodes, [a, b])
+    # nodes were connected, we checked this
+    final_node = nodes[0]
 
   # if the final node has more than one edge,
   # output_edge_order has to be specified
-  final_node = nodes[0]  # nodes were connected, we checked this
   if not ignore_edge_order:
     final_node.reorder_edges(output_edge_order)
+  if precision is not None:
+    final_node.tensor = backend.cast(final_node.tensor, accumulate_dtype)
+    if precision.num_error_samples > 0:
+      precision.estimate_error(inputs, network_structure,
+                               [labels[e] for e in final_node.edges],
+                               final_node.tensor)
   return final_node
 
 
+def _get_ncon_labels(edges: Iterable[Edge]) -> Dict[Edge, int]:
+  """Assign `ncon` labels to `edges`, i.e. negative integers to dangling
+  edges and positive integers to all other edges."""
+  dangling = [e for e in edges if e.is_dangling()]
+  nondangling = [e for e in edges if not e.is_dangling()]
+  labels = {e: -n - 1 for n, e in enumerate(dangling)}
+  labels.update({e: n + 1 for n, e in enumerate(nondangling)})
+  return labels
+
+
 def optimal(nodes: Iterable[AbstractNode],
             output_edge_order: Optional[Sequence[Edge]] = None,
             memory_limit: Optional[int] = None,
-            ignore_edge_order: bool = False) -> AbstractNode:
+            ignore_edge_order: bool = False,
+            precision: Optional[PrecisionPolicy] = None) -> AbstractNode:
   """Optimal contraction order via `opt_einsum`.
 
   This method will find the truly optimal contraction order via
@@ -113,19 +162,22 @@ def optimal(nodes: Iterable[AbstractNode],
       `output_edge_order` must be provided.
     memory_limit: Maximum number of elements in an array during contractions.
     ignore_edge_order: An option to ignore the output edge order.
+    precision: An optional `PrecisionPolicy` for a mixed-precision
+      contraction.
 
   Returns:
     The final node after full contraction.
   """
   alg = functools.partial(opt_einsum.paths.optimal, memory_limit=memory_limit)
-  return base(nodes, alg, output_edge_order, ignore_edge_order)
+  return base(nodes, alg, output_edge_order, ignore_edge_order, precision)
 
 
 def branch(nodes: Iterable[AbstractNode],
            output_edge_order: Optional[Sequence[Edge]] = None,
            memory_limit: Optional[int] = None,
            nbranch: Optional[int] = None,
-           ignore_edge_order: bool = False) -> AbstractNode:
+           ignore_edge_order: bool = False,
+           precision: Optional[PrecisionPolicy] = None) -> AbstractNode:
   """Branch contraction path via `opt_einsum`.
 
   This method uses the DFS approach of `optimal` while sorting potential
@@ -148,19 +200,22 @@ def branch(nodes: Iterable[AbstractNode],
       If None it explores all inner products starting with those that
       have the best cost heuristic.
     ignore_edge_order: An option to ignore the output edge order.
+    precision: An optional `PrecisionPolicy` for a mixed-precision
+      contraction.
 
   Returns:
     The final node after full contraction.
   """
   alg = functools.partial(
       opt_einsum.paths.branch, memory_limit=memory_limit, nbranch=nbranch)
-  return base(nodes, alg, output_edge_order, ignore_edge_order)
+  return base(nodes, alg, output_edge_order, ignore_edge_order, precision)
 
 
 def greedy(nodes: Iterable[AbstractNode],
            output_edge_order: Optional[Sequence[Edge]] = None,
            memory_limit: Optional[int] = None,
-           ignore_edge_order: bool = False) -> AbstractNode:
+           ignore_edge_order: bool = False,
+           precision: Optional[PrecisionPolicy] = None) -> AbstractNode:
   """Greedy contraction path via `opt_einsum`.
 
   This provides a more efficient strategy than `optimal` for finding
@@ -180,19 +235,22 @@ def greedy(nodes: Iterable[AbstractNode],
       `output_edge_order` must be provided.
     memory_limit: Maximum number of elements in an array during contractions.
     ignore_edge_order: An option to ignore the output edge order.
+    precision: An optional `PrecisionPolicy` for a mixed-precision
+      contraction.
 
   Returns:
     The final node after full contraction.
   """
   alg = functools.partial(opt_einsum.paths.greedy, memory_limit=memory_limit)
-  return base(nodes, alg, output_edge_order, ignore_edge_order)
+  return base(nodes, alg, output_edge_order, ignore_edge_order, precision)
 
 
 # pylint: disable=too-many-return-statements
 def auto(nodes: Iterable[AbstractNode],
          output_edge_order: Optional[Sequence[Edge]] = None,
          memory_limit: Optional[int] = None,
-         ignore_edge_order: bool = False) -> AbstractNode:
+         ignore_edge_order: bool = False,
+         precision: Optional[PrecisionPolicy] = None) -> AbstractNode:
   """Chooses one of the above algorithms according to network size.
 
   Default behavior is based on `opt_einsum`'s `auto` contractor.
@@ -206,6 +264,8 @@ def auto(nodes: Iterable[AbstractNode],
       `output_edge_order` must be provided.
     memory_limit: Maximum number of elements in an array during contractions.
     ignore_edge_order: An option to ignore the output edge order.
+    precision: An optional `PrecisionPolicy` for a mixed-precision
+      contraction.
 
   Returns:
     Final node after full contraction.
@@ -215,6 +275,10 @@ def auto(nodes: Iterable[AbstractNode],
   _nodes = nodes
   if n <= 0:
     raise ValueError("Cannot contract empty tensor network.")
+  if n == 1 and precision is not None:
+    # `base` takes care of the trace edges and the final cast
+    return base(nodes, opt_einsum.paths.optimal, output_edge_order,
+                ignore_edge_order, precision)
   if n == 1:
     if not ignore_edge_order:
       if output_edge_order is None:
@@ -237,34 +301,40 @@ def auto(nodes: Iterable[AbstractNode],
     return final_node
 
   if n < 5:
-    return optimal(nodes, output_edge_order, memory_limit, ignore_edge_order)
+    return optimal(nodes, output_edge_order, memory_limit, ignore_edge_order,
+                   precision)
   if n < 7:
     return branch(
         nodes,
         output_edge_order=output_edge_order,
         memory_limit=memory_limit,
-        ignore_edge_order=ignore_edge_order)
+        ignore_edge_order=ignore_edge_order,
+        precision=precision)
   if n < 9:
     return branch(
         nodes,
         output_edge_order=output_edge_order,
         memory_limit=memory_limit,
         nbranch=2,
-        ignore_edge_order=ignore_edge_order)
+        ignore_edge_order=ignore_edge_order,
+        precision=precision)
   if n < 15:
     return branch(
         nodes,
         output_edge_order=output_edge_order,
         nbranch=1,
-        ignore_edge_order=ignore_edge_order)
-  return greedy(nodes, output_edge_order, memory_limit, ignore_edge_order)
+        ignore_edge_order=ignore_edge_order,
+        precision=precision)
+  return greedy(nodes, output_edge_order, memory_limit, ignore_edge_order,
+                precision)
 
 
 def custom(nodes: Iterable[AbstractNode],
            optimizer: Any,
            output_edge_order: Sequence[Edge] = None,
            memory_limit: Optional[int] = None,
-           ignore_edge_order: bool = False) -> AbstractNode:
+           ignore_edge_order: bool = False,
+           precision: Optional[PrecisionPolicy] = None) -> AbstractNode:
   """Uses a custom path optimizer created by the user to calculate paths.
 
   The custom path optimizer should inherit `opt_einsum`'s `PathOptimizer`.
@@ -283,9 +353,11 @@ def custom(nodes: Iterable[AbstractNode],
     optimizer: A custom `opt_einsum.PathOptimizer` object.
     memory_limit: Maximum number of elements in an array during contractions.
     ignore_edge_order: An option to ignore the output edge order.
+    precision: An optional `PrecisionPolicy` for a mixed-precision
+      contraction.
 
   Returns:
     Final node after full contraction.
   """
   alg = functools.partial(optimizer, memory_limit=memory_limit)
-  return base(nodes, alg, output_edge_order, ignore_edge_order)
+  return base(nodes, alg, output_edge_order, ignore_edge_order, precision)
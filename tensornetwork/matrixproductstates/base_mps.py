@@ -20,10 +20,65 @@ import warnings
 from tensornetwork.ncon_interface import ncon
 from tensornetwork.backend_contextmanager import get_default_backend
 from tensornetwork.backends.abstract_backend import AbstractBackend
-from typing import Any, List, Optional, Text, Type, Union, Dict, Sequence
+from typing import (Any, List, Optional, Text, Type, Union, Dict, Sequence,
+                    TYPE_CHECKING)
+if TYPE_CHECKING:
+  # h5py is only imported when an MPS is saved to or loaded from disk
+  import h5py
 Tensor = Any
 
 
+class _TensorList(list):
+  """A list of mps tensors which notifies its owner whenever
+  one of its elements is replaced. Used by `BaseMPS` to invalidate
+  cached environments.
+  """
+
+  def __init__(self, tensors: Sequence[Tensor], callback) -> None:
+    super().__init__(tensors)
+    self._callback = callback
+
+  def __setitem__(self, key, value):
+    super().__setitem__(key, value)
+    if isinstance(key, slice):
+      self._callback(None)
+    else:
+      self._callback(key % len(self))
+
+  def __delitem__(self, key):
+    super().__delitem__(key)
+    self._callback(None)
+
+  def __iadd__(self, other):
+    result = super().__iadd__(other)
+    self._callback(None)
+    return result
+
+  def __imul__(self, other):
+    result = super().__imul__(other)
+    self._callback(None)
+    return result
+
+  def _mutate(name):  #pylint: disable=no-self-argument
+
+    def method(self, *args, **kwargs):
+      result = getattr(list, name)(self, *args, **kwargs)
+      self._callback(None)
+      return result
+
+    return method
+
+  append = _mutate('append')
+  extend = _mutate('extend')
+  insert = _mutate('insert')
+  pop = _mutate('pop')
+  remove = _mutate('remove')
+  reverse = _mutate('reverse')
+  sort = _mutate('sort')
+  clear = _mutate('clear')
+  del _mutate
+
+
 class BaseMPS:
   """The base class for MPS. All MPS should be derived from BaseMPS `BaseMPS`
   is an infinite matrix product state with a finite unitcell.
@@ -49,6 +104,14 @@ class BaseMPS:
   The orthogonality center can be be shifted using the
   `BaseMPS.position` method, which uses uses QR and RQ methods to shift
   `center_position`.
+
+  Reduced density matrices computed by `BaseMPS.left_envs` and
+  `BaseMPS.right_envs` are cached. Cached values are invalidated
+  whenever an element of `BaseMPS.tensors` is replaced or
+  `BaseMPS.center_position` changes; repeated measurements hence only
+  recompute environments which depend on changed tensors. If tensors
+  are modified in place (i.e. without assigning to `BaseMPS.tensors`),
+  `BaseMPS.clear_env_cache` has to be called.
   """
 
   def __init__(self,
@@ -80,6 +143,9 @@ class BaseMPS:
     else:
       self.backend = backend_factory.get_backend(backend)
 
+    self._left_envs_cache = {}
+    self._right_envs_cache = {}
+    self._center_position = None
     # the dtype is deduced from the tensor object.
     self.tensors = [self.backend.convert_to_tensor(t) for t in tensors]
     if not all(
@@ -108,10 +174,54 @@ class BaseMPS:
     ########################################################################
     ########################################################################
 
+  @property
+  def tensors(self) -> List[Tensor]:
+    return self._tensors
+
+  @tensors.setter
+  def tensors(self, tensors: Sequence[Tensor]) -> None:
+    self._tensors = _TensorList(tensors, self._invalidate_envs)
+    self.clear_env_cache()
+
+  @property
+  def center_position(self) -> Optional[int]:
+    return self._center_position
+
+  @center_position.setter
+  def center_position(self, center_position: Optional[int]) -> None:
+    if center_position != self._center_position:
+      self.clear_env_cache()
+    self._center_position = center_position
+
+  def clear_env_cache(self) -> None:
+    """Remove all cached left and right reduced density matrices."""
+    self._left_envs_cache = {}
+    self._right_envs_cache = {}
+
+  def _invalidate_envs(self, site: Optional[int]) -> None:
+    """Remove all cached environments which depend on the tensor at `site`.
+    If `site` is `None`, the whole cache is cleared.
+    """
+    if site is None:
+      self.clear_env_cache()
+      return
+    # left_envs[n] depends on all tensors at sites < n,
+    # right_envs[n] on all tensors at sites > n
+    self._left_envs_cache = {
+        n: env for n, env in self._left_envs_cache.items() if n <= site
+    }
+    self._right_envs_cache = {
+        n: env for n, env in self._right_envs_cache.items() if n >= site
+    }
+
   def left_transfer_operator(self, A, l, Abar):
     return ncon([A, l, Abar], [[1, 2, -1], [1, 3], [3, 2, -2]],
                 backend=self.backend.name)
 
+  def _batched_left_transfer_operator(self, A, ls, Abar):
+    return ncon([A, ls, Abar], [[1, 2, -2], [-1, 1, 3], [3, 2, -3]],
+                backend=self.backend.name)
+
   def right_transfer_operator(self, B, r, Bbar):
     return ncon([B, r, Bbar], [[-1, 2, 1], [1, 3], [-2, 2, 3]],
                 backend=self.backend.name)
@@ -190,9 +300,53 @@ class BaseMPS:
 
     return self.tensors[0].dtype
 
-  def save(self, path: str):
+  def _mps_data(self) -> Dict[Text, Any]:
+    """Return a snapshot of the data defining the MPS, with all tensors
+    converted to numpy arrays."""
+    connector_matrix = None
+    if self.connector_matrix is not None:
+      connector_matrix = np.array(self.connector_matrix)
+    return {
+        'type': type(self).__name__,
+        'backend': self.backend.name,
+        'center_position': self.center_position,
+        'tensors': [np.array(tensor) for tensor in self.tensors],
+        'connector_matrix': connector_matrix
+    }
+
+  @classmethod
+  def _from_mps_data(cls, data: Dict[Text, Any],
+                     backend: Optional[Union[Text, AbstractBackend]]):
     raise NotImplementedError()
 
+  def save(self, path: str) -> None:
+    """Save the MPS to an hdf5 file.
+
+    Args:
+      path: path to file where the MPS is saved.
+    """
+    import h5py  # pylint: disable=import-outside-toplevel
+    with h5py.File(path, 'w') as mps_file:
+      _write_mps_data(mps_file, self._mps_data())
+
+  @classmethod
+  def load(cls,
+           path: str,
+           backend: Optional[Union[Text, AbstractBackend]] = None) -> "BaseMPS":
+    """Load an MPS from an hdf5 file written by `BaseMPS.save`.
+
+    Args:
+      path: path to file where the MPS is saved.
+      backend: An optional backend. Defaults to the backend of the
+        saved MPS.
+    Returns:
+      The loaded MPS.
+    """
+    import h5py  # pylint: disable=import-outside-toplevel
+    with h5py.File(path, 'r') as mps_file:
+      data = _read_mps_data(mps_file)
+    return cls._from_mps_data(data, backend)
+
   @property
   def bond_dimensions(self) -> List:
     """A list of bond dimensions of `BaseMPS`"""
@@ -427,6 +581,165 @@ class BaseMPS:
               backend=self.backend)
     return c
 
+  def correlation_matrix(self, op1: Tensor, op2: Tensor,
+                         sites: Sequence[int]) -> Tensor:
+    """
+    Compute the matrix of correlators
+    :math:`C_{ij} = \\langle` `op1[sites[i]] op2[sites[j]]`:math:`\\rangle`
+    for all pairs of sites in `sites`. If `sites[i] == sites[j]`,
+    `op2` is applied first.
+
+    All correlators are computed in a single sweep from the left-most
+    to the right-most site in `sites`. Partially contracted networks
+    with `op1` or `op2` inserted at previous sites are stacked into
+    a single batched `Tensor`, such that each site of the sweep costs
+    one batched transfer-operator contraction instead of one
+    contraction per open correlator.
+
+    Args:
+      op1: Tensor of rank 2; the first local operator.
+      op2: Tensor of rank 2; the second local operator.
+      sites: The (unique) sites of the correlators.
+    Returns:
+      Tensor: A matrix of shape `(len(sites), len(sites))`.
+    Raises:
+      ValueError if `sites` contains duplicates or sites out of range.
+    """
+    sites = np.asarray(sites)
+    M = len(sites)
+    if M == 0:
+      raise ValueError("`sites` has to contain at least one site")
+    if len(np.unique(sites)) != M:
+      raise ValueError("`sites` contains duplicate sites")
+    if np.any(sites < 0) or np.any(sites >= len(self)):
+      raise ValueError("all elements of `sites` have to be "
+                       "between 0 <= site < N = {}".format(len(self)))
+    position = {site: n for n, site in enumerate(sites)}
+    first, last = np.min(sites), np.max(sites)
+    L = self.left_envs([first])[first]
+    right_envs = self.right_envs(sites)
+    op12 = ncon([op1, op2], [[-1, 1], [1, -2]], backend=self.backend.name)
+    unit_vectors = self.backend.eye(M, dtype=self.dtype)
+
+    # batch1[n] (batch2[n]) is the left environment with `op1` (`op2`)
+    # inserted at site `sites[n]`. Entries of sites which have not yet
+    # been reached by the sweep are zero.
+    batch1 = self.backend.zeros((M,) + tuple(L.shape), dtype=self.dtype)
+    batch2 = self.backend.zeros((M,) + tuple(L.shape), dtype=self.dtype)
+    result = np.zeros((M, M),
+                      dtype=np.result_type(
+                          np.array(L), np.array(op1), np.array(op2)))
+    opened = []
+    for site in range(first, last + 1):
+      A = self.tensors[site]
+      conj_A = self.backend.conj(A)
+      if site in position:
+        n = position[site]
+        R = right_envs[site]
+        result[n, n] = np.array(
+            ncon([L, A, op12, conj_A, R],
+                 [[1, 2], [1, 3, 4], [5, 3], [2, 5, 6], [4, 6]],
+                 backend=self.backend.name))
+        if len(opened) > 0:
+          values1 = np.array(
+              ncon([batch1, A, op2, conj_A, R],
+                   [[-1, 1, 2], [1, 3, 4], [5, 3], [2, 5, 6], [4, 6]],
+                   backend=self.backend.name))
+          values2 = np.array(
+              ncon([batch2, A, op1, conj_A, R],
+                   [[-1, 1, 2], [1, 3, 4], [5, 3], [2, 5, 6], [4, 6]],
+                   backend=self.backend.name))
+          result[opened, n] = values1[opened]
+          result[n, opened] = values2[opened]
+        if site == last:
+          break
+        unit_vector = self.backend.reshape(
+            self.backend.slice(unit_vectors, (0, n), (M, 1)), (M,))
+        batch1 = self._batched_left_transfer_operator(
+            A, batch1, conj_A) + ncon(
+                [unit_vector, L, A, op1, conj_A],
+                [[-1], [1, 2], [1, 3, -2], [4, 3], [2, 4, -3]],
+                backend=self.backend.name)
+        batch2 = self._batched_left_transfer_operator(
+            A, batch2, conj_A) + ncon(
+                [unit_vector, L, A, op2, conj_A],
+                [[-1], [1, 2], [1, 3, -2], [4, 3], [2, 4, -3]],
+                backend=self.backend.name)
+        opened.append(n)
+      else:
+        batch1 = self._batched_left_transfer_operator(A, batch1, conj_A)
+        batch2 = self._batched_left_transfer_operator(A, batch2, conj_A)
+      L = self.left_transfer_operator(A, L, conj_A)
+    return self.backend.convert_to_tensor(result)
+
+  def expectation_string(self, ops_by_site: Dict[int, Tensor]) -> Tensor:
+    """Compute the expectation value of a string operator, i.e. of the
+    product of local operators `ops_by_site[site]` acting on different
+    sites (e.g. Jordan-Wigner strings or parity strings). Sites between
+    the first and last site of the string that are not in `ops_by_site`
+    are acted upon with the identity.
+
+    The expectation value is computed in a single sweep from the first
+    to the last site of the string, using the (cached) reduced density
+    matrices at the boundaries of the string.
+
+    Args:
+      ops_by_site: A dict mapping sites to rank-2 tensors.
+    Returns:
+      `Tensor`: The expectation value of the string operator.
+    Raises:
+      ValueError: If `ops_by_site` is empty, or if any site is out of range.
+    """
+    if len(ops_by_site) == 0:
+      raise ValueError('`ops_by_site` cannot be empty')
+    site1, site2 = min(ops_by_site), max(ops_by_site)
+    if site1 < 0 or site2 >= len(self):
+      raise ValueError('all sites in `ops_by_site` have to be in [0, {}), '
+                       'found {}'.format(len(self), sorted(ops_by_site)))
+    left = self.left_envs([site1])[site1]
+    for site in range(site1, site2 + 1):
+      A = self.tensors[site]
+      if site in ops_by_site:
+        left = ncon([left, A, ops_by_site[site],
+                     self.backend.conj(A)],
+                    [[1, 2], [1, 3, -1], [4, 3], [2, 4, -2]],
+                    backend=self.backend.name)
+      else:
+        left = self.left_transfer_operator(A, left, self.backend.conj(A))
+    right = self.right_envs([site2])[site2]
+    return ncon([left, right], [[1, 2], [1, 2]], backend=self.backend.name)
+
+  def expectation_mpo(self, mpo) -> Tensor:
+    """Compute the expectation value of a matrix product operator `mpo`
+    in a single sweep over the MPS.
+
+    Args:
+      mpo: A `FiniteMPO` of the same length as the MPS.
+    Returns:
+      `Tensor`: The expectation value of `mpo`.
+    Raises:
+      ValueError: If `mpo` has a different length than the MPS, or if
+        its left and right ancillary dimensions are not 1.
+    """
+    if len(mpo) != len(self):
+      raise ValueError('len(mpo) = {} is different from len(mps) = {}'.format(
+          len(mpo), len(self)))
+    if mpo.bond_dimensions[0] != 1 or mpo.bond_dimensions[-1] != 1:
+      raise ValueError('left and right MPO ancillary dimensions have to be 1')
+    N = len(self)
+    left = self.left_envs([0])[0]
+    left = self.backend.reshape(left, (1,) + tuple(left.shape))
+    for site in range(N):
+      A = self.tensors[site]
+      left = ncon([left, A, mpo.tensors[site],
+                   self.backend.conj(A)],
+                  [[2, 1, 5], [1, 3, -2], [2, -1, 4, 3], [5, 4, -3]],
+                  backend=self.backend.name)
+    right = self.right_envs([N - 1])[N - 1]
+    right = self.backend.reshape(right, (1,) + tuple(right.shape))
+    return ncon([left, right], [[1, 2, 3], [1, 2, 3]],
+                backend=self.backend.name)
+
   def apply_two_site_gate(self,
                           gate: Tensor,
                           site1: int,
@@ -597,3 +910,38 @@ class BaseMPS:
 
   def canonicalize(self, *args, **kwargs) -> np.number:
     raise NotImplementedError()
+
+
+def _write_mps_data(group: "h5py.Group", data: Dict[Text, Any]) -> None:
+  """Write the output of `BaseMPS._mps_data` into an hdf5 group.
+  Tensors are stored as chunked datasets.
+  """
+  group.attrs['type'] = data['type']
+  group.attrs['backend'] = data['backend']
+  if data['center_position'] is not None:
+    group.attrs['center_position'] = data['center_position']
+  tensors_group = group.create_group('tensors')
+  for site, tensor in enumerate(data['tensors']):
+    tensors_group.create_dataset(str(site), data=tensor, chunks=True)
+  if data['connector_matrix'] is not None:
+    group.create_dataset('connector_matrix', data=data['connector_matrix'])
+
+
+def _read_mps_data(group: "h5py.Group") -> Dict[Text, Any]:
+  """Read data written by `_write_mps_data` from an hdf5 group."""
+  tensors_group = group['tensors']
+  center_position = None
+  if 'center_position' in group.attrs:
+    center_position = int(group.attrs['center_position'])
+  connector_matrix = None
+  if 'connector_matrix' in group:
+    connector_matrix = group['connector_matrix'][()]
+  return {
+      'type': group.attrs['type'],
+      'backend': group.attrs['backend'],
+      'center_position': center_position,
+      'tensors': [
+          tensors_group[str(site)][()] for site in range(len(tensors_group))
+      ],
+      'connector_matrix': connector_matrix
+  }
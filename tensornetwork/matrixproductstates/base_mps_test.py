@@ -259,7 +259,7 @@ def test_not_implemented():
   tensors = [np.ones((1, d, D)), np.ones((D, d, D))]
   mps = BaseMPS(tensors, backend='numpy')
   with pytest.raises(NotImplementedError):
-    mps.save('tmp')
+    BaseMPS._from_mps_data(mps._mps_data(), backend='numpy')
   with pytest.raises(NotImplementedError):
     mps.right_envs([0])
   with pytest.raises(NotImplementedError):
@@ -11,19 +11,32 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import threading
 import numpy as np
-from tensornetwork.matrixproductstates.base_mps import BaseMPS
+from tensornetwork.matrixproductstates.base_mps import (BaseMPS,
+                                                        _write_mps_data,
+                                                        _read_mps_data)
 from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
 from tensornetwork.matrixproductstates.mpo import BaseMPO, FiniteMPO
 from tensornetwork.ncon_interface import ncon
+from tensornetwork.backends.abstract_backend import AbstractBackend
 from sys import stdout
-from typing import Any, Text, Union
+from typing import Any, Dict, List, Optional, Text, Union
 Tensor = Any
 
+_CACHED_FUNCTIONS = {}
+
+
 class BaseDMRG:
   """
   A base class for DMRG (and possibly other) simulations.
   Finite DMRG and infinite DMRG are subclassed from `BaseDMRG`.
+
+  For backends which support in-place operations (e.g. `numpy`), the
+  tensors in `left_envs` and `right_envs` are overwritten in place when
+  an environment is updated. Copy an environment tensor if it has to be
+  kept beyond the next update.
   """
 
   def __init__(self, mps: BaseMPS, mpo: BaseMPO, left_boundary: Tensor,
@@ -72,6 +85,17 @@ class BaseDMRG:
           .format(self.right_envs[0].dtype, self.dtype))
 
     self.name = name
+    self.completed_sweeps = 0
+    self.energy = None
+    self._checkpoint_thread = None
+    self._checkpoint_error = None
+    self.orthogonal_to = []
+    self.left_overlap_envs = []
+    self.right_overlap_envs = []
+    self._penalized_matvecs = {}
+    # statistics of the local optimizations of the last `run_one_site`
+    self.solver_stats = []
+    self._num_matvecs = None
 
   @property
   def backend(self):
@@ -92,18 +116,123 @@ class BaseDMRG:
                 [[3, 1, -1], [1, 2, 4], [3, 5, -2, 2], [5, 4, -3]],
                 backend=self.backend.name)
 
-  def add_left_layer(self, L, mps_tensor, mpo_tensor):
-    return ncon([L, mps_tensor, mpo_tensor,
-                 self.backend.conj(mps_tensor)],
-                [[2, 1, 5], [1, 3, -2], [2, -1, 4, 3], [5, 4, -3]],
+  def add_left_layer(self, L, mps_tensor, mpo_tensor, out=None):
+    if out is None:
+      return ncon([L, mps_tensor, mpo_tensor,
+                   self.backend.conj(mps_tensor)],
+                  [[2, 1, 5], [1, 3, -2], [2, -1, 4, 3], [5, 4, -3]],
+                  backend=self.backend.name)
+    tmp = self.backend.tensordot(L, mps_tensor, ([1], [0]))
+    tmp = self.backend.tensordot(mpo_tensor, tmp, ([0, 3], [0, 2]))
+    return self.backend.tensordot_into(tmp, self.backend.conj(mps_tensor),
+                                       ([2, 1], [0, 1]), out)
+
+  def add_right_layer(self, R, mps_tensor, mpo_tensor, out=None):
+    if out is None:
+      return ncon([R, mps_tensor, mpo_tensor,
+                   self.backend.conj(mps_tensor)],
+                  [[2, 1, 5], [-2, 3, 1], [-1, 2, 4, 3], [-3, 4, 5]],
+                  backend=self.backend.name)
+    tmp = self.backend.tensordot(mps_tensor, R, ([2], [1]))
+    tmp = self.backend.tensordot(mpo_tensor, tmp, ([1, 3], [2, 1]))
+    return self.backend.tensordot_into(tmp, self.backend.conj(mps_tensor),
+                                       ([1, 3], [1, 2]), out)
+
+  def _env_buffer(self, envs, site, shape, dtype):
+    """
+    Return the environment at `site` if it can be overwritten with a new
+    environment of shape `shape` and dtype `dtype`, and `None` otherwise.
+    """
+    if not self.backend.supports_inplace or site not in envs:
+      return None
+    if (self.backend.shape_tuple(envs[site]) != tuple(shape) or
+        envs[site].dtype != dtype):
+      return None
+    return envs[site]
+
+  def add_left_overlap_layer(self, L, reference_tensor, mps_tensor):
+    return ncon([L, self.backend.conj(reference_tensor), mps_tensor],
+                [[1, 2], [1, 3, -1], [2, 3, -2]],
                 backend=self.backend.name)
 
-  def add_right_layer(self, R, mps_tensor, mpo_tensor):
-    return ncon([R, mps_tensor, mpo_tensor,
-                 self.backend.conj(mps_tensor)],
-                [[2, 1, 5], [-2, 3, 1], [-1, 2, 4, 3], [-3, 4, 5]],
+  def add_right_overlap_layer(self, R, reference_tensor, mps_tensor):
+    return ncon([self.backend.conj(reference_tensor), mps_tensor, R],
+                [[-1, 3, 1], [-2, 3, 2], [1, 2]],
                 backend=self.backend.name)
 
+  def _update_left_envs(self, site: int, mps_tensor: Tensor) -> None:
+    """
+    Compute the left environment at `site + 1` and the corresponding
+    overlap environments with all states in `BaseDMRG.orthogonal_to`
+    from the environments at `site` and `mps_tensor`.
+    """
+    mpo_tensor = self.mpo.tensors[site]
+    D = self.backend.shape_tuple(mps_tensor)[2]
+    out = self._env_buffer(
+        self.left_envs, site + 1,
+        (self.backend.shape_tuple(mpo_tensor)[1], D, D), mps_tensor.dtype)
+    self.left_envs[site + 1] = self.add_left_layer(self.left_envs[site],
+                                                   mps_tensor,
+                                                   mpo_tensor,
+                                                   out=out)
+    for reference, envs in zip(self.orthogonal_to, self.left_overlap_envs):
+      envs[site + 1] = self.add_left_overlap_layer(envs[site],
+                                                   reference.tensors[site],
+                                                   mps_tensor)
+
+  def _update_right_envs(self, site: int, mps_tensor: Tensor) -> None:
+    """
+    Compute the right environment at `site - 1` and the corresponding
+    overlap environments with all states in `BaseDMRG.orthogonal_to`
+    from the environments at `site` and `mps_tensor`.
+    """
+    mpo_tensor = self.mpo.tensors[site]
+    D = self.backend.shape_tuple(mps_tensor)[0]
+    out = self._env_buffer(
+        self.right_envs, site - 1,
+        (self.backend.shape_tuple(mpo_tensor)[0], D, D), mps_tensor.dtype)
+    self.right_envs[site - 1] = self.add_right_layer(self.right_envs[site],
+                                                     mps_tensor,
+                                                     mpo_tensor,
+                                                     out=out)
+    for reference, envs in zip(self.orthogonal_to, self.right_overlap_envs):
+      envs[site - 1] = self.add_right_overlap_layer(envs[site],
+                                                    reference.tensors[site],
+                                                    mps_tensor)
+
+  def set_orthogonal_to(self, states: List[BaseMPS]) -> None:
+    """
+    Set the states to which the optimized mps is kept orthogonal.
+    Overlap environments with each state are initialized at the
+    boundaries and then updated together with `left_envs` and
+    `right_envs`.
+    Args:
+      states: A list of (normalized) `BaseMPS` objects.
+    Raises:
+      TypeError: If a state uses a different backend than the mps.
+      ValueError: If a state has a different length than the mps.
+    """
+    for state in states:
+      if state.backend is not self.backend:
+        raise TypeError('mps and orthogonal state use different backends.')
+      if len(state) != len(self.mps):
+        raise ValueError(
+            'len(mps) = {} is different from len(state) = {}'.format(
+                len(self.mps), len(state)))
+    self.orthogonal_to = list(states)
+    self.left_overlap_envs = [{
+        0:
+            self.backend.ones((state.tensors[0].shape[0],
+                               self.mps.tensors[0].shape[0]),
+                              dtype=self.dtype)
+    } for state in states]
+    self.right_overlap_envs = [{
+        len(self.mps) - 1:
+            self.backend.ones((state.tensors[-1].shape[2],
+                               self.mps.tensors[-1].shape[2]),
+                              dtype=self.dtype)
+    } for state in states]
+
   def position(self, site: int):
     """
     Shifts the center position `site`, and updates left and 
@@ -124,28 +253,26 @@ class BaseDMRG:
       pos = self.mps.center_position
       self.mps.position(site)
       for m in range(pos, site):
-        self.left_envs[m + 1] = self.add_left_layer(self.left_envs[m],
-                                                    self.mps.tensors[m],
-                                                    self.mpo.tensors[m])
+        self._update_left_envs(m, self.mps.tensors[m])
 
     elif site < self.mps.center_position:
       pos = self.mps.center_position
       self.mps.position(site)
       for m in reversed(range(site, pos)):
-        self.right_envs[m] = self.add_right_layer(self.right_envs[m + 1],
-                                                  self.mps.tensors[m + 1],
-                                                  self.mpo.tensors[m + 1])
-
-    for m in range(site + 1, len(self.mps) + 1):
-      try:
-        del self.left_envs[m]
-      except KeyError:
-        pass
-    for m in range(-1, site):
-      try:
-        del self.right_envs[m]
-      except KeyError:
-        pass
+        self._update_right_envs(m + 1, self.mps.tensors[m + 1])
+
+    for envs in [self.left_envs] + self.left_overlap_envs:
+      for m in range(site + 1, len(self.mps) + 1):
+        try:
+          del envs[m]
+        except KeyError:
+          pass
+    for envs in [self.right_envs] + self.right_overlap_envs:
+      for m in range(-1, site):
+        try:
+          del envs[m]
+        except KeyError:
+          pass
 
     return self
 
@@ -156,30 +283,60 @@ class BaseDMRG:
     """
     lb = self.left_envs[0]
     self.left_envs = {0: lb}
+    self.left_overlap_envs = [{0: envs[0]} for envs in self.left_overlap_envs]
 
     for n in range(self.mps.center_position):
-      self.left_envs[n + 1] = self.add_left_layer(self.left_envs[n],
-                                                  self.mps.tensors[n],
-                                                  self.mpo.tensors[n])
+      self._update_left_envs(n, self.mps.tensors[n])
 
   def compute_right_envs(self) -> None:
     """
     Compute all right environment blocks of sites up to
     (including) self.mps.center_position.
     """
-    rb = self.right_envs[len(self.mps) - 1]
-    self.right_envs = {len(self.mps) - 1: rb}
-    for n in reversed(range(self.mps.center_position + 1, len(self.mps))):
-      self.right_envs[n - 1] = self.add_right_layer(self.right_envs[n],
-                                                    self.mps.tensors[n],
-                                                    self.mpo.tensors[n])
+    N = len(self.mps)
+    rb = self.right_envs[N - 1]
+    self.right_envs = {N - 1: rb}
+    self.right_overlap_envs = [{
+        N - 1: envs[N - 1]
+    } for envs in self.right_overlap_envs]
+    for n in reversed(range(self.mps.center_position + 1, N)):
+      self._update_right_envs(n, self.mps.tensors[n])
+
+  def _count_matvecs(self, matvec):
+    def counted_matvec(*args):
+      self._num_matvecs += 1
+      return matvec(*args)
+
+    return counted_matvec
+
+  def _penalized_matvec(self, matvec):
+    """
+    Return a matrix-vector product which adds the penalty
+    `penalty * |v><v|` to `matvec` for every vector `v` in its
+    `vectors` argument. Wrappers are cached per `matvec` such that backends
+    which jit `eigsh_lanczos` do not need to retrace them.
+    """
+    if matvec not in self._penalized_matvecs:
+
+      def penalized_matvec(mpstensor, L, mpotensor, R, vectors, penalty):
+        result = matvec(mpstensor, L, mpotensor, R)
+        for vector in vectors:
+          overlap = ncon([self.backend.conj(vector), mpstensor],
+                         [[1, 2, 3], [1, 2, 3]],
+                         backend=self.backend.name)
+          result = self.backend.axpy(penalty * overlap, vector, result)
+        return result
+
+      self._penalized_matvecs[matvec] = penalized_matvec
+    return self._penalized_matvecs[matvec]
 
   def _optimize_1s_local(self,
                          sweep_dir,
                          num_krylov_vecs=10,
                          tol=1E-5,
                          delta=1E-6,
-                         ndiag=10) -> np.number:
+                         ndiag=10,
+                         penalty=10.0) -> np.number:
     """
     Single-site optimization at the current position of the center site. 
     The method shifts the center position of the mps by one site 
@@ -194,6 +351,8 @@ class BaseDMRG:
         :math:`\\lVert x_n\\rVert < delta`, the iteration
         is stopped. 
       ndiag: Inverse frequencey of tridiagonalizations in `eighs_lanczos`.
+      penalty: The energy penalty of the states in
+        `BaseDMRG.orthogonal_to`.
     Returns:
       float/complex: The local energy after optimization.
     """
@@ -201,11 +360,32 @@ class BaseDMRG:
     #note: some backends will jit functions
     self.left_envs[site]
     self.right_envs[site]
+    #jitted matvecs are only traced once, so matvecs can only be
+    #counted for backends which do not jit `eigsh_lanczos`
+    matvec = self.single_site_matvec
+    args = [self.left_envs[site], self.mpo.tensors[site], self.right_envs[site]]
+    if self.orthogonal_to:
+      # the local projections of the states in `orthogonal_to`
+      vectors = [
+          ncon([
+              self.backend.conj(left_envs[site]), reference.tensors[site],
+              self.backend.conj(right_envs[site])
+          ], [[1, -1], [1, -2, 2], [2, -3]],
+               backend=self.backend.name)
+          for reference, left_envs, right_envs in zip(
+              self.orthogonal_to, self.left_overlap_envs,
+              self.right_overlap_envs)
+      ]
+      matvec = self._penalized_matvec(matvec)
+      args += [vectors, penalty]
+    if self.backend.supports_jit:
+      self._num_matvecs = None
+    else:
+      matvec = self._count_matvecs(matvec)
+      self._num_matvecs = 0
     energies, states = self.backend.eigsh_lanczos(
-        A=self.single_site_matvec,
-        args=[
-            self.left_envs[site], self.mpo.tensors[site], self.right_envs[site]
-        ],
+        A=matvec,
+        args=args,
         initial_state=self.mps.tensors[site],
         num_krylov_vecs=num_krylov_vecs,
         numeig=1,
@@ -216,30 +396,40 @@ class BaseDMRG:
     local_ground_state = states[0]
     energy = energies[0]
     local_ground_state /= self.backend.norm(local_ground_state)
+    self._shift_1s(local_ground_state, sweep_dir)
+    return energy
 
+  def _shift_1s(self, tensor, sweep_dir) -> None:
+    """
+    Replace the tensor at the current position of the center site by
+    `tensor` and shift the center position by one site to the left or to
+    the right, depending on the value of `sweep_dir`. The left or right
+    environment is updated accordingly.
+    Args:
+      tensor: The new center tensor.
+      sweep_dir: Sweep direction; 'left' or 'l' for a sweep from right to left,
+        'right' or 'r' for a sweep from left to right.
+    """
+    site = self.mps.center_position
     if sweep_dir in ('r', 'right'):
-      Q, R = self.mps.qr(local_ground_state)
+      Q, R = self.mps.qr(tensor)
       self.mps.tensors[site] = Q
       if site < len(self.mps.tensors) - 1:
         self.mps.center_position += 1
         self.mps.tensors[site + 1] = ncon([R, self.mps.tensors[site + 1]],
                                           [[-1, 1], [1, -2, -3]],
                                           backend=self.backend.name)
-        self.left_envs[site + 1] = self.add_left_layer(self.left_envs[site], Q,
-                                                       self.mpo.tensors[site])
+        self._update_left_envs(site, Q)
 
     elif sweep_dir in ('l', 'left'):
-      R, Q = self.mps.rq(local_ground_state)
+      R, Q = self.mps.rq(tensor)
       self.mps.tensors[site] = Q
       if site > 0:
         self.mps.center_position -= 1
         self.mps.tensors[site - 1] = ncon([self.mps.tensors[site - 1], R],
                                           [[-1, -2, 1], [1, -3]],
                                           backend=self.backend.name)
-        self.right_envs[site - 1] = self.add_right_layer(
-            self.right_envs[site], Q, self.mpo.tensors[site])
-
-    return energy
+        self._update_right_envs(site, Q)
 
   def run_one_site(self,
                    num_sweeps=4,
@@ -248,9 +438,20 @@ class BaseDMRG:
                    verbose=0,
                    delta=1E-6,
                    tol=1E-6,
-                   ndiag=10) -> np.number:
+                   ndiag=10,
+                   adaptive=False,
+                   checkpoint_path=None,
+                   orthogonal_to=None,
+                   penalty=10.0) -> np.number:
     """
     Run a single-site DMRG optimization of the MPS.
+
+    Statistics of each local optimization are stored in
+    `BaseDMRG.solver_stats`, a list of dicts with keys `'sweep'`, `'site'`,
+    `'sweep_dir'`, `'num_krylov_vecs'`, `'tol'`, `'num_matvecs'`
+    (`None` for backends which jit the Lanczos solver), `'energy_change'`
+    and `'skipped'`.
+
     Args:
       num_sweeps: Number of DMRG sweeps. A sweep optimizes all sites
         starting at the left side, moving to the right side, and back
@@ -269,6 +470,28 @@ class BaseDMRG:
       ndiag: Inverse frequency at which eigenvalues of the 
         tridiagonal Hamiltonian produced by `eigsh_lanczos` are tested 
         for convergence. `ndiag=10` tests at every tenth step.
+      adaptive: If `True`, the settings of `eigsh_lanczos` are adapted
+        to the change `dE` of the energy during the previous sweep:
+        the tolerance is `max(tol, min(0.1 * dE, 1E-2))`, and as long as
+        `dE > 100 * precision` the Krylov space dimension is capped at
+        `num_krylov_vecs // 2`. Sites whose optimization changed the
+        energy by less than `precision / len(mps)` in the previous sweep
+        are skipped (but optimized again in the following sweep).
+      checkpoint_path: If not `None`, a checkpoint is written to
+        `checkpoint_path` after every sweep (see `BaseDMRG.checkpoint`).
+        Checkpoints are written asynchronously; the last one is complete
+        when `run_one_site` returns. `num_sweeps` does not account for
+        the `completed_sweeps` of a restored simulation.
+      orthogonal_to: An optional list of normalized `FiniteMPS` objects,
+        e.g. previously computed lower-lying eigenstates. The
+        optimization targets the lowest eigenstate of
+        `H + penalty * sum_k |psi_k><psi_k|`, which yields excited
+        states if the `psi_k` are the eigenstates below. Overlap
+        environments with each state are updated incrementally
+        alongside `left_envs` and `right_envs`.
+      penalty: The energy penalty of the states in `orthogonal_to`. It has
+        to be larger than the gap between the targeted state and the
+        states in `orthogonal_to`.
     Returns:
       float: The energy upon termination of `run_one_site`.
     """
@@ -279,7 +502,14 @@ class BaseDMRG:
     final_energy = 1E100
     iteration = 1
     initial_site = 0
-
+    energy = None
+    sweep_energy_change = np.inf
+    # energy changes of the last optimization of each (site, sweep_dir)
+    local_energy_changes = {}
+    sweep_tol, sweep_krylov_vecs = tol, num_krylov_vecs
+    self.solver_stats = []
+
+    self.set_orthogonal_to(orthogonal_to or [])
     self.mps.position(0)  #move center position to the left end
     self.compute_right_envs()
 
@@ -294,45 +524,70 @@ class BaseDMRG:
         print(f"SS-DMRG sweep={iteration}/{num_sweeps}, "
               f"site={site}/{len(self.mps)}: optimized E={energy}")
 
+    def optimize(sweep_dir):
+      site = self.mps.center_position
+      skip = adaptive and energy is not None and local_energy_changes.get(
+          (site, sweep_dir), np.inf) < precision / len(self.mps)
+      if skip:
+        self._shift_1s(self.mps.tensors[site], sweep_dir)
+        new_energy = energy
+        # make sure the site is optimized again in the next sweep
+        local_energy_changes[(site, sweep_dir)] = np.inf
+      else:
+        #_optimize_1site_local shifts the center site internally
+        new_energy = self._optimize_1s_local(
+            sweep_dir=sweep_dir,
+            num_krylov_vecs=sweep_krylov_vecs,
+            tol=sweep_tol,
+            delta=delta,
+            ndiag=ndiag,
+            penalty=penalty)
+        if energy is None:
+          local_energy_changes[(site, sweep_dir)] = np.inf
+        else:
+          local_energy_changes[(site, sweep_dir)] = np.abs(new_energy - energy)
+      self.solver_stats.append({
+          'sweep': iteration,
+          'site': site,
+          'sweep_dir': sweep_dir,
+          'num_krylov_vecs': None if skip else sweep_krylov_vecs,
+          'tol': None if skip else sweep_tol,
+          'num_matvecs': 0 if skip else self._num_matvecs,
+          'energy_change': local_energy_changes[(site, sweep_dir)],
+          'skipped': skip
+      })
+      return new_energy
+
     while not converged:
+      if adaptive:
+        sweep_tol = max(tol, min(0.1 * sweep_energy_change, 1E-2))
+        if sweep_energy_change > 100 * precision:
+          sweep_krylov_vecs = max(2, num_krylov_vecs // 2)
+        else:
+          sweep_krylov_vecs = num_krylov_vecs
       if initial_site == 0:
         self.position(0)
         #the part outside the loop covers the len(self)==1 case
-        energy = self._optimize_1s_local(
-            sweep_dir='right',
-            num_krylov_vecs=num_krylov_vecs,
-            tol=tol,
-            delta=delta,
-            ndiag=ndiag)
-
+        energy = optimize('right')
         initial_site += 1
         print_msg(site=0)
       while self.mps.center_position < len(self.mps) - 1:
-        #_optimize_1site_local shifts the center site internally
-        energy = self._optimize_1s_local(
-            sweep_dir='right',
-            num_krylov_vecs=num_krylov_vecs,
-            tol=tol,
-            delta=delta,
-            ndiag=ndiag)
-
+        energy = optimize('right')
         print_msg(site=self.mps.center_position - 1)
       #prepare for right sweep: move center all the way to the right
       self.position(len(self.mps) - 1)
       while self.mps.center_position > 0:
-        #_optimize_1site_local shifts the center site internally
-        energy = self._optimize_1s_local(
-            sweep_dir='left',
-            num_krylov_vecs=num_krylov_vecs,
-            tol=tol,
-            delta=delta,
-            ndiag=ndiag)
-
+        energy = optimize('left')
         print_msg(site=self.mps.center_position + 1)
 
-      if np.abs(final_energy - energy) < precision:
+      sweep_energy_change = np.abs(final_energy - energy)
+      if sweep_energy_change < precision:
         converged = True
       final_energy = energy
+      self.energy = energy
+      self.completed_sweeps += 1
+      if checkpoint_path is not None:
+        self.checkpoint(checkpoint_path, blocking=False)
       iteration += 1
       if iteration > num_sweeps:
         if verbose > 0:
@@ -340,8 +595,197 @@ class BaseDMRG:
           print("dmrg did not converge to desired precision {0} "
                 "after {1} iterations".format(precision, num_sweeps))
         break
+    self._wait_for_checkpoint()
     return final_energy
 
+  def _jitted_half_sweep(self, sweep, mpo_stacks, sweep_dir, num_krylov_vecs,
+                         delta) -> Tensor:
+    """
+    Optimize all sites of a sweep from left to right (`sweep_dir='right'`)
+    or from right to left (`sweep_dir='left'`) using the jitted kernel
+    `sweep`. Consecutive sites whose tensors have identical shapes are
+    optimized in a single call of `sweep`; environments are passed as
+    stacked arrays.
+    Returns:
+      The local energy of the last optimized site.
+    """
+    import jax.numpy as jnp  # pylint: disable=import-outside-toplevel
+    N = len(self.mps)
+    right = sweep_dir == 'right'
+    if right:
+      sites = list(range(N - 1))
+      step = 1
+      envs, other_envs = self.left_envs, self.right_envs
+    else:
+      sites = list(reversed(range(1, N)))
+      step = -1
+      envs, other_envs = self.right_envs, self.left_envs
+
+    def key(site):
+      shape = tuple(self.mps.tensors[site].shape)
+      mpo_shape = tuple(self.mpo.tensors[site].shape)
+      uniform = (shape[0] == shape[2] and mpo_shape[0] == mpo_shape[1] and
+                 shape == tuple(self.mps.tensors[site + step].shape))
+      # sites which cannot be scanned over get a unique key
+      return (shape, mpo_shape) if uniform else site
+
+    runs = []
+    for site in sites:
+      if runs and key(site) == key(runs[-1][-1]):
+        runs[-1].append(site)
+      else:
+        runs.append([site])
+
+    energy = None
+    for run in runs:
+      ordered = sorted(run)
+      if tuple(ordered) not in mpo_stacks:
+        mpo_stacks[tuple(ordered)] = jnp.stack(
+            [self.mpo.tensors[site] for site in ordered])
+      (_, center), (tensors, new_envs, energies) = sweep(
+          envs[run[0]], self.mps.tensors[run[0]], mpo_stacks[tuple(ordered)],
+          jnp.stack([other_envs[site] for site in ordered]),
+          jnp.stack([self.mps.tensors[site + step] for site in ordered]),
+          num_krylov_vecs, delta, right)
+      for n, site in enumerate(ordered):
+        self.mps.tensors[site] = tensors[n]
+        envs[site + step] = new_envs[n]
+      self.mps.tensors[run[-1] + step] = center
+      self.mps.center_position = run[-1] + step
+      energy = energies[-1] if right else energies[0]
+    return energy
+
+  def run_one_site_jitted(self,
+                          num_sweeps=4,
+                          precision=1E-6,
+                          num_krylov_vecs=10,
+                          verbose=0,
+                          delta=1E-6) -> np.number:
+    """
+    Run a single-site DMRG optimization of the MPS with a jitted sweep
+    kernel (`jax` backend only).
+
+    Unlike `run_one_site`, which calls the (jitted) Lanczos solver once per
+    site and computes decompositions and environments between calls,
+    consecutive sites with identical tensor shapes (e.g. the bulk of an
+    mps with uniform bond dimension) are optimized by a single jitted
+    `jax.lax.scan`, with environments kept in stacked arrays. Sites with
+    non-uniform shapes (e.g. close to the boundaries) are optimized by
+    individual calls to the same kernel. Each local optimization
+    uses `num_krylov_vecs` Lanczos steps without reorthogonalization.
+    `orthogonal_to` is not supported.
+
+    Args:
+      num_sweeps: Number of DMRG sweeps. A sweep optimizes all sites
+        starting at the left side, moving to the right side, and back
+        to the left side.
+      precision: The desired precision of the energy. If `precision` is
+        reached, optimization is terminated.
+      num_krylov_vecs: Krylov space dimension used in the local Lanczos
+        solver.
+      verbose: Verbosity flag. Us`verbose=0` to suppress any output.
+        Larger values print the energy after each sweep.
+      delta: Convergence parameter of the local Lanczos solver to
+        determine if an invariant subspace has been found.
+    Returns:
+      float: The energy upon termination of `run_one_site_jitted`.
+    Raises:
+      ValueError: If the backend is not `jax` or `BaseDMRG.orthogonal_to` is
+        not empty.
+    """
+    if self.backend.name != 'jax':
+      raise ValueError("run_one_site_jitted requires the jax backend, "
+                       "got backend '{}'".format(self.backend.name))
+    if self.orthogonal_to:
+      raise ValueError("run_one_site_jitted does not support `orthogonal_to`,"
+                       " use `run_one_site` instead")
+    if num_sweeps == 0:
+      return self.compute_energy()
+    if len(self.mps) == 1:
+      return self.run_one_site(
+          num_sweeps=num_sweeps,
+          precision=precision,
+          num_krylov_vecs=num_krylov_vecs,
+          verbose=verbose,
+          delta=delta)
+    if "dmrg_sweep" not in _CACHED_FUNCTIONS:
+      import jax  # pylint: disable=import-outside-toplevel
+      from tensornetwork.backends.jax import jitted_functions  # pylint: disable=import-outside-toplevel
+      _CACHED_FUNCTIONS["dmrg_sweep"] = (
+          jitted_functions._generate_jitted_dmrg_sweep(jax))
+    sweep = _CACHED_FUNCTIONS["dmrg_sweep"]
+    mpo_stacks = {}
+
+    self.mps.position(0)  #move center position to the left end
+    self.compute_right_envs()
+    final_energy = 1E100
+    for iteration in range(1, num_sweeps + 1):
+      self._jitted_half_sweep(sweep, mpo_stacks, 'right', num_krylov_vecs,
+                              delta)
+      energy = self._jitted_half_sweep(sweep, mpo_stacks, 'left',
+                                       num_krylov_vecs, delta)
+      if verbose > 0:
+        print(f"SS-DMRG sweep={iteration}/{num_sweeps}: E={energy}")
+      self.energy = energy
+      self.completed_sweeps += 1
+      converged = np.abs(final_energy - energy) < precision
+      final_energy = energy
+      if converged:
+        break
+    else:
+      if verbose > 0:
+        print("dmrg did not converge to desired precision {0} "
+              "after {1} iterations".format(precision, num_sweeps))
+    return final_energy
+
+  def checkpoint(self, path: str, blocking: bool = True) -> None:
+    """
+    Save the state of the simulation (mps, mpo, `completed_sweeps` and
+    `energy`) to an hdf5 file at `path`.
+    The data is first written to a temporary file which then replaces
+    `path`, such that an existing checkpoint is never left in a corrupted
+    state. Environments are not saved, they are recomputed from the
+    mps when the optimization is continued.
+    Args:
+      path: path to file where the checkpoint is saved.
+      blocking: If `False`, the file is written in a background thread
+        after a snapshot of all tensors has been taken, and the method
+        returns immediately. Subsequent checkpoints wait for pending ones
+        to finish.
+    """
+    self._wait_for_checkpoint()
+    data = {
+        'name': self.name,
+        'completed_sweeps': self.completed_sweeps,
+        'energy': self.energy,
+        'mps': self.mps._mps_data(),
+        'mpo': [np.array(tensor) for tensor in self.mpo.tensors],
+    }
+    if blocking:
+      _write_checkpoint(path, data)
+      return
+
+    def write():
+      try:
+        _write_checkpoint(path, data)
+      except Exception as error:  # pylint: disable=broad-except
+        self._checkpoint_error = error
+
+    self._checkpoint_thread = threading.Thread(target=write, daemon=True)
+    self._checkpoint_thread.start()
+
+  def _wait_for_checkpoint(self) -> None:
+    """
+    Wait for a pending checkpoint to be written and re-raise any
+    exception which occurred while writing it.
+    """
+    if self._checkpoint_thread is not None:
+      self._checkpoint_thread.join()
+      self._checkpoint_thread = None
+    if self._checkpoint_error is not None:
+      error, self._checkpoint_error = self._checkpoint_error, None
+      raise error
+
   def compute_energy(self):
     self.mps.position(0)  #move center position to the left end
     self.compute_right_envs()
@@ -375,3 +819,52 @@ class FiniteDMRG(BaseDMRG):
     rb = mps.backend.ones(rshape, dtype=mps.dtype)
     super().__init__(
         mps=mps, mpo=mpo, left_boundary=lb, right_boundary=rb, name=name)
+
+  @classmethod
+  def restore(cls,
+              path: str,
+              backend: Optional[Union[AbstractBackend, Text]] = None
+             ) -> "FiniteDMRG":
+    """
+    Restore a simulation from a checkpoint written by
+    `BaseDMRG.checkpoint`. Environments are recomputed by the next call
+    to `run_one_site` (or `run_one_site_jitted`), which runs `num_sweeps`
+    sweeps in addition to the `completed_sweeps` of the checkpointed
+    simulation.
+    Args:
+      path: path to file where the checkpoint is saved.
+      backend: An optional backend. Defaults to the backend of the
+        checkpointed simulation.
+    Returns:
+      FiniteDMRG: The restored simulation.
+    """
+    import h5py  # pylint: disable=import-outside-toplevel
+    with h5py.File(path, 'r') as checkpoint_file:
+      mps_data = _read_mps_data(checkpoint_file['mps'])
+      mpo_group = checkpoint_file['mpo']
+      mpo_tensors = [mpo_group[str(site)][()] for site in range(len(mpo_group))]
+      attrs = dict(checkpoint_file.attrs)
+
+    mps = FiniteMPS._from_mps_data(mps_data, backend)
+    mpo = FiniteMPO(mpo_tensors, backend=mps.backend)
+    dmrg = cls(mps, mpo, name=attrs['name'])
+    dmrg.completed_sweeps = int(attrs['completed_sweeps'])
+    if 'energy' in attrs:
+      dmrg.energy = attrs['energy']
+    return dmrg
+
+
+def _write_checkpoint(path: str, data: Dict[Text, Any]) -> None:
+  """Write the output of `BaseDMRG.checkpoint` to an hdf5 file."""
+  tmp_path = path + '.tmp'
+  import h5py  # pylint: disable=import-outside-toplevel
+  with h5py.File(tmp_path, 'w') as checkpoint_file:
+    checkpoint_file.attrs['name'] = data['name']
+    checkpoint_file.attrs['completed_sweeps'] = data['completed_sweeps']
+    if data['energy'] is not None:
+      checkpoint_file.attrs['energy'] = np.array(data['energy'])
+    _write_mps_data(checkpoint_file.create_group('mps'), data['mps'])
+    mpo_group = checkpoint_file.create_group('mpo')
+    for site, tensor in enumerate(data['mpo']):
+      mpo_group.create_dataset(str(site), data=tensor, chunks=True)
+  os.replace(tmp_path, path)
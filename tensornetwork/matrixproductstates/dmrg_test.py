@@ -157,6 +157,37 @@ def test_compute_envs(backend_dtype_values):
                              sorted(list(dmrg.right_envs.keys())))
 
 
+def test_add_layer_into_buffer(backend_dtype_values):
+  backend = backend_factory.get_backend(backend_dtype_values[0])
+  dtype = backend_dtype_values[1]
+
+  N = 6
+  D = 4
+  mpo = FiniteXXZ(
+      np.ones(N - 1), np.ones(N - 1), np.zeros(N), dtype=dtype, backend=backend)
+  mps = FiniteMPS.random([2] * N, [D] * (N - 1), dtype=dtype, backend=backend)
+  dmrg = BaseDMRG(mps, mpo, np.ones((1, 1, 1), dtype=dtype),
+                  np.ones((1, 1, 1), dtype=dtype), 'name')
+  A = mps.tensors[2]
+  W = mpo.tensors[2]
+  L = backend.randn((W.shape[0], D, D), dtype=dtype, seed=10)
+  R = backend.randn((W.shape[1], D, D), dtype=dtype, seed=11)
+
+  expected = dmrg.add_left_layer(L, A, W)
+  out = backend.zeros(tuple(expected.shape), dtype=dtype)
+  actual = dmrg.add_left_layer(L, A, W, out=out)
+  np.testing.assert_allclose(actual, expected)
+  if backend.supports_inplace:
+    np.testing.assert_allclose(out, expected)
+
+  expected = dmrg.add_right_layer(R, A, W)
+  out = backend.zeros(tuple(expected.shape), dtype=dtype)
+  actual = dmrg.add_right_layer(R, A, W, out=out)
+  np.testing.assert_allclose(actual, expected)
+  if backend.supports_inplace:
+    np.testing.assert_allclose(out, expected)
+
+
 @pytest.mark.parametrize("N", [4, 6, 7])
 def test_finite_DMRG_init(backend_dtype_values, N):
   np.random.seed(16)
@@ -206,3 +237,247 @@ def test_finite_DMRG_outstream(backend_dtype_values, capsys):
       for m in [0, 1, 2, 3, 4, 5, 4, 3, 2, 1]
   ])
   assert act == exp
+
+
+def test_finite_DMRG_adaptive(backend_dtype_values):
+  np.random.seed(16)
+  N = 8
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  H = get_XXZ_Hamiltonian(N, 1, 1, 1)
+  eta, _ = np.linalg.eigh(H)
+  num_matvecs = {}
+  for adaptive in [False, True]:
+    mpo = FiniteXXZ(
+        Jz=np.ones(N - 1),
+        Jxy=np.ones(N - 1),
+        Bz=np.zeros(N),
+        dtype=dtype,
+        backend=backend)
+    mps = FiniteMPS.random([2] * N, [16] * (N - 1),
+                           dtype=dtype,
+                           backend=backend)
+    dmrg = FiniteDMRG(mps, mpo)
+    energy = dmrg.run_one_site(
+        num_sweeps=10,
+        num_krylov_vecs=20,
+        precision=1E-10,
+        tol=1E-12,
+        adaptive=adaptive)
+    np.testing.assert_allclose(energy, eta[0])
+    stats = dmrg.solver_stats
+    assert [s['site'] for s in stats[:2 * N - 2]
+           ] == list(range(N - 1)) + list(reversed(range(1, N)))
+    assert stats[0]['num_krylov_vecs'] == (10 if adaptive else 20)
+    assert stats[0]['tol'] == (1E-2 if adaptive else 1E-12)
+    if not adaptive:
+      assert not any(s['skipped'] for s in stats)
+    if backend != 'jax':
+      num_matvecs[adaptive] = sum(s['num_matvecs'] for s in stats)
+  if backend != 'jax':
+    assert num_matvecs[True] < num_matvecs[False]
+
+
+def test_finite_DMRG_num_matvecs_jitting_backend():
+  #pylint: disable=import-outside-toplevel
+  from tensornetwork.backends.numpy.numpy_backend import NumPyBackend
+
+  class JittingBackend(NumPyBackend):
+    supports_jit = True
+
+  np.random.seed(16)
+  N = 6
+  for backend in [NumPyBackend(), JittingBackend()]:
+    mpo = FiniteXXZ(
+        Jz=np.ones(N - 1),
+        Jxy=np.ones(N - 1),
+        Bz=np.zeros(N),
+        dtype=np.float64,
+        backend=backend)
+    mps = FiniteMPS.random([2] * N, [8] * (N - 1),
+                           dtype=np.float64,
+                           backend=backend)
+    dmrg = FiniteDMRG(mps, mpo)
+    dmrg.run_one_site(num_sweeps=1, num_krylov_vecs=10)
+    num_matvecs = [s['num_matvecs'] for s in dmrg.solver_stats]
+    if backend.supports_jit:
+      # matvecs of jitted solvers are not counted
+      assert all(n is None for n in num_matvecs)
+    else:
+      assert all(n > 0 for n in num_matvecs)
+
+
+def test_finite_DMRG_excited_states(backend_dtype_values):
+  np.random.seed(16)
+  N = 6
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  H = get_XXZ_Hamiltonian(N, 1, 1, 1)
+  eta, _ = np.linalg.eigh(H)
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=dtype,
+      backend=backend)
+  states = []
+  for n in range(3):
+    mps = FiniteMPS.random([2] * N, [8] * (N - 1), dtype=dtype, backend=backend)
+    dmrg = FiniteDMRG(mps, mpo)
+    energy = dmrg.run_one_site(
+        num_sweeps=10,
+        num_krylov_vecs=20,
+        precision=1E-12,
+        tol=1E-12,
+        orthogonal_to=states)
+    np.testing.assert_allclose(energy, eta[n])
+    mps.position(0)
+    mps.tensors[0] /= mps.norm(mps.tensors[0])
+    for state in states:
+      np.testing.assert_allclose(np.abs(mps.inner(state)), 0.0, atol=1E-6)
+    states.append(mps)
+
+
+def test_finite_DMRG_orthogonal_to_raises():
+  N = 6
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=np.float64,
+      backend='numpy')
+  mps = FiniteMPS.random([2] * N, [8] * (N - 1),
+                         dtype=np.float64,
+                         backend='numpy')
+  dmrg = FiniteDMRG(mps, mpo)
+  state = FiniteMPS.random([2] * (N - 1), [8] * (N - 2),
+                           dtype=np.float64,
+                           backend='numpy')
+  with pytest.raises(ValueError):
+    dmrg.run_one_site(orthogonal_to=[state])
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_finite_DMRG_jitted(dtype):
+  np.random.seed(16)
+  N = 10
+  # bond dimensions grow from the boundaries up to 8 in the bulk, such
+  # that both single-site and scanned kernel calls are used
+  tensors = FiniteMPS.random([2] * N, [8] * (N - 1),
+                             dtype=dtype,
+                             backend='numpy').tensors
+  energies = {}
+  for backend in ['numpy', 'jax']:
+    mpo = FiniteXXZ(
+        Jz=np.ones(N - 1),
+        Jxy=np.ones(N - 1),
+        Bz=np.zeros(N),
+        dtype=dtype,
+        backend=backend)
+    mps = FiniteMPS([np.array(t) for t in tensors], backend=backend)
+    dmrg = FiniteDMRG(mps, mpo)
+    if backend == 'numpy':
+      energies[backend] = dmrg.run_one_site(num_sweeps=4, num_krylov_vecs=10)
+    else:
+      energies[backend] = dmrg.run_one_site_jitted(
+          num_sweeps=4, num_krylov_vecs=10)
+  np.testing.assert_allclose(energies['jax'], energies['numpy'], rtol=1E-10)
+  assert dmrg.mps.center_position == 0
+  for site in range(1, N):
+    np.testing.assert_allclose(
+        dmrg.right_envs[site - 1],
+        dmrg.add_right_layer(dmrg.right_envs[site], dmrg.mps.tensors[site],
+                             dmrg.mpo.tensors[site]),
+        atol=1E-10)
+
+
+def test_finite_DMRG_jitted_raises():
+  N = 6
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=np.float64,
+      backend='numpy')
+  mps = FiniteMPS.random([2] * N, [8] * (N - 1),
+                         dtype=np.float64,
+                         backend='numpy')
+  with pytest.raises(ValueError):
+    FiniteDMRG(mps, mpo).run_one_site_jitted()
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=np.float64,
+      backend='jax')
+  mps = FiniteMPS.random([2] * N, [8] * (N - 1),
+                         dtype=np.float64,
+                         backend='jax')
+  dmrg = FiniteDMRG(mps, mpo)
+  dmrg.set_orthogonal_to([
+      FiniteMPS.random([2] * N, [8] * (N - 1),
+                       dtype=np.float64,
+                       backend='jax')
+  ])
+  with pytest.raises(ValueError):
+    dmrg.run_one_site_jitted()
+
+
+def test_finite_DMRG_checkpoint_restore(tmp_path):
+  np.random.seed(16)
+  N = 8
+  backend, dtype = 'numpy', np.float64
+  H = get_XXZ_Hamiltonian(N, 1, 1, 1)
+  eta, _ = np.linalg.eigh(H)
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=dtype,
+      backend=backend)
+  mps = FiniteMPS.random([2] * N, [16] * (N - 1), dtype=dtype, backend=backend)
+  dmrg = FiniteDMRG(mps, mpo, name='checkpointed')
+  path = str(tmp_path / 'dmrg.h5')
+  energy = dmrg.run_one_site(
+      num_sweeps=2, num_krylov_vecs=10, checkpoint_path=path)
+  assert dmrg.completed_sweeps == 2
+
+  restored = FiniteDMRG.restore(path)
+  assert restored.name == 'checkpointed'
+  assert restored.completed_sweeps == 2
+  np.testing.assert_allclose(restored.energy, energy)
+  assert restored.mps.center_position == dmrg.mps.center_position
+  for n in range(N):
+    np.testing.assert_allclose(restored.mps.tensors[n], dmrg.mps.tensors[n])
+    np.testing.assert_allclose(restored.mpo.tensors[n], dmrg.mpo.tensors[n])
+
+  energy = restored.run_one_site(num_sweeps=4, num_krylov_vecs=10)
+  np.testing.assert_allclose(energy, eta[0])
+  assert restored.completed_sweeps > 2
+
+
+def test_finite_DMRG_checkpoint_async(tmp_path):
+  np.random.seed(16)
+  N = 6
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=np.float64,
+      backend='numpy')
+  mps = FiniteMPS.random([2] * N, [8] * (N - 1),
+                         dtype=np.float64,
+                         backend='numpy')
+  dmrg = FiniteDMRG(mps, mpo)
+  path = str(tmp_path / 'dmrg.h5')
+  dmrg.checkpoint(path, blocking=False)
+  tensors = list(dmrg.mps.tensors)
+  # modifying the simulation does not affect the pending checkpoint
+  dmrg.mps.tensors[0] = 2 * dmrg.mps.tensors[0]
+  dmrg._wait_for_checkpoint()
+  restored = FiniteDMRG.restore(path)
+  for n in range(N):
+    np.testing.assert_allclose(restored.mps.tensors[n], tensors[n])
+  with pytest.raises(OSError):
+    dmrg.checkpoint(str(tmp_path / 'missing' / 'dmrg.h5'), blocking=False)
+    dmrg._wait_for_checkpoint()
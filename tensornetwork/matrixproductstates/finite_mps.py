@@ -14,12 +14,12 @@
 import numpy as np
 import functools
 
-from tensornetwork.network_components import Node, contract_between
 from tensornetwork.backends import backend_factory
-from tensornetwork.linalg.linalg import conj
-from typing import Any, List, Optional, Text, Type, Union, Dict, Sequence
+from typing import Any, List, Optional, Text, Type, Union, Dict, Sequence, Tuple
 from tensornetwork.matrixproductstates.base_mps import BaseMPS
+from tensornetwork.matrixproductstates.mpo import FiniteMPO
 from tensornetwork.backends.abstract_backend import AbstractBackend
+from tensornetwork.ncon_interface import ncon
 Tensor = Any
 
 
@@ -170,6 +170,10 @@ class FiniteMPS(BaseMPS):
     dict `left_envs` mapping sites (int) to Tensors. `left_envs[site]` is the
     left-reduced density matrix to the left of site `site`.
 
+    Reduced density matrices to the right of `center_position` are cached.
+    Only those which depend on tensors that changed since the last call
+    are recomputed.
+
     Args:
       sites (list of int): A list of sites of the MPS.
     Returns:
@@ -198,49 +202,37 @@ class FiniteMPS(BaseMPS):
     left_sites = sites[sites <= center_position]
     left_envs = {}
     for site in left_sites:
-      left_envs[site] = Node(
-          self.backend.eye(N=self.tensors[site].shape[0], dtype=self.dtype),
-          backend=self.backend)
+      left_envs[site] = self.backend.eye(
+          N=self.tensors[site].shape[0], dtype=self.dtype)
 
     # left reduced density matrices at sites > center_position
-    # have to be calculated from a network contraction
+    # have to be calculated from a network contraction. `_left_envs_cache`
+    # always holds the environments of a contiguous range of sites
+    # starting at `center_position + 1`.
     if n2 > center_position:
-      nodes = {}
-      conj_nodes = {}
-      for site in range(center_position, n2):
-        nodes[site] = Node(self.tensors[site], backend=self.backend)
-        conj_nodes[site] = conj(nodes[site])
-
-      nodes[center_position][0] ^ conj_nodes[center_position][0]
-      nodes[center_position][1] ^ conj_nodes[center_position][1]
-
-      for site in range(center_position + 1, n2):
-        nodes[site][0] ^ nodes[site - 1][2]
-        conj_nodes[site][0] ^ conj_nodes[site - 1][2]
-        nodes[site][1] ^ conj_nodes[site][1]
-
-      edges = {site: node[2] for site, node in nodes.items()}
-      conj_edges = {site: node[2] for site, node in conj_nodes.items()}
-
-      left_env = contract_between(nodes[center_position],
-                                  conj_nodes[center_position])
-      left_env.reorder_edges(
-          [edges[center_position], conj_edges[center_position]])
-      if center_position + 1 in sites:
-        left_envs[center_position + 1] = left_env
-      for site in range(center_position + 1, n2):
-        left_env = contract_between(left_env, nodes[site])
-        left_env = contract_between(left_env, conj_nodes[site])
-        if site + 1 in sites:
-          left_env.reorder_edges([edges[site], conj_edges[site]])
-          left_envs[site + 1] = left_env
-    return {k: v.tensor for k, v in left_envs.items()}
+      cache = self._left_envs_cache
+      site = center_position
+      left_env = self.backend.eye(
+          N=self.tensors[site].shape[0], dtype=self.dtype)
+      while site + 1 in cache:
+        site += 1
+        left_env = cache[site]
+      for n in range(site, n2):
+        left_env = self.apply_transfer_operator(n, 'left', left_env)
+        cache[n + 1] = left_env
+      for site in sites[sites > center_position]:
+        left_envs[site] = cache[site]
+    return left_envs
 
   def right_envs(self, sites: Sequence[int]) -> Dict:
     """Compute right reduced density matrices for site `sites. This returns a
     dict `right_envs` mapping sites (int) to Tensors. `right_envs[site]` is the
     right-reduced density matrix to the right of site `site`.
 
+    Reduced density matrices to the left of `center_position` are cached.
+    Only those which depend on tensors that changed since the last call
+    are recomputed.
+
     Args:
       sites (list of int): A list of sites of the MPS.
     Returns:
@@ -269,43 +261,513 @@ class FiniteMPS(BaseMPS):
     right_sites = sites[sites >= center_position]
     right_envs = {}
     for site in right_sites:
-      right_envs[site] = Node(
-          self.backend.eye(N=self.tensors[site].shape[2], dtype=self.dtype),
-          backend=self.backend)
+      right_envs[site] = self.backend.eye(
+          N=self.tensors[site].shape[2], dtype=self.dtype)
 
     # right reduced density matrices at sites < center_position
-    # have to be calculated from a network contraction
+    # have to be calculated from a network contraction. `_right_envs_cache`
+    # always holds the environments of a contiguous range of sites
+    # ending at `center_position - 1`.
     if n1 < center_position:
-      nodes = {}
-      conj_nodes = {}
-      for site in reversed(range(n1 + 1, center_position + 1)):
-        nodes[site] = Node(self.tensors[site], backend=self.backend)
-        conj_nodes[site] = conj(nodes[site])
-
-      nodes[center_position][2] ^ conj_nodes[center_position][2]
-      nodes[center_position][1] ^ conj_nodes[center_position][1]
-
-      for site in reversed(range(n1 + 1, center_position)):
-        nodes[site][2] ^ nodes[site + 1][0]
-        conj_nodes[site][2] ^ conj_nodes[site + 1][0]
-        nodes[site][1] ^ conj_nodes[site][1]
-
-      edges = {site: node[0] for site, node in nodes.items()}
-      conj_edges = {site: node[0] for site, node in conj_nodes.items()}
-
-      right_env = contract_between(nodes[center_position],
-                                   conj_nodes[center_position])
-      if center_position - 1 in sites:
-        right_env.reorder_edges(
-            [edges[center_position], conj_edges[center_position]])
-        right_envs[center_position - 1] = right_env
-      for site in reversed(range(n1 + 1, center_position)):
-        right_env = contract_between(right_env, nodes[site])
-        right_env = contract_between(right_env, conj_nodes[site])
-        if site - 1 in sites:
-          right_env.reorder_edges([edges[site], conj_edges[site]])
-          right_envs[site - 1] = right_env
-    return {k: v.tensor for k, v in right_envs.items()}
-
-  def save(self, path: str):
-    raise NotImplementedError()
+      cache = self._right_envs_cache
+      site = center_position
+      right_env = self.backend.eye(
+          N=self.tensors[site].shape[2], dtype=self.dtype)
+      while site - 1 in cache:
+        site -= 1
+        right_env = cache[site]
+      for n in reversed(range(n1 + 1, site + 1)):
+        right_env = self.apply_transfer_operator(n, 'right', right_env)
+        cache[n - 1] = right_env
+      for site in sites[sites < center_position]:
+        right_envs[site] = cache[site]
+    return right_envs
+
+  def _copy(self) -> "FiniteMPS":
+    """Return a shallow copy of the `FiniteMPS` in the same gauge."""
+    mps = self.__class__(
+        list(self.tensors), canonicalize=False, backend=self.backend)
+    mps.center_position = self.center_position
+    return mps
+
+  def _svd_truncation_sweep(self, max_singular_values: Optional[int],
+                            max_truncation_err: Optional[float]) -> None:
+    """Truncate all bonds of a left-canonical `FiniteMPS` (i.e. with
+    `center_position == len(self) - 1`) using a sweep of SVDs from right
+    to left. Upon return `center_position` is 0. The norm of the state
+    is not changed other than by truncation.
+    """
+    for site in reversed(range(1, len(self))):
+      U, S, V, _ = self.backend.svd(
+          self.tensors[site],
+          pivot_axis=1,
+          max_singular_values=max_singular_values,
+          max_truncation_error=max_truncation_err,
+          relative=True)
+      self.tensors[site] = V
+      self.tensors[site - 1] = ncon(
+          [self.tensors[site - 1], U, self.backend.diagflat(S)],
+          [[-1, -2, 1], [1, 2], [2, -3]],
+          backend=self.backend.name)
+    self.center_position = 0
+
+  def apply_mpo(self,
+                mpo: FiniteMPO,
+                method: Text = 'zipup',
+                max_singular_values: Optional[int] = None,
+                max_truncation_err: Optional[float] = None,
+                num_sweeps: int = 2) -> "FiniteMPS":
+    """Apply a `FiniteMPO` to the `FiniteMPS` and return the result as a
+    new `FiniteMPS`. The bond dimensions of the result are controlled
+    by `max_singular_values` and `max_truncation_err`, such that the
+    bond dimension `D * w` of the exact product never has to be
+    formed explicitly (`D` and `w` are the bond dimensions of the MPS
+    and the MPO). The state itself is left unchanged.
+
+    Available methods are:
+      * `'zipup'`: The MPO is "zipped" into the (right-canonical) MPS in
+        a single sweep of SVDs, followed by a sweep of truncating SVDs.
+        Fast, but truncations in the first sweep are not optimal.
+      * `'density_matrix'`: The bonds are truncated optimally using
+        reduced density matrices of the exact product state.
+        Most accurate, but more costly than `'zipup'`.
+      * `'variational'`: Starting from the result of `'zipup'`,
+        the distance to the exact product is minimized with
+        `num_sweeps` sweeps of single-site updates.
+
+    Args:
+      mpo: The `FiniteMPO` to be applied.
+      method: The method used to apply `mpo`, one of
+        `'zipup'`, `'density_matrix'` or `'variational'`.
+      max_singular_values: The maximum bond dimension of the result.
+      max_truncation_err: The maximum allowed truncation error per bond,
+        relative to the largest singular value.
+      num_sweeps: Number of sweeps for `method='variational'`.
+    Returns:
+      FiniteMPS: The result in canonical form with `center_position = 0`.
+        The result is not normalized.
+    Raises:
+      ValueError: If `method` is unknown or `mpo` has a different length.
+    """
+    if len(mpo) != len(self):
+      raise ValueError("len(mpo) = {} is different from len(mps) = {}".format(
+          len(mpo), len(self)))
+    if mpo.backend.name != self.backend.name:
+      raise TypeError("mps and mpo use different backends.")
+    if method == 'zipup':
+      return self._apply_mpo_zipup(mpo, max_singular_values,
+                                   max_truncation_err)
+    if method == 'density_matrix':
+      return self._apply_mpo_density_matrix(mpo, max_singular_values,
+                                            max_truncation_err)
+    if method == 'variational':
+      result = self._apply_mpo_zipup(mpo, max_singular_values,
+                                     max_truncation_err)
+      result._fit_mpo_product(self, mpo, num_sweeps)
+      return result
+    raise ValueError("unknown value {} for `method`".format(method))
+
+  def _apply_mpo_zipup(self, mpo: FiniteMPO,
+                       max_singular_values: Optional[int],
+                       max_truncation_err: Optional[float]) -> "FiniteMPS":
+    mps = self._copy()
+    if mps.center_position is None:
+      mps.canonicalize(normalize=False)
+    mps.position(0, normalize=False)
+
+    # C has index order (new bond, mps bond, mpo bond)
+    C = self.backend.ones((1, 1, 1), dtype=self.dtype)
+    tensors = []
+    for site in range(len(self)):
+      T = ncon([C, mps.tensors[site], mpo.tensors[site]],
+               [[-1, 1, 2], [1, 3, -4], [2, -3, -2, 3]],
+               backend=self.backend.name)
+      if site == len(self) - 1:
+        shape = tuple(T.shape)
+        tensors.append(self.backend.reshape(T, shape[:2] + (1,)))
+        break
+      U, S, V, _ = self.backend.svd(
+          T,
+          pivot_axis=2,
+          max_singular_values=max_singular_values,
+          max_truncation_error=max_truncation_err,
+          relative=True)
+      tensors.append(U)
+      C = ncon([self.backend.diagflat(S), V], [[-1, 1], [1, -3, -2]],
+               backend=self.backend.name)
+
+    result = self.__class__(tensors, canonicalize=False, backend=self.backend)
+    result.center_position = len(result) - 1
+    result._svd_truncation_sweep(max_singular_values, max_truncation_err)
+    return result
+
+  def _apply_mpo_density_matrix(
+      self, mpo: FiniteMPO, max_singular_values: Optional[int],
+      max_truncation_err: Optional[float]) -> "FiniteMPS":
+    N = len(self)
+    # right environments of the norm-network of the product state,
+    # with index order (mps bond, mpo bond, conj mps bond, conj mpo bond)
+    right_envs = {N - 1: self.backend.ones((1, 1, 1, 1), dtype=self.dtype)}
+    for site in reversed(range(1, N)):
+      A = self.tensors[site]
+      W = mpo.tensors[site]
+      right_envs[site - 1] = ncon(
+          [A, W, right_envs[site],
+           self.backend.conj(A),
+           self.backend.conj(W)],
+          [[-1, 1, 2], [-2, 3, 4, 1], [2, 3, 5, 6], [-3, 7, 5], [-4, 6, 4, 7]],
+          backend=self.backend.name)
+
+    # C has index order (new bond, mps bond, mpo bond)
+    C = self.backend.ones((1, 1, 1), dtype=self.dtype)
+    tensors = []
+    for site in range(N):
+      T = ncon([C, self.tensors[site], mpo.tensors[site]],
+               [[-1, 1, 2], [1, 3, -3], [2, -4, -2, 3]],
+               backend=self.backend.name)
+      shape = tuple(T.shape)
+      if site == N - 1:
+        tensors.append(self.backend.reshape(T, shape[:2] + (1,)))
+        break
+      rho = ncon([T, right_envs[site], self.backend.conj(T)],
+                 [[-1, -2, 1, 2], [1, 2, 3, 4], [-3, -4, 3, 4]],
+                 backend=self.backend.name)
+      dim = shape[0] * shape[1]
+      eigvals, eigvecs = self.backend.eigh(
+          self.backend.reshape(rho, (dim, dim)))
+      # eigenvalues are in ascending order
+      weights = np.abs(np.array(eigvals))[::-1]
+      num_keep = dim
+      if max_singular_values is not None:
+        num_keep = min(num_keep, max_singular_values)
+      if max_truncation_err is not None and weights[0] > 0:
+        # the singular values of the product state are sqrt(weights)
+        trunc_errs = np.sqrt(np.cumsum(weights[::-1]))[::-1]
+        num_keep = min(
+            num_keep,
+            max(
+                np.count_nonzero(
+                    trunc_errs > max_truncation_err * np.sqrt(weights[0])),
+                1))
+      U = self.backend.slice(eigvecs, (0, dim - num_keep), (dim, num_keep))
+      B = self.backend.reshape(U, shape[:2] + (num_keep,))
+      tensors.append(B)
+      C = ncon([self.backend.conj(B), T], [[1, 2, -1], [1, 2, -2, -3]],
+               backend=self.backend.name)
+
+    result = self.__class__(tensors, canonicalize=False, backend=self.backend)
+    result.center_position = N - 1
+    result.position(0, normalize=False)
+    return result
+
+  def _fit_mpo_product(self, mps: "FiniteMPS", mpo: FiniteMPO,
+                       num_sweeps: int) -> None:
+    """Variationally minimize the distance between `self` and the product
+    of `mpo` and `mps` with single-site updates. `self` has to be in
+    canonical form with `center_position = 0`. Bond dimensions of
+    `self` are not changed.
+    """
+    N = len(self)
+    # environments of the overlap <self|mpo|mps>, with index order
+    # (self bond, mpo bond, mps bond)
+    left_envs = {0: self.backend.ones((1, 1, 1), dtype=self.dtype)}
+    right_envs = {N - 1: self.backend.ones((1, 1, 1), dtype=self.dtype)}
+
+    def add_left_layer(L, site):
+      return ncon([
+          L, mps.tensors[site], mpo.tensors[site],
+          self.backend.conj(self.tensors[site])
+      ], [[1, 2, 3], [3, 4, -3], [2, -2, 5, 4], [1, 5, -1]],
+                  backend=self.backend.name)
+
+    def add_right_layer(R, site):
+      return ncon([
+          mps.tensors[site], mpo.tensors[site], R,
+          self.backend.conj(self.tensors[site])
+      ], [[-3, 1, 2], [-2, 3, 4, 1], [5, 3, 2], [-1, 4, 5]],
+                  backend=self.backend.name)
+
+    def local_tensor(site):
+      return ncon([
+          left_envs[site], mps.tensors[site], mpo.tensors[site],
+          right_envs[site]
+      ], [[-1, 1, 2], [2, 3, 4], [1, 5, -2, 3], [-3, 5, 4]],
+                  backend=self.backend.name)
+
+    for site in reversed(range(1, N)):
+      right_envs[site - 1] = add_right_layer(right_envs[site], site)
+
+    for _ in range(num_sweeps):
+      for site in range(N - 1):
+        Q, R = self.qr(local_tensor(site))
+        self.tensors[site] = Q
+        self.tensors[site + 1] = ncon([R, self.tensors[site + 1]],
+                                      [[-1, 1], [1, -2, -3]],
+                                      backend=self.backend.name)
+        left_envs[site + 1] = add_left_layer(left_envs[site], site)
+      self.center_position = N - 1
+      for site in reversed(range(1, N)):
+        R, Q = self.rq(local_tensor(site))
+        self.tensors[site] = Q
+        self.tensors[site - 1] = ncon([self.tensors[site - 1], R],
+                                      [[-1, -2, 1], [1, -3]],
+                                      backend=self.backend.name)
+        right_envs[site - 1] = add_right_layer(right_envs[site], site)
+      self.tensors[0] = local_tensor(0)
+      self.center_position = 0
+
+  def _embeddings(self, dim1: int, dim2: int) -> List[Tensor]:
+    """Return the isometries of shape `(dim1 + dim2, dim1)` and
+    `(dim1 + dim2, dim2)` which embed two vector spaces into their direct
+    sum.
+    """
+    eye = self.backend.eye(dim1 + dim2, dtype=self.dtype)
+    return [
+        self.backend.slice(eye, (0, 0), (dim1 + dim2, dim1)),
+        self.backend.slice(eye, (0, dim1), (dim1 + dim2, dim2))
+    ]
+
+  def __add__(self, other: "FiniteMPS") -> "FiniteMPS":
+    """Add two `FiniteMPS` by embedding their tensors into
+    block-diagonal tensors. The bond dimensions of the result are the sums
+    of the bond dimensions of the summands. The result is not in canonical
+    form (i.e. its `center_position` is `None`); use `FiniteMPS.compress`
+    or `FiniteMPS.canonicalize` to bring it into canonical form.
+
+    Args:
+      other: A `FiniteMPS`.
+    Returns:
+      FiniteMPS: The sum of `self` and `other`.
+    Raises:
+      ValueError: If `self` and `other` have different physical dimensions.
+      TypeError: If `self` and `other` use different backends.
+    """
+    if not isinstance(other, FiniteMPS):
+      return NotImplemented
+    if self.physical_dimensions != other.physical_dimensions:
+      raise ValueError(
+          "cannot add MPS with physical dimensions {} and {}".format(
+              self.physical_dimensions, other.physical_dimensions))
+    if self.backend.name != other.backend.name:
+      raise TypeError("cannot add MPS with different backends.")
+    if len(self) == 1:
+      return self.__class__(
+          [self.backend.addition(self.tensors[0], other.tensors[0])],
+          canonicalize=False,
+          backend=self.backend)
+
+    tensors = []
+    for site, (A, B) in enumerate(zip(self.tensors, other.tensors)):
+      if site > 0:
+        left1, left2 = self._embeddings(A.shape[0], B.shape[0])
+        A = ncon([left1, A], [[-1, 1], [1, -2, -3]], backend=self.backend.name)
+        B = ncon([left2, B], [[-1, 1], [1, -2, -3]], backend=self.backend.name)
+      if site < len(self) - 1:
+        right1, right2 = self._embeddings(A.shape[2], B.shape[2])
+        A = ncon([A, right1], [[-1, -2, 1], [-3, 1]],
+                 backend=self.backend.name)
+        B = ncon([B, right2], [[-1, -2, 1], [-3, 1]],
+                 backend=self.backend.name)
+      tensors.append(self.backend.addition(A, B))
+    return self.__class__(tensors, canonicalize=False, backend=self.backend)
+
+  def inner(self, other: "FiniteMPS") -> Tensor:
+    """Compute the overlap `<self|other>` of two `FiniteMPS` with a single
+    sweep of transfer operators. The canonical forms of the states are not
+    used and not changed.
+
+    Args:
+      other: A `FiniteMPS`.
+    Returns:
+      Tensor: The (scalar) overlap.
+    Raises:
+      ValueError: If `self` and `other` have different physical dimensions.
+    """
+    if self.physical_dimensions != other.physical_dimensions:
+      raise ValueError(
+          "cannot compute overlap of MPS with physical dimensions {} and {}"
+          .format(self.physical_dimensions, other.physical_dimensions))
+    env = self.backend.ones((1, 1), dtype=self.dtype)
+    for A, B in zip(other.tensors, self.tensors):
+      env = self.left_transfer_operator(A, env, self.backend.conj(B))
+    return self.backend.trace(env)
+
+  def compress(self,
+               max_singular_values: Optional[int] = None,
+               max_truncation_err: Optional[float] = None,
+               method: Text = 'svd',
+               num_sweeps: int = 2) -> None:
+    """Compress the `FiniteMPS` in place by truncating its bond dimensions.
+    Upon return the state is in canonical form with `center_position = 0`.
+    The state is not normalized.
+
+    Available methods are:
+      * `'svd'`: A single sweep of truncating SVDs.
+      * `'variational'`: Starting from the result of `'svd'`, the distance
+        to the uncompressed state is minimized with `num_sweeps` sweeps of
+        single-site updates.
+
+    Args:
+      max_singular_values: The maximum bond dimension.
+      max_truncation_err: The maximum allowed truncation error per bond,
+        relative to the largest singular value.
+      method: The method used for compression, `'svd'` or `'variational'`.
+      num_sweeps: Number of sweeps for `method='variational'`.
+    Raises:
+      ValueError: If `method` is unknown.
+    """
+    if method not in ('svd', 'variational'):
+      raise ValueError("unknown value {} for `method`".format(method))
+    target = self._copy()
+    if self.center_position is None:
+      # a sweep of QR decompositions from the left boundary brings any
+      # MPS into left-canonical form
+      self.center_position = 0
+    self.position(len(self) - 1, normalize=False)
+    self._svd_truncation_sweep(max_singular_values, max_truncation_err)
+    if method == 'variational':
+      identities = [
+          self.backend.reshape(
+              self.backend.eye(d, dtype=self.dtype), (1, 1, d, d))
+          for d in self.physical_dimensions
+      ]
+      self._fit_mpo_product(target, FiniteMPO(identities, backend=self.backend),
+                            num_sweeps)
+
+  def sample(self,
+             num_samples: int,
+             basis: Optional[Union[Tensor, List[Tensor]]] = None,
+             seed: Optional[int] = None) -> np.ndarray:
+    """Draw samples of measurement outcomes from the `FiniteMPS` by
+    sequential conditional sampling, starting from the right-canonical
+    form with `center_position = 0`. All samples are drawn simultaneously,
+    i.e. each site is processed with a single batched contraction.
+    If `center_position != 0`, a copy of the state is canonicalized first;
+    the state itself is left unchanged.
+
+    Args:
+      num_samples: The number of samples.
+      basis: An optional measurement basis, given as a unitary matrix of
+        shape `(d, d)` whose columns are the basis states, or a list of
+        such matrices, one per site. Defaults to the computational basis.
+      seed: An optional seed for the random number generator of the
+        backend.
+    Returns:
+      np.ndarray: An integer array of shape `(num_samples, len(self))`
+        holding the indices of the sampled basis states.
+    Raises:
+      ValueError: If `basis` is a list of the wrong length.
+    """
+    N = len(self)
+    if basis is None:
+      bases = [None] * N
+    elif isinstance(basis, (list, tuple)):
+      if len(basis) != N:
+        raise ValueError("len(basis) = {} is different from len(mps) = {}"
+                         .format(len(basis), N))
+      bases = basis
+    else:
+      bases = [basis] * N
+
+    mps = self
+    if self.center_position != 0:
+      mps = self._copy()
+      if mps.center_position is None:
+        mps.canonicalize(normalize=False)
+      mps.position(0, normalize=False)
+
+    uniforms = np.array(
+        self.backend.random_uniform((num_samples, N), seed=seed))
+    samples = np.zeros((num_samples, N), dtype=np.int64)
+    rows = np.arange(num_samples)
+    # the left boundary vectors of all samples, one per row
+    vectors = self.backend.ones((num_samples, 1), dtype=self.dtype)
+    for site in range(N):
+      A = mps.tensors[site]
+      if bases[site] is not None:
+        U = self.backend.convert_to_tensor(bases[site])
+        A = ncon([self.backend.conj(U), A], [[1, -2], [-1, 1, -3]],
+                 backend=self.backend.name)
+      T = ncon([vectors, A], [[-1, 1], [1, -2, -3]],
+               backend=self.backend.name)
+      weights = np.array(
+          self.backend.einsum('skr,skr->sk', T, self.backend.conj(T)))
+      probabilities = np.real(weights)
+      cumulative = np.cumsum(probabilities, axis=1)
+      outcomes = np.count_nonzero(
+          cumulative < uniforms[:, site, None] * cumulative[:, -1, None],
+          axis=1)
+      outcomes = np.minimum(outcomes, probabilities.shape[1] - 1)
+      samples[:, site] = outcomes
+      # project onto the sampled outcomes and normalize
+      projector = np.zeros(weights.shape, dtype=weights.dtype)
+      projector[rows, outcomes] = 1.0 / np.sqrt(probabilities[rows, outcomes])
+      vectors = self.backend.einsum(
+          'sk,skr->sr', self.backend.convert_to_tensor(projector), T)
+    return samples
+
+  def entanglement_profile(
+      self, alphas: Sequence[float] = (1,)
+  ) -> Tuple[List[Tensor], Dict[float, np.ndarray]]:
+    """Compute the entanglement spectra and entropies of all bipartitions
+    of the `FiniteMPS`. Starting from `center_position`, the orthogonality
+    center is swept once to each boundary with SVDs, and the singular
+    values of each bond are read off from the SVD factors. The state itself
+    is left unchanged.
+
+    Args:
+      alphas: The orders of the Rényi entropies to be computed. `alpha = 1`
+        corresponds to the von Neumann entropy.
+    Returns:
+      List[Tensor]: The Schmidt coefficients (singular values of the
+        normalized state) of the bonds `0, ..., len(self) - 2`, where bond
+        `n` connects sites `n` and `n + 1`.
+      Dict[float, np.ndarray]: A dict mapping each `alpha` to an array of
+        length `len(self) - 1` holding the entropies of all bonds.
+    """
+    mps = self
+    if self.center_position is None:
+      mps = self._copy()
+      mps.canonicalize(normalize=False)
+    center = mps.center_position
+    singular_values = [None] * (len(self) - 1)
+
+    C = mps.tensors[center]
+    for site in range(center, len(self) - 1):
+      _, S, V, _ = self.backend.svd(C, pivot_axis=2)
+      singular_values[site] = S
+      C = ncon([self.backend.diagflat(S), V, mps.tensors[site + 1]],
+               [[-1, 1], [1, 2], [2, -2, -3]],
+               backend=self.backend.name)
+
+    C = mps.tensors[center]
+    for site in reversed(range(1, center + 1)):
+      U, S, _, _ = self.backend.svd(C, pivot_axis=1)
+      singular_values[site - 1] = S
+      C = ncon([mps.tensors[site - 1], U, self.backend.diagflat(S)],
+               [[-1, -2, 1], [1, 2], [2, -3]],
+               backend=self.backend.name)
+
+    singular_values = [S / self.backend.norm(S) for S in singular_values]
+    entropies = {alpha: np.zeros(len(self) - 1) for alpha in alphas}
+    for bond, S in enumerate(singular_values):
+      probabilities = np.abs(np.array(S))**2
+      probabilities = probabilities[probabilities > 0]
+      for alpha in alphas:
+        if alpha == 1:
+          entropies[alpha][bond] = -np.sum(
+              probabilities * np.log(probabilities))
+        else:
+          entropies[alpha][bond] = np.log(np.sum(
+              probabilities**alpha)) / (1 - alpha)
+    return singular_values, entropies
+
+  @classmethod
+  def _from_mps_data(
+      cls, data: Dict[Text, Any],
+      backend: Optional[Union[AbstractBackend, Text]]) -> "FiniteMPS":
+    if backend is None:
+      backend = data['backend']
+    mps = cls(data['tensors'], canonicalize=False, backend=backend)
+    mps.center_position = data['center_position']
+    return mps
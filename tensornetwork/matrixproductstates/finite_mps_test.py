@@ -19,6 +19,7 @@ import numpy as np
 import time
 from tensornetwork.backends import backend_factory
 from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
+from tensornetwork.matrixproductstates.mpo import FiniteXXZ
 from tensornetwork.ncon_interface import ncon
 
 @pytest.fixture(
@@ -518,17 +519,25 @@ def test_random_mps_invalid_dimensions_raises_error(backend_dtype_values):
         backend=backend_dtype_values[0])
 
 
-def test_save_not_implemented(backend_dtype_values):
+def test_save_load(backend_dtype_values, tmp_path):
   backend = backend_dtype_values[0]
   dtype = backend_dtype_values[1]
+  N = 6
+  mps = FiniteMPS.random([2] * N, [4] * (N - 1), dtype=dtype, backend=backend)
+  mps.position(3)
+  path = str(tmp_path / 'mps.h5')
+  mps.save(path)
+  loaded = FiniteMPS.load(path)
+  assert isinstance(loaded, FiniteMPS)
+  assert loaded.backend.name == backend
+  assert loaded.center_position == 3
+  assert loaded.dtype == mps.dtype
+  for n in range(N):
+    np.testing.assert_allclose(loaded.tensors[n], mps.tensors[n])
 
-  D, d, N = 1, 2, 10
-  tensors = [np.ones((1, d, D), dtype=dtype)] + [
-      np.ones((D, d, D), dtype=dtype) for _ in range(N - 2)
-  ] + [np.ones((D, d, 1), dtype=dtype)]
-  mps = FiniteMPS(tensors, center_position=0, backend=backend)
-  with pytest.raises(NotImplementedError):
-    mps.save('tmp')
+  mps.center_position = None
+  mps.save(path)
+  assert FiniteMPS.load(path, backend='numpy').center_position is None
 
 
 def test_check_canonical_raises(backend):
@@ -543,3 +552,419 @@ def test_check_canonical_raises(backend):
       match="FiniteMPS.center_positions is `None`. "
       "Cannot check canonical form."):
     mps.check_canonical()
+
+
+def test_left_envs_cache_reuse_and_invalidation(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 8
+  mps = FiniteMPS.random([2] * N, [4] * (N - 1), dtype=dtype, backend=backend)
+  envs = mps.left_envs(range(N + 1))
+  num_calls = []
+  apply_transfer_operator = mps.apply_transfer_operator
+
+  def counting_transfer_operator(*args):
+    num_calls.append(1)
+    return apply_transfer_operator(*args)
+
+  mps.apply_transfer_operator = counting_transfer_operator
+  cached = mps.left_envs(range(N + 1))
+  assert len(num_calls) == 0
+  for site in range(N + 1):
+    np.testing.assert_allclose(cached[site], envs[site])
+
+  mps.tensors[5] = mps.tensors[5] * 2
+  updated = mps.left_envs(range(N + 1))
+  # only environments to the right of site 5 have to be recomputed
+  assert len(num_calls) == N - 5
+  for site in range(6):
+    np.testing.assert_allclose(updated[site], envs[site])
+  for site in range(6, N + 1):
+    np.testing.assert_allclose(updated[site], 4 * envs[site])
+
+
+def test_right_envs_cache_reuse_and_invalidation(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 8
+  mps = FiniteMPS.random([2] * N, [4] * (N - 1), dtype=dtype, backend=backend)
+  mps.position(N - 1)
+  envs = mps.right_envs(range(-1, N))
+  num_calls = []
+  apply_transfer_operator = mps.apply_transfer_operator
+
+  def counting_transfer_operator(*args):
+    num_calls.append(1)
+    return apply_transfer_operator(*args)
+
+  mps.apply_transfer_operator = counting_transfer_operator
+  cached = mps.right_envs(range(-1, N))
+  assert len(num_calls) == 0
+  for site in range(-1, N):
+    np.testing.assert_allclose(cached[site], envs[site])
+
+  mps.tensors[2] = mps.tensors[2] * 2
+  updated = mps.right_envs(range(-1, N))
+  # only environments to the left of site 2 have to be recomputed
+  assert len(num_calls) == 3
+  for site in range(2, N):
+    np.testing.assert_allclose(updated[site], envs[site])
+  for site in range(-1, 2):
+    np.testing.assert_allclose(updated[site], 4 * envs[site])
+
+
+def test_envs_cache_cleared_by_position(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 6
+  mps = FiniteMPS.random([2] * N, [4] * (N - 1), dtype=dtype, backend=backend)
+  sz = np.diag([0.5, -0.5]).astype(dtype)
+  expected = mps.measure_local_operator([sz] * N, range(N))
+  mps.position(N - 1)
+  np.testing.assert_allclose(
+      mps.measure_local_operator([sz] * N, range(N)), expected)
+  mps.position(2)
+  np.testing.assert_allclose(
+      mps.measure_local_operator([sz] * N, range(N)), expected)
+
+
+def test_correlation_matrix(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 7
+  np.random.seed(10)
+  mps = FiniteMPS.random([2] * N, [5] * (N - 1), dtype=dtype, backend=backend)
+  mps.position(3)
+  sz = np.diag([0.5, -0.5]).astype(dtype)
+  sx = np.array([[0, 1], [1, 0]]).astype(dtype)
+  sites = [5, 1, 2, 6]
+  actual = np.array(mps.correlation_matrix(sz, sx, sites))
+  assert actual.shape == (len(sites), len(sites))
+  order = np.argsort(sites)
+  for n, site in enumerate(sites):
+    expected = np.array(mps.measure_two_body_correlator(sz, sx, site, sites))
+    np.testing.assert_allclose(actual[n, order], expected, atol=1E-12)
+
+
+def test_correlation_matrix_raises(backend):
+  N = 5
+  mps = FiniteMPS.random([2] * N, [3] * (N - 1),
+                         dtype=np.float64,
+                         backend=backend)
+  sz = np.diag([0.5, -0.5])
+  with pytest.raises(ValueError):
+    mps.correlation_matrix(sz, sz, [1, 1])
+  with pytest.raises(ValueError):
+    mps.correlation_matrix(sz, sz, [0, N])
+  with pytest.raises(ValueError):
+    mps.correlation_matrix(sz, sz, [])
+
+
+def to_dense(mps):
+  psi = np.array(mps.tensors[0])
+  for tensor in mps.tensors[1:]:
+    psi = np.tensordot(psi, np.array(tensor), ([psi.ndim - 1], [0]))
+  return np.reshape(psi, (-1))
+
+
+def mpo_to_dense(mpo):
+  op = np.array(mpo.tensors[0])[0]
+  for tensor in mpo.tensors[1:]:
+    op = np.tensordot(op, np.array(tensor), ([0], [0]))
+    op = np.transpose(op, (2, 0, 3, 1, 4))
+    shape = op.shape
+    op = np.reshape(op,
+                    (shape[0], shape[1] * shape[2], shape[3] * shape[4]))
+  return op[0]
+
+
+@pytest.mark.parametrize("method", ['zipup', 'density_matrix', 'variational'])
+def test_apply_mpo_exact(backend_dtype_values, method):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 6
+  np.random.seed(10)
+  mps = FiniteMPS.random([2] * N, [3] * (N - 1), dtype=dtype, backend=backend)
+  mps.position(3)
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=dtype,
+      backend=backend)
+  expected = mpo_to_dense(mpo) @ to_dense(mps)
+  tensors = list(mps.tensors)
+  result = mps.apply_mpo(mpo, method=method)
+  assert result.center_position == 0
+  np.testing.assert_allclose(to_dense(result), expected, atol=1E-10)
+  np.testing.assert_allclose(result.check_canonical(), 0.0, atol=1E-10)
+  # the state itself is not modified
+  assert mps.center_position == 3
+  for n in range(N):
+    np.testing.assert_allclose(mps.tensors[n], tensors[n])
+
+
+def test_apply_mpo_truncated(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N, D = 8, 4
+  np.random.seed(10)
+  mps = FiniteMPS.random([2] * N, [D] * (N - 1), dtype=dtype, backend=backend)
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=dtype,
+      backend=backend)
+  expected = mpo_to_dense(mpo) @ to_dense(mps)
+  expected /= np.linalg.norm(expected)
+  overlaps = {}
+  for method in ['zipup', 'density_matrix', 'variational']:
+    result = mps.apply_mpo(mpo, method=method, max_singular_values=D + 2)
+    assert max(result.bond_dimensions) == D + 2
+    actual = to_dense(result) / np.linalg.norm(to_dense(result))
+    overlaps[method] = np.abs(np.vdot(expected, actual))
+  assert overlaps['zipup'] > 0.95
+  assert overlaps['density_matrix'] > max(overlaps['zipup'], 0.99)
+  assert overlaps['variational'] > max(overlaps['zipup'], 0.99)
+
+
+def test_apply_mpo_raises(backend):
+  N = 4
+  mps = FiniteMPS.random([2] * N, [3] * (N - 1),
+                         dtype=np.float64,
+                         backend=backend)
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=np.float64,
+      backend=backend)
+  with pytest.raises(ValueError):
+    mps.apply_mpo(mpo, method='unknown')
+  short_mpo = FiniteXXZ(
+      Jz=np.ones(N - 2),
+      Jxy=np.ones(N - 2),
+      Bz=np.zeros(N - 1),
+      dtype=np.float64,
+      backend=backend)
+  with pytest.raises(ValueError):
+    mps.apply_mpo(short_mpo)
+
+
+def test_add(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 5
+  np.random.seed(10)
+  mps1 = FiniteMPS.random([2, 3, 2, 3, 2], [2, 3, 4, 2],
+                          dtype=dtype,
+                          backend=backend)
+  mps2 = FiniteMPS.random([2, 3, 2, 3, 2], [3, 1, 2, 3],
+                          dtype=dtype,
+                          backend=backend)
+  result = mps1 + mps2
+  assert result.center_position is None
+  assert result.bond_dimensions == [1] + [
+      D1 + D2 for D1, D2 in zip(mps1.bond_dimensions[1:-1],
+                                mps2.bond_dimensions[1:-1])
+  ] + [1]
+  assert len(result) == N
+  np.testing.assert_allclose(
+      to_dense(result), to_dense(mps1) + to_dense(mps2), atol=1E-12)
+
+
+def test_add_raises(backend):
+  mps1 = FiniteMPS.random([2] * 3, [2] * 2, dtype=np.float64, backend=backend)
+  mps2 = FiniteMPS.random([2] * 4, [2] * 3, dtype=np.float64, backend=backend)
+  with pytest.raises(ValueError):
+    mps1 + mps2  # pylint: disable=pointless-statement
+
+
+def test_inner(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 6
+  np.random.seed(10)
+  mps1 = FiniteMPS.random([2] * N, [4] * (N - 1), dtype=dtype, backend=backend)
+  mps2 = FiniteMPS.random([2] * N, [3] * (N - 1), dtype=dtype, backend=backend)
+  mps2.position(3)
+  np.testing.assert_allclose(
+      mps1.inner(mps2), np.vdot(to_dense(mps1), to_dense(mps2)), atol=1E-12)
+  np.testing.assert_allclose(mps1.inner(mps1), 1.0, atol=1E-12)
+
+
+@pytest.mark.parametrize("method", ['svd', 'variational'])
+def test_compress_exact(backend_dtype_values, method):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 6
+  np.random.seed(10)
+  mps = FiniteMPS.random([2] * N, [3] * (N - 1), dtype=dtype, backend=backend)
+  # mps + mps has bond dimension 6, but only rank 3
+  result = mps + mps
+  result.compress(max_truncation_err=1E-10, method=method)
+  assert result.center_position == 0
+  assert max(result.bond_dimensions) == 3
+  np.testing.assert_allclose(result.check_canonical(), 0.0, atol=1E-10)
+  np.testing.assert_allclose(to_dense(result), 2 * to_dense(mps), atol=1E-10)
+
+
+def test_compress_truncated(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N, D = 8, 6
+  np.random.seed(10)
+  mps = FiniteMPS.random([2] * N, [D] * (N - 1), dtype=dtype, backend=backend)
+  overlaps = {}
+  for method in ['svd', 'variational']:
+    result = FiniteMPS(list(mps.tensors), center_position=0, backend=backend)
+    result.compress(max_singular_values=D - 2, method=method)
+    assert max(result.bond_dimensions) == D - 2
+    overlaps[method] = np.abs(np.array(result.inner(mps))) / np.linalg.norm(
+        to_dense(result))
+  assert overlaps['variational'] >= overlaps['svd'] - 1E-12
+
+
+def test_compress_raises(backend):
+  mps = FiniteMPS.random([2] * 3, [2] * 2, dtype=np.float64, backend=backend)
+  with pytest.raises(ValueError):
+    mps.compress(2, method='unknown')
+
+
+def test_sample(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N, num_samples = 4, 20000
+  np.random.seed(10)
+  mps = FiniteMPS.random([2, 3, 2, 2], [2, 3, 2], dtype=dtype, backend=backend)
+  mps.position(2)
+  samples = mps.sample(num_samples, seed=10)
+  assert samples.shape == (num_samples, N)
+  assert mps.center_position == 2
+  expected = np.abs(to_dense(mps))**2
+  indices = np.ravel_multi_index(samples.T, mps.physical_dimensions)
+  frequencies = np.bincount(indices, minlength=24) / num_samples
+  np.testing.assert_allclose(frequencies, expected, atol=0.015)
+
+
+def test_sample_basis(backend_dtype_values):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N, num_samples = 4, 20000
+  np.random.seed(10)
+  mps = FiniteMPS.random([2] * N, [2] * (N - 1), dtype=dtype, backend=backend)
+  hadamard = np.array([[1, 1], [1, -1]]).astype(dtype) / np.sqrt(2)
+  samples = mps.sample(num_samples, basis=hadamard, seed=10)
+  rotated = np.reshape(to_dense(mps), [2] * N)
+  for n in range(N):
+    rotated = np.tensordot(hadamard.conj().T, rotated, ([1], [n]))
+    rotated = np.moveaxis(rotated, 0, n)
+  expected = np.abs(np.ravel(rotated))**2
+  indices = np.ravel_multi_index(samples.T, [2] * N)
+  frequencies = np.bincount(indices, minlength=2**N) / num_samples
+  np.testing.assert_allclose(frequencies, expected, atol=0.015)
+
+
+def test_sample_product_state(backend):
+  N = 5
+  tensors = [np.zeros((1, 2, 1)) for _ in range(N)]
+  bits = [1, 0, 0, 1, 1]
+  for tensor, bit in zip(tensors, bits):
+    tensor[0, bit, 0] = 1.0
+  mps = FiniteMPS(tensors, center_position=0, backend=backend)
+  samples = mps.sample(10, seed=1)
+  np.testing.assert_allclose(samples, np.array([bits] * 10))
+  with pytest.raises(ValueError):
+    mps.sample(10, basis=[np.eye(2)] * (N - 1))
+
+
+@pytest.mark.parametrize("center", [0, 2, 5])
+def test_entanglement_profile(backend_dtype_values, center):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 6
+  np.random.seed(10)
+  mps = FiniteMPS.random([2, 3, 2, 2, 3, 2], [2, 4, 4, 3, 2],
+                         dtype=dtype,
+                         backend=backend)
+  mps.position(center)
+  tensors = list(mps.tensors)
+  singular_values, entropies = mps.entanglement_profile(alphas=(1, 2, 0.5))
+  assert mps.center_position == center
+  for n in range(N):
+    np.testing.assert_allclose(mps.tensors[n], tensors[n])
+  assert len(singular_values) == N - 1
+  psi = to_dense(mps)
+  for bond in range(N - 1):
+    dim = np.prod(mps.physical_dimensions[:bond + 1])
+    expected = np.linalg.svd(np.reshape(psi, (dim, -1)), compute_uv=False)
+    expected = expected[:len(np.array(singular_values[bond]))]
+    np.testing.assert_allclose(
+        np.abs(np.array(singular_values[bond])), expected, atol=1E-12)
+    p = expected**2
+    np.testing.assert_allclose(entropies[1][bond], -np.sum(p * np.log(p)))
+    np.testing.assert_allclose(entropies[2][bond], -np.log(np.sum(p**2)))
+    np.testing.assert_allclose(entropies[0.5][bond],
+                               2 * np.log(np.sum(np.sqrt(p))))
+
+
+@pytest.mark.parametrize("center", [0, 3, 5])
+def test_expectation_mpo(backend_dtype_values, center):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 6
+  np.random.seed(10)
+  mps = FiniteMPS.random([2] * N, [4] * (N - 1), dtype=dtype, backend=backend)
+  mps.position(center)
+  mpo = FiniteXXZ(
+      Jz=np.random.rand(N - 1),
+      Jxy=np.random.rand(N - 1),
+      Bz=np.random.rand(N),
+      dtype=dtype,
+      backend=backend)
+  psi = to_dense(mps)
+  expected = np.vdot(psi, mpo_to_dense(mpo) @ psi)
+  np.testing.assert_allclose(mps.expectation_mpo(mpo), expected)
+
+
+@pytest.mark.parametrize("center", [0, 3, 5])
+def test_expectation_string(backend_dtype_values, center):
+  backend = backend_dtype_values[0]
+  dtype = backend_dtype_values[1]
+  N = 6
+  np.random.seed(10)
+  mps = FiniteMPS.random([2] * N, [4] * (N - 1), dtype=dtype, backend=backend)
+  mps.position(center)
+  sx = np.array([[0, 1], [1, 0]], dtype=dtype)
+  sz = np.array([[1, 0], [0, -1]], dtype=dtype)
+  ops_by_site = {1: sx, 2: sz, 4: sz, 5: sx}
+  op = np.eye(1)
+  for site in range(N):
+    op = np.kron(op, ops_by_site.get(site, np.eye(2)))
+  psi = to_dense(mps)
+  backend_obj = backend_factory.get_backend(backend)
+  result = mps.expectation_string({
+      site: backend_obj.convert_to_tensor(o)
+      for site, o in ops_by_site.items()
+  })
+  np.testing.assert_allclose(result, np.vdot(psi, op @ psi))
+
+
+def test_expectation_raises():
+  N = 6
+  mps = FiniteMPS.random([2] * N, [4] * (N - 1),
+                         dtype=np.float64,
+                         backend='numpy')
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 2),
+      Jxy=np.ones(N - 2),
+      Bz=np.ones(N - 1),
+      dtype=np.float64,
+      backend='numpy')
+  with pytest.raises(ValueError):
+    mps.expectation_mpo(mpo)
+  with pytest.raises(ValueError):
+    mps.expectation_string({})
+  with pytest.raises(ValueError):
+    mps.expectation_string({N: np.eye(2)})
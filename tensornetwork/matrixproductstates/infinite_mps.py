@@ -58,6 +58,9 @@ class InfiniteMPS(BaseMPS):
         center_position=center_position,
         connector_matrix=connector_matrix,
         backend=backend)
+    # initial states for the fixed points of the next gauge computation,
+    # set by `canonicalize`
+    self._gauge_warm_start = None
 
   @classmethod
   def random(
@@ -161,41 +164,27 @@ class InfiniteMPS(BaseMPS):
   def left_envs(self, sites: Sequence[int]) -> Dict:
     raise NotImplementedError()
 
-  def save(self, path: str):
-    raise NotImplementedError()
-
-  # pylint: disable=arguments-differ
-  def canonicalize(self,
-                   left_initial_state: Optional[Tensor] = None,
-                   right_initial_state: Optional[Tensor] = None,
-                   precision: Optional[float] = 1E-10,
-                   truncation_threshold: Optional[float] = 1E-15,
-                   D: Optional[int] = None,
-                   num_krylov_vecs: Optional[int] = 50,
-                   maxiter: Optional[int] = 1000,
-                   pseudo_inverse_cutoff: Optional[float] = None) -> None:
-    """Canonicalize an InfiniteMPS (i.e. bring it into Schmidt-canonical form).
-
-    Args:
-      left_initial_state: An initial guess for the left eigenvector of
-        the unit-cell mps transfer matrix
-      right_initial_state: An initial guess for the right eigenvector of
-        the unit-cell transfer matrix
-      precision: The desired precision of the dominant eigenvalues (passed
-        to InfiniteMPS.transfer_matrix_eigs)
-      truncation_threshold: Truncation threshold for Schmidt-values at the
-        boundaries of the mps.
-      D: The maximum number of Schmidt values to be kept at the boundaries
-        of the mps.
-      num_krylov_vecs: Number of Krylov vectors to diagonalize transfer_matrix
-      maxiter: Maximum number of iterations in `eigs`
-      pseudo_inverse_cutoff: A cutoff for taking the Moore-Penrose
-        pseudo-inverse of a matrix. Given the SVD of a matrix :math:`M=U S V`,
-        the inverse isd is computed as :math:`V^* S^{-1}_+ U^*`,
-        where :math:`S^{-1}_+` equals `S^{-1}` for all values in `S` which
-        are larger than `pseudo_inverse_cutoff`, and is 0 for all others.
-    Returns:
-      None
+  @classmethod
+  def _from_mps_data(
+      cls, data: Dict[Text, Any],
+      backend: Optional[Union[AbstractBackend, Text]]) -> "InfiniteMPS":
+    if backend is None:
+      backend = data['backend']
+    mps = cls(
+        data['tensors'],
+        center_position=data['center_position'],
+        backend=backend)
+    if data['connector_matrix'] is not None:
+      mps.connector_matrix = mps.backend.convert_to_tensor(
+          data['connector_matrix'])
+    return mps
+
+  def _eigs_gauge_matrices(self, left_initial_state, right_initial_state,
+                           precision, num_krylov_vecs, maxiter,
+                           pseudo_inverse_cutoff):
+    """Compute the square roots of the transfer-matrix fixed points and
+    their inverses using `eigs`. The unit-cell tensors are normalized such
+    that the dominant eigenvalue of the transfer matrix is 1.
     """
     if self.center_position is None:
       self.center_position = 0
@@ -267,6 +256,160 @@ class InfiniteMPS(BaseMPS):
     ], [[-1, 1], [-2, 1]],
                      backend=self.backend.name)
 
+    return sqrtl, inv_sqrtl, sqrtr, inv_sqrtr
+
+  def _qr_gauge_matrices(self, left_initial_state, right_initial_state,
+                         precision, maxiter):
+    """Compute the square roots `L` and `R` of the transfer-matrix fixed
+    points and their inverses using `_left_gauge_fixed_point` and
+    `_right_gauge_fixed_point`. The unit-cell tensors are normalized such
+    that the dominant eigenvalue of the transfer matrix is 1.
+    """
+    # the fixed points are computed for the full unit cell, including
+    # the connector matrix
+    if self.connector_matrix is not None:
+      self.tensors[-1] = self.get_tensor(len(self) - 1)
+      self.connector_matrix = None
+    D = self.bond_dimensions[0]
+    warm_start = self._gauge_warm_start
+    if warm_start is not None and tuple(warm_start[0].shape) != (D, D):
+      warm_start = None
+    if left_initial_state is None:
+      left_initial_state = self.backend.eye(
+          D, dtype=self.dtype) if warm_start is None else warm_start[0]
+    if right_initial_state is None:
+      right_initial_state = self.backend.eye(
+          D, dtype=self.dtype) if warm_start is None else warm_start[1]
+    lam, sqrtl = self._left_gauge_fixed_point(left_initial_state, precision,
+                                              maxiter)
+    _, sqrtr = self._right_gauge_fixed_point(right_initial_state, precision,
+                                             maxiter)
+    self.tensors[0] /= lam
+    # the tensors are in an arbitrary gauge; `canonicalize` restores
+    # the left-canonical form with a QR sweep starting at site 0
+    self.center_position = 0
+    return sqrtl, self.backend.inv(sqrtl), sqrtr, self.backend.inv(sqrtr)
+
+  def _left_gauge_fixed_point(self, initial_state: Tensor, precision: float,
+                              maxiter: int):
+    """Compute the gauge matrix `L` with `L A = lam A_L L` (where `A` is
+    the product of all unit-cell tensors and `A_L` is left orthonormal)
+    by iterating QR decompositions through the unit cell, starting
+    from `initial_state`. `L` is normalized and its QR-gauge is fixed by
+    non-negative diagonals, so the iteration converges to a unique
+    fixed point.
+
+    Returns:
+      `Tensor`: The scalar `lam`.
+      `Tensor`: The matrix `L`.
+    """
+    L = initial_state / self.backend.norm(initial_state)
+    for _ in range(maxiter):
+      L_old = L
+      for tensor in self.tensors:
+        _, L = self.backend.qr(
+            ncon([L, tensor], [[-1, 1], [1, -2, -3]],
+                 backend=self.backend.name),
+            pivot_axis=2,
+            non_negative_diagonal=True)
+      lam = self.backend.norm(L)
+      L /= lam
+      if self.backend.norm(L - L_old) < precision:
+        break
+    return lam, L
+
+  def _right_gauge_fixed_point(self, initial_state: Tensor, precision: float,
+                               maxiter: int):
+    """Compute the gauge matrix `R` with `A R = lam R A_R` (where `A` is
+    the product of all unit-cell tensors and `A_R` is right orthonormal)
+    by iterating RQ decompositions through the unit cell, starting
+    from `initial_state`. See `InfiniteMPS._left_gauge_fixed_point`.
+
+    Returns:
+      `Tensor`: The scalar `lam`.
+      `Tensor`: The matrix `R`.
+    """
+    R = initial_state / self.backend.norm(initial_state)
+    for _ in range(maxiter):
+      R_old = R
+      for tensor in reversed(self.tensors):
+        R, _ = self.backend.rq(
+            ncon([tensor, R], [[-1, -2, 1], [1, -3]],
+                 backend=self.backend.name),
+            pivot_axis=1,
+            non_negative_diagonal=True)
+      lam = self.backend.norm(R)
+      R /= lam
+      if self.backend.norm(R - R_old) < precision:
+        break
+    return lam, R
+
+  # pylint: disable=arguments-differ
+  def canonicalize(self,
+                   left_initial_state: Optional[Tensor] = None,
+                   right_initial_state: Optional[Tensor] = None,
+                   precision: Optional[float] = 1E-10,
+                   truncation_threshold: Optional[float] = 1E-15,
+                   D: Optional[int] = None,
+                   num_krylov_vecs: Optional[int] = 50,
+                   maxiter: Optional[int] = 1000,
+                   pseudo_inverse_cutoff: Optional[float] = None,
+                   method: Text = 'eigs') -> None:
+    """Canonicalize an InfiniteMPS (i.e. bring it into Schmidt-canonical form).
+
+    Two methods are available to compute the fixed points of the
+    unit-cell transfer matrix:
+      * `'eigs'`: The dominant left and right eigenvectors of the transfer
+        matrix are computed with `eigs`, and their matrix square roots are
+        taken with `eigh`.
+      * `'qr'`: The square roots `L` and `R` of the fixed points are
+        obtained directly by iterating QR (RQ) decompositions through the
+        unit cell. Unless initial states are given, the iteration is
+        warm-started from the fixed points of the last canonicalization,
+        which are close to the new ones if the tensors have changed only
+        slightly since then. This is typically much faster than `'eigs'`
+        within iterative algorithms.
+
+    Args:
+      left_initial_state: An initial guess for the left eigenvector of
+        the unit-cell mps transfer matrix (for `method='qr'`: for
+        its square root `L`)
+      right_initial_state: An initial guess for the right eigenvector of
+        the unit-cell transfer matrix (for `method='qr'`: for its
+        square root `R`)
+      precision: The desired precision of the dominant eigenvalues (passed
+        to InfiniteMPS.transfer_matrix_eigs), or of `L` and `R` for
+        `method='qr'`.
+      truncation_threshold: Truncation threshold for Schmidt-values at the
+        boundaries of the mps.
+      D: The maximum number of Schmidt values to be kept at the boundaries
+        of the mps.
+      num_krylov_vecs: Number of Krylov vectors to diagonalize transfer_matrix
+      maxiter: Maximum number of iterations in `eigs`, or of QR sweeps
+        through the unit cell for `method='qr'`.
+      pseudo_inverse_cutoff: A cutoff for taking the Moore-Penrose
+        pseudo-inverse of a matrix. Given the SVD of a matrix :math:`M=U S V`,
+        the inverse isd is computed as :math:`V^* S^{-1}_+ U^*`,
+        where :math:`S^{-1}_+` equals `S^{-1}` for all values in `S` which
+        are larger than `pseudo_inverse_cutoff`, and is 0 for all others.
+        Only used for `method='eigs'`.
+      method: The method used to compute the fixed points, `'eigs'`
+        or `'qr'`.
+    Returns:
+      None
+    Raises:
+      ValueError: If `method` is unknown.
+    """
+    if method not in ('eigs', 'qr'):
+      raise ValueError("unknown value {} for `method`".format(method))
+    if method == 'qr':
+      sqrtl, inv_sqrtl, sqrtr, inv_sqrtr = self._qr_gauge_matrices(
+          left_initial_state, right_initial_state, precision, maxiter)
+    else:
+      sqrtl, inv_sqrtl, sqrtr, inv_sqrtr = self._eigs_gauge_matrices(
+          left_initial_state, right_initial_state, precision,
+          num_krylov_vecs, maxiter, pseudo_inverse_cutoff)
+
     tmp = ncon([sqrtl, sqrtr], [[-1, 1], [1, -2]], backend=self.backend.name)
     U, singvals, V, _ = self.backend.svd(
         tmp,
@@ -293,5 +436,8 @@ class InfiniteMPS(BaseMPS):
     lam /= lam_norm
     self.center_position = len(self) - 1
     self.connector_matrix = self.backend.inv(lam)
-
+    # in the new gauge, the square roots of the left and right fixed points
+    # of the unit cell (with the connector absorbed) are 1 and lam.
+    self._gauge_warm_start = (self.backend.eye(
+        self.bond_dimensions[0], dtype=self.dtype), lam)
     return lam_norm
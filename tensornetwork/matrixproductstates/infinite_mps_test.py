@@ -89,3 +89,80 @@ def test_InfiniteMPS_canonicalize(dtype):
 
   imps.canonicalize()
   assert imps.check_canonical() < 1E-12
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_InfiniteMPS_canonicalize_qr(dtype):
+  D, d, N = 10, 2, 4
+  imps = InfiniteMPS.random(
+      d=[d] * N, D=[D] * (N + 1), dtype=dtype, backend='numpy')
+  imps2 = InfiniteMPS(
+      [t.copy() for t in imps.tensors], backend='numpy')
+  imps.canonicalize(precision=1E-14, method='qr')
+  assert imps.check_canonical() < 1E-12
+  imps2.canonicalize(precision=1E-14)
+  # both methods yield the same Schmidt values
+  s1 = np.linalg.svd(np.linalg.inv(imps.connector_matrix), compute_uv=False)
+  s2 = np.linalg.svd(np.linalg.inv(imps2.connector_matrix), compute_uv=False)
+  np.testing.assert_allclose(s1, s2, atol=1E-10)
+
+
+def test_InfiniteMPS_canonicalize_qr_warm_start():
+  np.random.seed(10)
+  D, d, N = 10, 2, 4
+  imps = InfiniteMPS.random(
+      d=[d] * N, D=[D] * (N + 1), dtype=np.float64, backend='numpy')
+  imps.canonicalize(precision=1E-14, method='qr')
+  # a slightly perturbed state is canonicalized starting from the
+  # previous fixed points
+  imps.tensors[1] += 1E-4 * np.random.randn(*imps.tensors[1].shape)
+  cold = InfiniteMPS([t.copy() for t in imps.tensors],
+                     connector_matrix=imps.connector_matrix.copy(),
+                     backend='numpy')
+
+  def count_rq_calls(mps):
+    # the left fixed point of the previous (left canonical) gauge is the
+    # identity, the warm start pays off for the right fixed point
+    rq = mps.backend.rq
+    num_calls = []
+
+    def counting_rq(*args, **kwargs):
+      num_calls.append(1)
+      return rq(*args, **kwargs)
+
+    mps.backend.rq = counting_rq
+    try:
+      mps.canonicalize(precision=1E-14, method='qr')
+    finally:
+      del mps.backend.rq
+    return len(num_calls)
+
+  num_warm = count_rq_calls(imps)
+  num_cold = count_rq_calls(cold)
+  assert imps.check_canonical() < 1E-12
+  assert cold.check_canonical() < 1E-12
+  assert num_warm < num_cold
+
+
+def test_InfiniteMPS_canonicalize_raises():
+  imps = InfiniteMPS.random(
+      d=[2] * 2, D=[4] * 3, dtype=np.float64, backend='numpy')
+  with pytest.raises(ValueError):
+    imps.canonicalize(method='foo')
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128])
+def test_InfiniteMPS_save_load(dtype, tmp_path):
+  D, d, N = 10, 2, 4
+  imps = InfiniteMPS.random(
+      d=[d] * N, D=[D] * (N + 1), dtype=dtype, backend='numpy')
+  imps.canonicalize()
+  path = str(tmp_path / 'imps.h5')
+  imps.save(path)
+  loaded = InfiniteMPS.load(path)
+  assert isinstance(loaded, InfiniteMPS)
+  assert loaded.center_position == imps.center_position
+  np.testing.assert_allclose(loaded.connector_matrix, imps.connector_matrix)
+  for n in range(N):
+    np.testing.assert_allclose(loaded.tensors[n], imps.tensors[n])
+  assert loaded.check_canonical() < 1E-12
@@ -16,7 +16,7 @@ import numpy as np
 from tensornetwork.backends import backend_factory
 from tensornetwork.backend_contextmanager import get_default_backend
 from tensornetwork.backends.abstract_backend import AbstractBackend
-from typing import List, Union, Text, Optional, Any, Type
+from typing import List, Union, Text, Optional, Any, Type, Sequence, Tuple
 Tensor = Any
 
 
@@ -125,6 +125,158 @@ class FiniteMPO(BaseMPO):
     if (self.bond_dimensions[0] != 1) or (self.bond_dimensions[-1] != 1):
       raise ValueError('left and right MPO ancillary dimensions have to be 1')
 
+  @classmethod
+  def from_terms(cls,
+                 terms: Sequence[Tuple[Any, Sequence[Tuple[Tensor, int]]]],
+                 physical_dimensions: Sequence[int],
+                 dtype: Optional[Type[np.number]] = None,
+                 max_truncation_err: Optional[float] = 1E-12,
+                 backend: Optional[Union[AbstractBackend, Text]] = None,
+                 name: Optional[Text] = None) -> "FiniteMPO":
+    """Construct the MPO of a sum of products of local operators.
+
+    `terms` is a list of tuples `(coeff, [(op1, site1), (op2, site2), ...])`
+    where each tuple represents the operator
+    `coeff * op1[site1] * op2[site2] * ...`, and `op` are numpy arrays of
+    shape `(d, d)` with `d` the physical dimension at `site`. Operators
+    acting on the same site are multiplied in the order in which they
+    appear. For example, the MPO of the transverse field Ising model is
+    obtained from
+    ```python
+    terms = [(J, [(sx, n), (sx, n + 1)]) for n in range(N - 1)]
+    terms += [(B, [(sz, n)]) for n in range(N)]
+    mpo = FiniteMPO.from_terms(terms, [2] * N)
+    ```
+
+    The MPO is first constructed as a finite-state automaton in which
+    terms with identical leading operators share a channel. The bond
+    dimensions are then reduced with a QR sweep followed by a sweep of
+    truncating SVDs.
+
+    Args:
+      terms: The operator terms.
+      physical_dimensions: The local Hilbert-space dimensions.
+      dtype: The dtype of the MPO. If `None`, the dtype is inferred from
+        `terms`.
+      max_truncation_err: The maximum allowed truncation error per bond
+        during compression, relative to the largest singular value.
+        If `None`, the MPO is not compressed.
+      backend: An optional backend.
+      name: An optional name for the MPO.
+    Returns:
+      FiniteMPO: The mpo.
+    Raises:
+      ValueError: If `terms` is empty, or if sites or operator shapes are
+        not consistent with `physical_dimensions`.
+    """
+    N = len(physical_dimensions)
+    if len(terms) == 0:
+      raise ValueError("`terms` is empty")
+    if dtype is None:
+      dtype = np.result_type(
+          *[np.asarray(c) for c, _ in terms],
+          *[np.asarray(op) for _, ops in terms for op, _ in ops])
+
+    # bring all terms into the form (coeff, {site: op}) with sorted sites
+    local_terms = []
+    for coeff, ops in terms:
+      if len(ops) == 0:
+        raise ValueError("found a term without operators")
+      term = {}
+      for op, site in ops:
+        if not 0 <= site < N:
+          raise ValueError("site {} out of range for N = {}".format(site, N))
+        d = physical_dimensions[site]
+        op = np.asarray(op).astype(dtype)
+        if op.shape != (d, d):
+          raise ValueError("operator of shape {} at site {} with physical "
+                           "dimension {}".format(op.shape, site, d))
+        term[site] = term[site] @ op if site in term else op
+      local_terms.append((coeff, dict(sorted(term.items()))))
+
+    # states of the automaton on bond n (between sites n and n + 1) are
+    # 'init' (no operator applied yet), 'final' (term completed) and
+    # prefixes of terms which start at or left of site n and end right
+    # of site n
+    def key(op):
+      return (op.shape, op.tobytes())
+
+    def prefix(term, site):
+      return tuple((s, key(op)) for s, op in term.items() if s <= site)
+
+    states = []
+    for bond in range(-1, N):
+      bond_states = {}
+      if bond < N - 1:
+        bond_states['init'] = len(bond_states)
+      if bond >= 0:
+        bond_states['final'] = len(bond_states)
+      for _, term in local_terms:
+        sites = list(term.keys())
+        if sites[0] <= bond < sites[-1]:
+          bond_states.setdefault(prefix(term, bond), len(bond_states))
+      states.append(bond_states)
+
+    tensors = []
+    for site in range(N):
+      left, right = states[site], states[site + 1]
+      d = physical_dimensions[site]
+      eye = np.eye(d, dtype=dtype)
+      tensor = np.zeros((len(left), len(right), d, d), dtype=dtype)
+      if 'init' in right:
+        tensor[left['init'], right['init']] = eye
+      if 'final' in left:
+        tensor[left['final'], right['final']] = eye
+      for coeff, term in local_terms:
+        sites = list(term.keys())
+        if not sites[0] <= site <= sites[-1]:
+          continue
+        op = term.get(site, eye)
+        a = left['init'] if sites[0] == site else left[prefix(term, site - 1)]
+        if sites[-1] == site:
+          tensor[a, right['final']] += coeff * op
+        else:
+          # shared channels are assigned identical operators
+          tensor[a, right[prefix(term, site)]] = op
+      tensors.append(tensor)
+
+    if max_truncation_err is not None:
+      tensors = _compress_mpo_tensors(tensors, max_truncation_err)
+    return FiniteMPO(tensors=tensors, backend=backend, name=name)
+
+
+def _compress_mpo_tensors(tensors: List[np.ndarray],
+                          max_truncation_err: float) -> List[np.ndarray]:
+  """Reduce the bond dimensions of finite MPO tensors with a QR sweep
+  followed by a sweep of truncating SVDs. The norm of the MPO is
+  distributed evenly over all tensors.
+  """
+  tensors = list(tensors)
+  N = len(tensors)
+  for site in range(N - 1):
+    a, b, d1, d2 = tensors[site].shape
+    matrix = np.reshape(np.transpose(tensors[site], (0, 2, 3, 1)), (-1, b))
+    q, r = np.linalg.qr(matrix)
+    tensors[site] = np.transpose(np.reshape(q, (a, d1, d2, -1)), (0, 3, 1, 2))
+    tensors[site + 1] = np.tensordot(r, tensors[site + 1], ([1], [0]))
+
+  for site in reversed(range(1, N)):
+    a, b, d1, d2 = tensors[site].shape
+    u, s, vh = np.linalg.svd(
+        np.reshape(tensors[site], (a, -1)), full_matrices=False)
+    trunc_errs = np.sqrt(np.cumsum(np.square(s[::-1])))[::-1]
+    num_keep = max(np.count_nonzero(trunc_errs > max_truncation_err * s[0]), 1)
+    tensors[site] = np.reshape(vh[:num_keep, :], (num_keep, b, d1, d2))
+    tensors[site - 1] = np.transpose(
+        np.tensordot(tensors[site - 1], u[:, :num_keep] * s[:num_keep],
+                     ([1], [0])), (0, 3, 1, 2))
+
+  norm = np.linalg.norm(tensors[0])
+  if norm > 0:
+    scale = norm**(1.0 / N)
+    tensors = [tensors[0] / norm * scale] + [t * scale for t in tensors[1:]]
+  return tensors
+
 
 class FiniteXXZ(FiniteMPO):
   """
@@ -5,7 +5,7 @@ import jax
 import torch
 from tensornetwork.backends import backend_factory
 #pylint: disable=line-too-long
-from tensornetwork.matrixproductstates.mpo import FiniteMPO, BaseMPO, InfiniteMPO
+from tensornetwork.matrixproductstates.mpo import FiniteMPO, BaseMPO, InfiniteMPO, FiniteXXZ
 
 
 @pytest.fixture(
@@ -81,3 +81,74 @@ def test_len(backend):
   ]
   mpo = BaseMPO(tensors=tensors, backend=backend)
   assert len(mpo) == 3
+
+
+def mpo_to_dense(mpo):
+  op = np.array(mpo.tensors[0])[0]
+  for tensor in mpo.tensors[1:]:
+    op = np.tensordot(op, np.array(tensor), ([0], [0]))
+    op = np.transpose(op, (2, 0, 3, 1, 4))
+    shape = op.shape
+    op = np.reshape(op, (shape[0], shape[1] * shape[2], shape[3] * shape[4]))
+  return op[0]
+
+
+def local_operator(op, site, N):
+  return np.kron(
+      np.kron(np.eye(2**site), op), np.eye(2**(N - 1 - site)))
+
+
+def test_from_terms_xxz(backend):
+  N = 6
+  np.random.seed(10)
+  Jz, Jxy, Bz = np.random.rand(N - 1), np.random.rand(N - 1), np.random.rand(N)
+  sz = np.diag([-0.5, 0.5])
+  sp = np.array([[0, 0], [1, 0]])
+  sm = np.array([[0, 1], [0, 0]])
+  terms = []
+  for n in range(N - 1):
+    terms.append((Jz[n], [(sz, n), (sz, n + 1)]))
+    terms.append((Jxy[n] / 2, [(sp, n), (sm, n + 1)]))
+    terms.append((Jxy[n] / 2, [(sm, n), (sp, n + 1)]))
+  terms += [(Bz[n], [(sz, n)]) for n in range(N)]
+  mpo = FiniteMPO.from_terms(terms, [2] * N, backend=backend)
+  expected = FiniteXXZ(Jz, Jxy, Bz, dtype=np.float64, backend='numpy')
+  assert mpo.backend.name == backend
+  assert mpo.bond_dimensions == [1, 4, 5, 5, 5, 4, 1]
+  np.testing.assert_allclose(
+      mpo_to_dense(mpo), mpo_to_dense(expected), atol=1E-12)
+
+
+def test_from_terms_long_range():
+  N = 7
+  sz = np.diag([-0.5, 0.5])
+  sx = np.array([[0, 0.5], [0.5, 0]])
+  terms = [(np.exp(-(m - n)), [(sz, n), (sz, m)])
+           for n in range(N)
+           for m in range(n + 1, N)]
+  # operators on the same site are multiplied
+  terms.append((2.0, [(sx, 3), (sz, 3)]))
+  mpo = FiniteMPO.from_terms(terms, [2] * N)
+  expected = sum(c * local_operator(sz, n, N) @ local_operator(sz, m, N)
+                 for c, [(_, n), (_, m)] in terms[:-1])
+  expected += 2.0 * local_operator(sx @ sz, 3, N)
+  # exponentially decaying interactions have an MPO of bond dimension 3
+  assert max(mpo.bond_dimensions) == 3
+  np.testing.assert_allclose(mpo_to_dense(mpo), expected, atol=1E-12)
+
+  uncompressed = FiniteMPO.from_terms(
+      terms, [2] * N, max_truncation_err=None)
+  assert max(uncompressed.bond_dimensions) > 3
+  np.testing.assert_allclose(mpo_to_dense(uncompressed), expected, atol=1E-12)
+
+
+def test_from_terms_raises():
+  sz = np.diag([-0.5, 0.5])
+  with pytest.raises(ValueError):
+    FiniteMPO.from_terms([], [2] * 3)
+  with pytest.raises(ValueError):
+    FiniteMPO.from_terms([(1.0, [(sz, 3)])], [2] * 3)
+  with pytest.raises(ValueError):
+    FiniteMPO.from_terms([(1.0, [(sz, 0)])], [3] * 3)
+  with pytest.raises(ValueError):
+    FiniteMPO.from_terms([(1.0, [])], [2] * 3)
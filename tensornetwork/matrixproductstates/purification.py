@@ -0,0 +1,206 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import scipy as sp
+import scipy.linalg
+from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
+from tensornetwork.matrixproductstates.mpo import FiniteMPO
+from tensornetwork.backends.abstract_backend import AbstractBackend
+from tensornetwork.ncon_interface import ncon
+from typing import Any, List, Optional, Sequence, Text, Type, Union
+Tensor = Any
+
+
+class FinitePurifiedMPS(FiniteMPS):
+  """A purification of a finite-temperature density matrix.
+
+  Each site carries a physical and an ancilla leg of equal dimension `d`,
+  which are fused into a single leg of dimension `d**2` (with the
+  ancilla index running fastest). The density matrix
+  :math:`\\rho = \\mathrm{Tr}_a |\\psi\\rangle\\langle\\psi|` is obtained by
+  tracing out the ancillas. Because the purification is a `FiniteMPS`, all
+  gate applications, truncations and canonicalizations use the
+  `FiniteMPS` machinery.
+
+  A thermal state at inverse temperature `beta` is obtained with
+  `FinitePurifiedMPS.infinite_temperature`, followed by
+  `FinitePurifiedMPS.imaginary_time_evolution`. The state is kept
+  normalized, such that expectation values of physical operators are
+  thermal expectation values :math:`\\mathrm{Tr}(\\rho O)/\\mathrm{Tr}\\rho`.
+  """
+
+  def __init__(self,
+               tensors: List[Tensor],
+               center_position: Optional[int] = None,
+               canonicalize: Optional[bool] = True,
+               backend: Optional[Union[AbstractBackend, Text]] = None) -> None:
+    """Initialize a `FinitePurifiedMPS`. See `FiniteMPS.__init__` for
+    the arguments. The physical dimension of each tensor has to be the
+    square of the dimension of the local Hilbert space.
+
+    Raises:
+      ValueError: If a physical dimension is not a square.
+    """
+    super().__init__(
+        tensors=tensors,
+        center_position=center_position,
+        canonicalize=canonicalize,
+        backend=backend)
+    self.local_dimensions = []
+    for dim in self.physical_dimensions:
+      d = int(np.round(np.sqrt(dim)))
+      if d * d != dim:
+        raise ValueError('physical dimension {} of a purified mps has to '
+                         'be a square'.format(dim))
+      self.local_dimensions.append(d)
+    self.beta = 0.0
+    self.log_norm = 0.0
+
+  @classmethod
+  def infinite_temperature(
+      cls,
+      d: List[int],
+      dtype: Type[np.number],
+      backend: Optional[Union[AbstractBackend, Text]] = None
+  ) -> "FinitePurifiedMPS":
+    """Initialize the purification of the infinite-temperature state
+    :math:`\\rho \\propto 1`, i.e. a product of maximally entangled states
+    of each physical leg with its ancilla.
+
+    Args:
+      d: A list of local (physical) dimensions.
+      dtype: A numpy dtype.
+      backend: An optional backend.
+    Returns:
+      `FinitePurifiedMPS`
+    """
+    tensors = [
+        np.reshape(np.eye(dim, dtype=dtype) / np.sqrt(dim), (1, dim**2, 1))
+        for dim in d
+    ]
+    return cls(tensors=tensors, center_position=0, backend=backend)
+
+  @property
+  def log_partition_function(self) -> float:
+    """The logarithm of the partition function :math:`Z(\\beta)`, obtained
+    from the norms removed during imaginary-time evolution."""
+    return float(np.sum(np.log(self.local_dimensions))) + 2 * self.log_norm
+
+  def _lift(self, op: Tensor) -> Tensor:
+    """Extend a physical operator with indices (out_1,...,out_n,
+    in_1,...,in_n) to the fused physical and ancilla legs by acting with
+    the identity on the ancillas."""
+    op = self.backend.convert_to_tensor(op)
+    n = len(op.shape) // 2
+    dims = [self.backend.shape_tuple(op)[m] for m in range(n)]
+    tensors = [op] + [self.backend.eye(dim, dtype=self.dtype) for dim in dims]
+    labels = [[-2 * m - 1 for m in range(n)] +
+              [-2 * m - 2 * n - 1 for m in range(n)]]
+    labels += [[-2 * m - 2, -2 * m - 2 * n - 2] for m in range(n)]
+    lifted = ncon(tensors, labels, backend=self.backend.name)
+    return self.backend.reshape(lifted, tuple(dim**2 for dim in dims) * 2)
+
+  def imaginary_time_evolution(self,
+                               terms: Sequence[Tensor],
+                               dbeta: float,
+                               num_steps: int,
+                               max_singular_values: Optional[int] = None,
+                               max_truncation_err: Optional[float] = None
+                              ) -> None:
+    """Cool the state from inverse temperature `beta` to
+    `beta + num_steps * dbeta` by applying :math:`e^{-\\beta H/2}` to the
+    physical legs, where `H` is a sum of nearest-neighbor terms.
+
+    Each step of size `dbeta` is a second-order Trotter step consisting
+    of a left-to-right and a right-to-left sweep of two-site gates
+    :math:`e^{-dbeta\\, h_{n,n+1}/4}`. The gates are applied with
+    `FiniteMPS.apply_two_site_gate` at the center position and truncated
+    according to `max_singular_values` and `max_truncation_err`.
+
+    Args:
+      terms: The `N - 1` two-site Hamiltonian terms `h_{n,n+1}`, each
+        with indices (out_n, out_n+1, in_n, in_n+1).
+      dbeta: The step size in inverse temperature.
+      num_steps: The number of steps.
+      max_singular_values: The maximum number of singular values to keep.
+      max_truncation_err: The maximum allowed truncation error.
+    Raises:
+      ValueError: If `len(terms) != len(mps) - 1`.
+    """
+    if len(terms) != len(self) - 1:
+      raise ValueError('len(terms) = {} is different from len(mps) - 1 = {}'
+                       .format(len(terms), len(self) - 1))
+    gates = []
+    for site, term in enumerate(terms):
+      d1, d2 = self.local_dimensions[site:site + 2]
+      # pylint: disable=no-member
+      gate = sp.linalg.expm(-dbeta / 4 * np.reshape(
+          np.array(term), (d1 * d2, d1 * d2)))
+      gates.append(
+          self._lift(
+              self.backend.convert_to_tensor(
+                  np.reshape(gate, (d1, d2, d1, d2)).astype(
+                      np.array(self.tensors[site]).dtype))))
+
+    def apply_gate(site):
+      self.position(site, normalize=False)
+      self.apply_two_site_gate(
+          gates[site],
+          site,
+          site + 1,
+          max_singular_values=max_singular_values,
+          max_truncation_err=max_truncation_err)
+      norm = self.backend.norm(self.tensors[site])
+      self.tensors[site] /= norm
+      self.log_norm += float(np.log(np.abs(np.array(norm))))
+
+    for _ in range(num_steps):
+      for site in range(len(self) - 1):
+        apply_gate(site)
+      for site in reversed(range(len(self) - 1)):
+        apply_gate(site)
+      self.beta += dbeta
+
+  def measure_local_operator(self, ops: List[Tensor],
+                             sites: Sequence[int]) -> List:
+    """Measure the thermal expectation values of local operators `ops`
+    acting on the physical legs at `sites`. See
+    `BaseMPS.measure_local_operator`."""
+    return super().measure_local_operator([self._lift(op) for op in ops],
+                                          sites)
+
+  def measure_two_body_correlator(self, op1: Tensor, op2: Tensor, site1: int,
+                                  sites2: Sequence[int]) -> List:
+    """Compute thermal correlators of operators `op1` and `op2` acting on
+    the physical legs. See `BaseMPS.measure_two_body_correlator`."""
+    return super().measure_two_body_correlator(
+        self._lift(op1), self._lift(op2), site1, sites2)
+
+  def expectation_string(self, ops_by_site) -> Tensor:
+    """Compute the thermal expectation value of a string of operators
+    acting on the physical legs. See `BaseMPS.expectation_string`."""
+    return super().expectation_string(
+        {site: self._lift(op) for site, op in ops_by_site.items()})
+
+  def expectation_mpo(self, mpo: FiniteMPO) -> Tensor:
+    """Compute the thermal expectation value of an MPO acting on the
+    physical legs. See `BaseMPS.expectation_mpo`."""
+    tensors = []
+    for tensor in mpo.tensors:
+      wl, wr, d, _ = self.backend.shape_tuple(tensor)
+      lifted = ncon([tensor, self.backend.eye(d, dtype=self.dtype)],
+                    [[-1, -2, -3, -5], [-4, -6]],
+                    backend=self.backend.name)
+      tensors.append(self.backend.reshape(lifted, (wl, wr, d**2, d**2)))
+    return super().expectation_mpo(FiniteMPO(tensors, backend=self.backend))
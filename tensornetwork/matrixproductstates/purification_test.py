@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+import scipy as sp
+import scipy.linalg
+from tensornetwork.matrixproductstates.purification import FinitePurifiedMPS
+from tensornetwork.matrixproductstates.mpo import FiniteXXZ
+
+
+@pytest.fixture(
+    name="backend_dtype_values",
+    params=[('numpy', np.float64), ('numpy', np.complex128),
+            ('tensorflow', np.float64), ('jax', np.float64)])
+def backend_dtype(request):
+  return request.param
+
+
+def get_bond_term():
+  sx = np.array([[0, 0.5], [0.5, 0]])
+  sy = np.array([[0, 0.5], [-0.5, 0]])
+  sz = np.diag([-0.5, 0.5])
+  return np.kron(sx, sx) - np.kron(sy, sy) + np.kron(sz, sz)
+
+
+def get_XXZ_Hamiltonian(N):
+  h = get_bond_term()
+  return sum(
+      np.kron(np.kron(np.eye(2**n), h), np.eye(2**(N - 2 - n)))
+      for n in range(N - 1))
+
+
+def test_infinite_temperature(backend_dtype_values):
+  backend, dtype = backend_dtype_values
+  N = 4
+  mps = FinitePurifiedMPS.infinite_temperature([2] * N,
+                                               dtype=dtype,
+                                               backend=backend)
+  assert mps.local_dimensions == [2] * N
+  assert mps.physical_dimensions == [4] * N
+  assert mps.bond_dimensions == [1] * (N + 1)
+  np.testing.assert_allclose(mps.log_partition_function, N * np.log(2))
+  sz = np.diag([-0.5, 0.5]).astype(dtype)
+  np.testing.assert_allclose(
+      mps.measure_local_operator([sz] * N, range(N)), [0.0] * N, atol=1E-14)
+
+
+def test_imaginary_time_evolution(backend_dtype_values):
+  backend, dtype = backend_dtype_values
+  N, dbeta, num_steps = 5, 0.02, 50
+  beta = dbeta * num_steps
+  H = get_XXZ_Hamiltonian(N)
+  # pylint: disable=no-member
+  rho = sp.linalg.expm(-beta * H)
+  Z = np.trace(rho)
+  mps = FinitePurifiedMPS.infinite_temperature([2] * N,
+                                               dtype=dtype,
+                                               backend=backend)
+  terms = [np.reshape(get_bond_term(), (2, 2, 2, 2)).astype(dtype)] * (N - 1)
+  mps.imaginary_time_evolution(
+      terms, dbeta, num_steps, max_truncation_err=1E-10)
+  np.testing.assert_allclose(mps.beta, beta)
+  np.testing.assert_allclose(mps.log_partition_function, np.log(Z), atol=1E-5)
+
+  mpo = FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=dtype,
+      backend=backend)
+  np.testing.assert_allclose(
+      mps.expectation_mpo(mpo), np.trace(rho @ H) / Z, atol=1E-5)
+
+  sz = np.diag([-0.5, 0.5])
+  szz = np.kron(np.kron(np.eye(2), np.kron(sz, sz)), np.eye(2**(N - 3)))
+  expected = np.trace(rho @ szz) / Z
+  sz = sz.astype(dtype)
+  np.testing.assert_allclose(
+      mps.measure_two_body_correlator(sz, sz, 1, [2])[0], expected, atol=1E-5)
+  np.testing.assert_allclose(
+      mps.expectation_string({
+          1: sz,
+          2: sz
+      }), expected, atol=1E-5)
+
+
+def test_purified_mps_raises():
+  with pytest.raises(ValueError):
+    FinitePurifiedMPS([np.ones((1, 3, 1))], backend='numpy')
+  mps = FinitePurifiedMPS.infinite_temperature([2] * 3,
+                                               dtype=np.float64,
+                                               backend='numpy')
+  with pytest.raises(ValueError):
+    mps.imaginary_time_evolution([np.zeros((2, 2, 2, 2))], 0.1, 1)
@@ -0,0 +1,325 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import scipy as sp
+import scipy.linalg
+from tensornetwork.matrixproductstates.dmrg import BaseDMRG
+from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
+from tensornetwork.matrixproductstates.mpo import FiniteMPO
+from tensornetwork.ncon_interface import ncon
+from typing import Any, Callable, List, Optional, Text
+Tensor = Any
+
+
+class FiniteTDVP(BaseDMRG):
+  """
+  Time evolution of a `FiniteMPS` using the time-dependent variational
+  principle (TDVP). In contrast to TEBD, TDVP can be used with arbitrary
+  (e.g. long-range) MPOs. Left and right environments are handled by
+  the machinery of `BaseDMRG`. The local time evolutions are computed
+  with a Lanczos approximation of the matrix exponential, i.e. the
+  effective Hamiltonians are never built explicitly. Time evolution is
+  run with `evolve_one_site` and `evolve_two_site`; the methods inherited
+  from `BaseDMRG` (e.g. `run_one_site`) run DMRG ground state
+  optimizations of the mps.
+  """
+
+  def __init__(self,
+               mps: FiniteMPS,
+               mpo: FiniteMPO,
+               name: Text = 'FiniteTDVP') -> None:
+    """
+    Initialize a finite TDVP simulation.
+    Args:
+      mps: A FiniteMPS object.
+      mpo: A FiniteMPO object.
+      name: An optional name for the simulation.
+    """
+    lshape = (mpo.tensors[0].shape[0], mps.tensors[0].shape[0],
+              mps.tensors[0].shape[0])
+    rshape = (mpo.tensors[-1].shape[1], mps.tensors[-1].shape[2],
+              mps.tensors[-1].shape[2])
+    lb = mps.backend.ones(lshape, dtype=mps.dtype)
+    rb = mps.backend.ones(rshape, dtype=mps.dtype)
+    super().__init__(
+        mps=mps, mpo=mpo, left_boundary=lb, right_boundary=rb, name=name)
+
+  def zero_site_matvec(self, bond_matrix, L, R):
+    return ncon([L, bond_matrix, R], [[3, 1, -1], [1, 2], [3, 2, -2]],
+                backend=self.backend.name)
+
+  def two_site_matvec(self, two_site_tensor, L, mpotensor1, mpotensor2, R):
+    return ncon([L, two_site_tensor, mpotensor1, mpotensor2, R],
+                [[1, 2, -1], [2, 3, 5, 7], [1, 4, -2, 3], [4, 6, -3, 5],
+                 [6, 7, -4]],
+                backend=self.backend.name)
+
+  def _inner(self, tensor1: Tensor, tensor2: Tensor) -> Tensor:
+    axes = list(range(len(tensor1.shape)))
+    return self.backend.tensordot(
+        self.backend.conj(tensor1), tensor2, [axes, axes])
+
+  def _lanczos_expm(self, matvec: Callable, args: List[Tensor],
+                    tensor: Tensor, factor: complex, num_krylov_vecs: int,
+                    delta: float) -> Tensor:
+    """
+    Compute :math:`\\exp(factor \\cdot H) x` for a hermitian linear
+    operator `H` given by `matvec(x, *args)`, using a Lanczos
+    approximation of the matrix exponential. Only the (small)
+    tridiagonal matrix of the Krylov space is exponentiated.
+    Args:
+      matvec: The matrix-vector product of `H`.
+      args: A list of arguments to `matvec`.
+      tensor: The `Tensor` to be evolved.
+      factor: The scalar prefactor of `H` in the exponential.
+      num_krylov_vecs: The maximum dimension of the Krylov space.
+      delta: If a Krylov vector has an L2 norm smaller than `delta`, an
+        invariant subspace has been found and the iteration is stopped.
+    Returns:
+      Tensor: The evolved tensor.
+    """
+    norm = self.backend.norm(tensor)
+    vector = tensor / norm
+    krylov_vecs = []
+    diag_elements = []
+    off_diag_elements = []
+    for n in range(num_krylov_vecs):
+      krylov_vecs.append(vector)
+      A_vector = matvec(vector, *args)
+      alpha = self._inner(vector, A_vector)
+      diag_elements.append(np.real(np.array(alpha)))
+      if n == num_krylov_vecs - 1:
+        break
+      # Krylov spaces are small here; full reorthogonalization is cheap
+      # compared to the matvec and keeps the exponential accurate
+      for v in krylov_vecs:
+        A_vector -= v * self._inner(v, A_vector)
+      beta = self.backend.norm(A_vector)
+      if np.abs(np.array(beta)) < delta:
+        break
+      off_diag_elements.append(np.real(np.array(beta)))
+      vector = A_vector / beta
+
+    A_tridiag = np.diag(diag_elements)
+    if len(off_diag_elements) > 0:
+      A_tridiag += np.diag(off_diag_elements, 1) + np.diag(
+          off_diag_elements, -1)
+    # pylint: disable=no-member
+    coefficients = sp.linalg.expm(factor * A_tridiag)[:, 0]
+    if np.isrealobj(coefficients):
+      coefficients = [float(c) for c in coefficients]
+    else:
+      coefficients = [complex(c) for c in coefficients]
+    result = krylov_vecs[0] * coefficients[0]
+    for c, v in zip(coefficients[1:], krylov_vecs[1:]):
+      result += v * c
+    return result * norm
+
+  def _evolution_factor(self, dt: float, imaginary_time: bool) -> complex:
+    if imaginary_time:
+      return -dt
+    return -1j * dt
+
+  def _local_energy(self) -> np.number:
+    site = self.mps.center_position
+    tensor = self.mps.tensors[site]
+    H_tensor = self.single_site_matvec(tensor, self.left_envs[site],
+                                       self.mpo.tensors[site],
+                                       self.right_envs[site])
+    return self._inner(tensor, H_tensor) / self._inner(tensor, tensor)
+
+  def _evolve_1s_sweep(self, sweep_dir: Text, factor: complex,
+                       num_krylov_vecs: int, delta: float) -> None:
+    """
+    Evolve the mps by a half time step using a single-site TDVP
+    sweep in direction `sweep_dir`.
+    """
+    N = len(self.mps)
+    if sweep_dir in ('r', 'right'):
+      sites = range(N)
+    else:
+      sites = reversed(range(N))
+
+    for site in sites:
+      tensor = self._lanczos_expm(
+          self.single_site_matvec,
+          [self.left_envs[site], self.mpo.tensors[site],
+           self.right_envs[site]],
+          self.mps.tensors[site], factor, num_krylov_vecs, delta)
+      tensor /= self.backend.norm(tensor)
+      if sweep_dir in ('r', 'right') and site < N - 1:
+        Q, R = self.mps.qr(tensor)
+        self.mps.tensors[site] = Q
+        self.left_envs[site + 1] = self.add_left_layer(self.left_envs[site], Q,
+                                                       self.mpo.tensors[site])
+        R = self._lanczos_expm(
+            self.zero_site_matvec,
+            [self.left_envs[site + 1], self.right_envs[site]], R, -factor,
+            num_krylov_vecs, delta)
+        self.mps.tensors[site + 1] = ncon([R, self.mps.tensors[site + 1]],
+                                          [[-1, 1], [1, -2, -3]],
+                                          backend=self.backend.name)
+        self.mps.center_position += 1
+      elif sweep_dir in ('l', 'left') and site > 0:
+        R, Q = self.mps.rq(tensor)
+        self.mps.tensors[site] = Q
+        self.right_envs[site - 1] = self.add_right_layer(
+            self.right_envs[site], Q, self.mpo.tensors[site])
+        R = self._lanczos_expm(
+            self.zero_site_matvec,
+            [self.left_envs[site], self.right_envs[site - 1]], R, -factor,
+            num_krylov_vecs, delta)
+        self.mps.tensors[site - 1] = ncon([self.mps.tensors[site - 1], R],
+                                          [[-1, -2, 1], [1, -3]],
+                                          backend=self.backend.name)
+        self.mps.center_position -= 1
+      else:
+        self.mps.tensors[site] = tensor
+
+  def _evolve_2s_sweep(self, sweep_dir: Text, factor: complex,
+                       num_krylov_vecs: int, delta: float,
+                       max_singular_values: Optional[int],
+                       max_truncation_err: Optional[float]) -> None:
+    """
+    Evolve the mps by a half time step using a two-site TDVP
+    sweep in direction `sweep_dir`.
+    """
+    N = len(self.mps)
+    if sweep_dir in ('r', 'right'):
+      sites = range(N - 1)
+    else:
+      sites = reversed(range(N - 1))
+
+    for site in sites:
+      two_site_tensor = ncon(
+          [self.mps.tensors[site], self.mps.tensors[site + 1]],
+          [[-1, -2, 1], [1, -3, -4]],
+          backend=self.backend.name)
+      two_site_tensor = self._lanczos_expm(self.two_site_matvec, [
+          self.left_envs[site], self.mpo.tensors[site],
+          self.mpo.tensors[site + 1], self.right_envs[site + 1]
+      ], two_site_tensor, factor, num_krylov_vecs, delta)
+      U, S, V, _ = self.backend.svd(
+          two_site_tensor,
+          pivot_axis=2,
+          max_singular_values=max_singular_values,
+          max_truncation_error=max_truncation_err,
+          relative=True)
+      S /= self.backend.norm(S)
+      if sweep_dir in ('r', 'right'):
+        self.mps.tensors[site] = U
+        self.mps.tensors[site + 1] = ncon([self.backend.diagflat(S), V],
+                                          [[-1, 1], [1, -2, -3]],
+                                          backend=self.backend.name)
+        self.mps.center_position = site + 1
+        self.left_envs[site + 1] = self.add_left_layer(self.left_envs[site], U,
+                                                       self.mpo.tensors[site])
+        if site < N - 2:
+          self.mps.tensors[site + 1] = self._lanczos_expm(
+              self.single_site_matvec, [
+                  self.left_envs[site + 1], self.mpo.tensors[site + 1],
+                  self.right_envs[site + 1]
+              ], self.mps.tensors[site + 1], -factor, num_krylov_vecs, delta)
+      else:
+        self.mps.tensors[site + 1] = V
+        self.mps.tensors[site] = ncon([U, self.backend.diagflat(S)],
+                                      [[-1, -2, 1], [1, -3]],
+                                      backend=self.backend.name)
+        self.mps.center_position = site
+        self.right_envs[site] = self.add_right_layer(self.right_envs[site + 1],
+                                                     V,
+                                                     self.mpo.tensors[site + 1])
+        if site > 0:
+          self.mps.tensors[site] = self._lanczos_expm(
+              self.single_site_matvec, [
+                  self.left_envs[site], self.mpo.tensors[site],
+                  self.right_envs[site]
+              ], self.mps.tensors[site], -factor, num_krylov_vecs, delta)
+
+  def evolve_one_site(self,
+                      dt: float,
+                      num_steps: int = 1,
+                      imaginary_time: bool = False,
+                      num_krylov_vecs: int = 10,
+                      delta: float = 1E-10) -> np.number:
+    """
+    Evolve the MPS with single-site TDVP. Each time step consists of
+    a sweep from left to right and a sweep back from right to left,
+    each evolving the state by `dt/2` (second order integrator).
+    The bond dimension of the MPS is not changed by single-site TDVP.
+    The state is kept normalized.
+    For real-time evolution the MPS has to have a complex dtype.
+    Args:
+      dt: The time step.
+      num_steps: The number of time steps.
+      imaginary_time: If `True`, evolve with :math:`\\exp(-dt H)`,
+        otherwise with :math:`\\exp(-i dt H)`.
+      num_krylov_vecs: Maximum dimension of the Krylov space used to
+        approximate the local matrix exponentials.
+      delta: If a Krylov vector :math: `x_n` has an L2 norm
+        :math:`\\lVert x_n\\rVert < delta`, the Krylov space is
+        considered exhausted.
+    Returns:
+      float/complex: The energy of the state after the last time step.
+    """
+    factor = self._evolution_factor(dt, imaginary_time) / 2.0
+    self.position(0)
+    self.compute_right_envs()
+    for _ in range(num_steps):
+      self._evolve_1s_sweep('right', factor, num_krylov_vecs, delta)
+      self._evolve_1s_sweep('left', factor, num_krylov_vecs, delta)
+    return self._local_energy()
+
+  def evolve_two_site(self,
+                      dt: float,
+                      num_steps: int = 1,
+                      imaginary_time: bool = False,
+                      max_singular_values: Optional[int] = None,
+                      max_truncation_err: Optional[float] = None,
+                      num_krylov_vecs: int = 10,
+                      delta: float = 1E-10) -> np.number:
+    """
+    Evolve the MPS with two-site TDVP. Each time step consists of
+    a sweep from left to right and a sweep back from right to left,
+    each evolving the state by `dt/2` (second order integrator).
+    In contrast to single-site TDVP the bond dimension can grow,
+    and is controlled by `max_singular_values` and `max_truncation_err`.
+    The state is kept normalized.
+    For real-time evolution the MPS has to have a complex dtype.
+    Args:
+      dt: The time step.
+      num_steps: The number of time steps.
+      imaginary_time: If `True`, evolve with :math:`\\exp(-dt H)`,
+        otherwise with :math:`\\exp(-i dt H)`.
+      max_singular_values: The maximum number of singular values to keep.
+      max_truncation_err: The maximum allowed (relative) truncation error.
+      num_krylov_vecs: Maximum dimension of the Krylov space used to
+        approximate the local matrix exponentials.
+      delta: If a Krylov vector :math: `x_n` has an L2 norm
+        :math:`\\lVert x_n\\rVert < delta`, the Krylov space is
+        considered exhausted.
+    Returns:
+      float/complex: The energy of the state after the last time step.
+    """
+    if len(self.mps) < 2:
+      raise ValueError("two-site TDVP requires an mps with at least 2 sites")
+    factor = self._evolution_factor(dt, imaginary_time) / 2.0
+    self.position(0)
+    self.compute_right_envs()
+    for _ in range(num_steps):
+      self._evolve_2s_sweep('right', factor, num_krylov_vecs, delta,
+                            max_singular_values, max_truncation_err)
+      self._evolve_2s_sweep('left', factor, num_krylov_vecs, delta,
+                            max_singular_values, max_truncation_err)
+    return self._local_energy()
@@ -0,0 +1,103 @@
+import pytest
+import numpy as np
+import scipy as sp
+import scipy.linalg
+from tensornetwork.matrixproductstates.finite_mps import FiniteMPS
+from tensornetwork.matrixproductstates.tdvp import FiniteTDVP
+from tensornetwork.matrixproductstates.mpo import FiniteXXZ, FiniteMPO
+
+
+@pytest.fixture(
+    name="backend_dtype_values",
+    params=[('numpy', np.complex128), ('jax', np.complex128)])
+def backend_dtype(request):
+  return request.param
+
+
+def get_XXZ_Hamiltonian(N, Jx, Jy, Jz):
+  Sx = {}
+  Sy = {}
+  Sz = {}
+  sx = np.array([[0, 0.5], [0.5, 0]])
+  sy = np.array([[0, 0.5], [-0.5, 0]])
+  sz = np.diag([-0.5, 0.5])
+  for n in range(N):
+    Sx[n] = np.kron(np.kron(np.eye(2**n), sx), np.eye(2**(N - 1 - n)))
+    Sy[n] = np.kron(np.kron(np.eye(2**n), sy), np.eye(2**(N - 1 - n)))
+    Sz[n] = np.kron(np.kron(np.eye(2**n), sz), np.eye(2**(N - 1 - n)))
+  H = np.zeros((2**N, 2**N))
+  for n in range(N - 1):
+    H += Jx * Sx[n] @ Sx[n + 1] - Jy * Sy[n] @ Sy[n + 1] + Jz * Sz[n] @ Sz[n +
+                                                                           1]
+  return H
+
+
+def to_dense(mps):
+  psi = np.array(mps.tensors[0])
+  for tensor in mps.tensors[1:]:
+    psi = np.tensordot(psi, np.array(tensor), ([psi.ndim - 1], [0]))
+  return np.ravel(psi)
+
+
+def get_mpo(N, dtype, backend):
+  return FiniteXXZ(
+      Jz=np.ones(N - 1),
+      Jxy=np.ones(N - 1),
+      Bz=np.zeros(N),
+      dtype=dtype,
+      backend=backend)
+
+
+def test_tdvp_one_site_real_time(backend_dtype_values):
+  np.random.seed(10)
+  backend, dtype = backend_dtype_values
+  N, D, dt, num_steps = 6, 8, 0.02, 10
+  H = get_XXZ_Hamiltonian(N, 1, 1, 1)
+  mps = FiniteMPS.random([2] * N, [D] * (N - 1), dtype=dtype, backend=backend)
+  psi = to_dense(mps)
+  tdvp = FiniteTDVP(mps, get_mpo(N, dtype, backend))
+  energy = tdvp.evolve_one_site(dt=dt, num_steps=num_steps)
+  # pylint: disable=no-member
+  exact = sp.linalg.expm(-1j * dt * num_steps * H) @ psi
+  overlap = np.abs(np.vdot(exact, to_dense(tdvp.mps)))
+  np.testing.assert_allclose(overlap, 1.0, atol=1E-6)
+  np.testing.assert_allclose(energy, np.vdot(psi, H @ psi), atol=1E-6)
+
+
+def test_tdvp_two_site_real_time(backend_dtype_values):
+  np.random.seed(10)
+  backend, dtype = backend_dtype_values
+  N, dt, num_steps = 6, 0.02, 10
+  H = get_XXZ_Hamiltonian(N, 1, 1, 1)
+  # start from a product state; two-site TDVP has to grow the bonds
+  mps = FiniteMPS.random([2] * N, [1] * (N - 1), dtype=dtype, backend=backend)
+  psi = to_dense(mps)
+  tdvp = FiniteTDVP(mps, get_mpo(N, dtype, backend))
+  tdvp.evolve_two_site(
+      dt=dt, num_steps=num_steps, max_singular_values=8, max_truncation_err=0)
+  # pylint: disable=no-member
+  exact = sp.linalg.expm(-1j * dt * num_steps * H) @ psi
+  overlap = np.abs(np.vdot(exact, to_dense(tdvp.mps)))
+  np.testing.assert_allclose(overlap, 1.0, atol=1E-6)
+  assert max(tdvp.mps.bond_dimensions) > 1
+
+
+def test_tdvp_imaginary_time_ground_state(backend_dtype_values):
+  np.random.seed(10)
+  backend, dtype = backend_dtype_values
+  N, D = 6, 8
+  H = get_XXZ_Hamiltonian(N, 1, 1, 1)
+  eta, _ = np.linalg.eigh(H)
+  mps = FiniteMPS.random([2] * N, [D] * (N - 1), dtype=dtype, backend=backend)
+  tdvp = FiniteTDVP(mps, get_mpo(N, dtype, backend))
+  energy = tdvp.evolve_one_site(dt=0.5, num_steps=40, imaginary_time=True)
+  np.testing.assert_allclose(np.real(energy), eta[0], atol=1E-8)
+  np.testing.assert_allclose(tdvp.mps.check_canonical(), 0.0, atol=1E-10)
+
+
+def test_tdvp_two_site_raises():
+  mps = FiniteMPS.random([2], [], dtype=np.float64, backend='numpy')
+  mpo = FiniteMPO([np.diag([-0.5, 0.5]).reshape(1, 1, 2, 2)], backend='numpy')
+  tdvp = FiniteTDVP(mps, mpo)
+  with pytest.raises(ValueError):
+    tdvp.evolve_two_site(dt=0.1, imaginary_time=True)
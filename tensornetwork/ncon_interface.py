@@ -14,11 +14,13 @@
 
 import warnings
 import numpy as np
-from typing import Any, Sequence, List, Optional, Union, Text, Tuple, Dict, Set
+from typing import (Any, Callable, Sequence, List, Optional, Union, Text,
+                    Tuple, Type, Dict, Set)
 from tensornetwork import network_components
 from tensornetwork.backend_contextmanager import get_default_backend
 from tensornetwork.backends import backend_factory
 from tensornetwork.backends.abstract_backend import AbstractBackend
+from tensornetwork.precision import PrecisionPolicy, is_complex_dtype
 import time
 Tensor = Any
 
@@ -238,15 +240,36 @@ def _check_network(network_structure: Sequence[Sequence[Union[int, str]]],
         f"tensor dimensions for labels {mismatched_labels} are mismatching")
 
 
+def _accumulate(reduction: Callable, tensor: Tensor,
+                accumulate_dtype: Optional[Type[np.number]],
+                backend_obj: AbstractBackend) -> Tensor:
+  """
+  Apply `reduction` to `tensor` in `accumulate_dtype` (if not `None`),
+  and cast the result back to the dtype of `tensor`.
+  """
+  if accumulate_dtype is None:
+    return reduction(tensor)
+  if not is_complex_dtype(tensor.dtype):
+    # the real counterpart of `accumulate_dtype`
+    accumulate_dtype = np.finfo(accumulate_dtype).dtype.type
+  return backend_obj.cast(
+      reduction(backend_obj.cast(tensor, accumulate_dtype)), tensor.dtype)
+
+
 def _partial_trace(
-    tensor: Tensor, labels: List,
-    backend_obj: AbstractBackend) -> Tuple[Tensor, List, List]:
+    tensor: Tensor,
+    labels: List,
+    backend_obj: AbstractBackend,
+    accumulate_dtype: Optional[Type[np.number]] = None
+) -> Tuple[Tensor, List, List]:
   """
   Perform the partial trace of `tensor`.
   All labels appearing twice in `labels` are traced out.
   Argns:
     tensor: A tensor.
     labels: The ncon-style labels of `tensor`.
+    backend_obj: A backend object.
+    accumulate_dtype: An optional dtype in which the trace is accumulated.
   Returns:
     Tensor: The result of the tracing.
   """
@@ -267,11 +290,12 @@ def _partial_trace(
         [shape[d] for d in contracted_indices[:num_cont]])
     temp_shape = tuple([shape[pos] for pos in free_indices] +
                        [contracted_dimension, contracted_dimension])
-    result = backend_obj.trace(
+    result = _accumulate(
+        backend_obj.trace,
         backend_obj.reshape(
             backend_obj.transpose(tensor,
                                   tuple(free_indices + contracted_indices)),
-            temp_shape))
+            temp_shape), accumulate_dtype, backend_obj)
     new_labels = [l for l in labels if l not in unique_trace_labels]
     return result, new_labels, unique_trace_labels
   return tensor, labels, []
@@ -335,7 +359,17 @@ def _batch_cont(
 
   mat1 = backend_obj.reshape(backend_obj.transpose(t1, order_t1), newshape_t1)
   mat2 = backend_obj.reshape(backend_obj.transpose(t2, order_t2), newshape_t2)
-  result = backend_obj.matmul(mat1, mat2)
+  if backend_obj.supports_batched_matmul:
+    result = backend_obj.matmul(mat1, mat2)
+  else:
+    # broadcast the elementwise product and sum over the contracted axis
+    batch, rows, inner = newshape_t1
+    cols = newshape_t2[2]
+    result = backend_obj.sum(
+        backend_obj.multiply(
+            backend_obj.reshape(mat1, (batch, rows, inner, 1)),
+            backend_obj.reshape(mat2, (batch, 1, inner, cols))),
+        axis=(2,))
   final_shape = tuple(
       np.concatenate([
           t1_shape[t1_batch_pos], t1_shape[free_pos_t1], t2_shape[free_pos_t2]
@@ -364,7 +398,9 @@ def label_intersection(labels1, labels2):
 def _jittable_ncon(tensors: List[Tensor], flat_labels: Tuple[int],
                    sizes: Tuple[int], con_order: Tuple[int],
                    out_order: Tuple[int],
-                   backend_obj: AbstractBackend) -> Tensor:
+                   backend_obj: AbstractBackend,
+                   accumulate_dtype: Optional[Type[np.number]] = None
+                  ) -> Tensor:
   """
   Jittable Ncon function. Performs the contraction of `tensors`.
   Args:
@@ -375,6 +411,9 @@ def _jittable_ncon(tensors: List[Tensor], flat_labels: Tuple[int],
     con_order: Order of the contraction.
     out_order: Order of the final axis order.
     backend_obj: A backend object.
+    accumulate_dtype: An optional dtype in which reductions (partial
+      traces, sums and contractions to a scalar) are accumulated. The
+      result is returned in this dtype.
 
   Returns:
     The final tensor after contraction.
@@ -394,7 +433,7 @@ def _jittable_ncon(tensors: List[Tensor], flat_labels: Tuple[int],
   # partial trace
   for n, tensor in enumerate(tensors):
     tensors[n], network_structure[n], contracted_labels = _partial_trace(
-        tensor, network_structure[n], backend_obj)
+        tensor, network_structure[n], backend_obj, accumulate_dtype)
     if len(contracted_labels) > 0:
       con_order = [c for c in con_order if c not in contracted_labels]
 
@@ -416,7 +455,9 @@ def _jittable_ncon(tensors: List[Tensor], flat_labels: Tuple[int],
     labels = network_structure[loc]
     contractable_inds = [labels.index(l) for l in contractable_labels]
     network_structure[loc] = [l for l in labels if l not in contractable_labels]
-    tensors[loc] = backend_obj.sum(tensors[loc], tuple(contractable_inds))
+    tensors[loc] = _accumulate(
+        lambda t, inds=tuple(contractable_inds): backend_obj.sum(t, inds),
+        tensors[loc], accumulate_dtype, backend_obj)
 
   # perform binary and batch contractions
   skip_counter = 0
@@ -481,6 +522,11 @@ def _jittable_ncon(tensors: List[Tensor], flat_labels: Tuple[int],
     else:
       # for len(t1_cont)~<20 this is faster than np.argsort
       ind_sort = [t1_cont.index(l) for l in sorted(t1_cont)]
+      if (accumulate_dtype is not None) and (len(t1_cont) == len(labels_t1)
+                                             == len(labels_t2)):
+        # a contraction to a scalar is a reduction
+        t1 = backend_obj.cast(t1, accumulate_dtype)
+        t2 = backend_obj.cast(t2, accumulate_dtype)
       tensors.append(
           backend_obj.tensordot(
               t1,
@@ -512,12 +558,15 @@ def _jittable_ncon(tensors: List[Tensor], flat_labels: Tuple[int],
       tensors.append(backend_obj.outer_product(t1, t2))
       network_structure.append(labels_t1 + labels_t2)
 
+  result = tensors[0]
+  if accumulate_dtype is not None:
+    result = backend_obj.cast(result, accumulate_dtype)
   # if necessary do a final permutation
   if len(network_structure[0]) > 1:
     labels = network_structure[0]
     final_order = tuple([labels.index(l) for l in out_order])
-    return backend_obj.transpose(tensors[0], final_order)
-  return tensors[0]
+    return backend_obj.transpose(result, final_order)
+  return result
 
 
 def ncon(
@@ -526,7 +575,8 @@ def ncon(
     con_order: Optional[Sequence] = None,
     out_order: Optional[Sequence] = None,
     check_network: bool = True,
-    backend: Optional[Union[Text, AbstractBackend]] = None
+    backend: Optional[Union[Text, AbstractBackend]] = None,
+    precision: Optional[PrecisionPolicy] = None
 ) -> Union[network_components.AbstractNode, Tensor]:
   r"""Contracts a list of tensors or nodes according to a tensor network 
     specification.
@@ -593,6 +643,9 @@ def ncon(
       check_network: Boolean flag. If `True` check the network.
       backend: String specifying the backend to use. Defaults to
         `tensornetwork.backend_contextmanager.get_default_backend`.
+      precision: An optional `PrecisionPolicy`. If given, the contraction
+        is performed in mixed precision, and the result is returned in
+        the accumulation dtype of the policy.
 
     Returns:
       The result of the contraction. The result is returned as a `Node`
@@ -650,13 +703,24 @@ def ncon(
     con_order = sorted([l for l in unique_flat_labels if l > 0])
   else:
     con_order = [mapping[o] for o in con_order]
+  inputs, accumulate_dtype = _tensors, None
+  if precision is not None:
+    accumulate_dtype = np.result_type(
+        *[precision.get_accumulate_dtype(t.dtype) for t in _tensors]).type
+    _tensors = precision.to_storage(_tensors, backend_obj)
   if backend not in _CACHED_JITTED_NCONS:
-    _CACHED_JITTED_NCONS[backend] = backend_obj.jit(
-        _jittable_ncon, static_argnums=(1, 2, 3, 4, 5))
+    if backend_obj.supports_jit:
+      _CACHED_JITTED_NCONS[backend] = backend_obj.jit(
+          _jittable_ncon, static_argnums=(1, 2, 3, 4, 5, 6))
+    else:
+      _CACHED_JITTED_NCONS[backend] = _jittable_ncon
   sizes = tuple([len(l) for l in network_structure])
   res_tensor = _CACHED_JITTED_NCONS[backend](_tensors, tuple(flat_labels),
                                              sizes, tuple(con_order),
-                                             tuple(out_order), backend_obj)
+                                             tuple(out_order), backend_obj,
+                                             accumulate_dtype)
+  if precision is not None and precision.num_error_samples > 0:
+    precision.estimate_error(inputs, network_structure, out_order, res_tensor)
   if all(are_nodes):
     return network_components.Node(res_tensor, backend=backend_obj)
   return res_tensor
@@ -14,19 +14,19 @@
 """Implementation of Network Components."""
 
 from typing import Any, Dict, List, Optional, Set, Text, Tuple, Type, Union, \
-  overload, Sequence, Iterable
+  overload, Sequence, Iterable, TYPE_CHECKING
 import numpy as np
 from abc import ABC
 from abc import abstractmethod
-import h5py
 
 #pylint: disable=useless-import-alias
 from tensornetwork import ops
 from tensornetwork.backends import backend_factory
 from tensornetwork.backends.abstract_backend import AbstractBackend
 from tensornetwork.backend_contextmanager import get_default_backend
-
-string_type = h5py.special_dtype(vlen=str)
+if TYPE_CHECKING:
+  # h5py is only imported when nodes are saved to disk
+  import h5py
 Tensor = Any
 
 # This is required because of the circular dependency between
@@ -437,7 +437,7 @@ class AbstractNode(ABC):
 
   @classmethod
   @abstractmethod
-  def _load_node(cls, node_data: h5py.Group) -> "AbstractNode":
+  def _load_node(cls, node_data: "h5py.Group") -> "AbstractNode":
     """load a node based on hdf5 data.
 
     Args:
@@ -449,7 +449,8 @@ class AbstractNode(ABC):
     return
 
   @classmethod
-  def _load_node_data(cls, node_data: h5py.Group) -> Tuple[Any, Any, Any, Any]:
+  def _load_node_data(cls,
+                      node_data: "h5py.Group") -> Tuple[Any, Any, Any, Any]:
     """Common method to enable loading nodes based on hdf5 data. Only a common
     functionality to load node properties is implemented.
 
@@ -466,13 +467,15 @@ class AbstractNode(ABC):
     return name, shape, axis_names, backend
 
   @abstractmethod
-  def _save_node(self, node_group: h5py.Group) -> None:
+  def _save_node(self, node_group: "h5py.Group") -> None:
     """Abstract method to enable saving nodes to hdf5. Only serializing common
     properties is implemented. Should be overwritten by subclasses.
 
     Args:
       node_group: h5py group where data is saved
     """
+    import h5py  # pylint: disable=import-outside-toplevel
+    string_type = h5py.special_dtype(vlen=str)
     node_group.create_dataset('type', data=type(self).__name__)
     node_group.create_dataset('backend', data=self.backend.name)
     node_group.create_dataset('name', data=self.name)
@@ -669,7 +672,7 @@ class Node(AbstractNode):
   def tensor(self, tensor: Tensor) -> Tensor:
     self._tensor = tensor
 
-  def _save_node(self, node_group: h5py.Group) -> None:
+  def _save_node(self, node_group: "h5py.Group") -> None:
     """Method to save a node to hdf5.
 
     Args:
@@ -679,7 +682,7 @@ class Node(AbstractNode):
     node_group.create_dataset('tensor', data=self._tensor)
 
   @classmethod
-  def _load_node(cls, node_data: h5py.Group) -> "AbstractNode":
+  def _load_node(cls, node_data: "h5py.Group") -> "AbstractNode":
     """Load a node based on hdf5 data.
 
     Args:
@@ -879,7 +882,7 @@ class CopyNode(AbstractNode):
     return self.backend.einsum(einsum_expression, *tensors)
 
   # pylint: disable=W0235
-  def _save_node(self, node_group: h5py.Group) -> None:
+  def _save_node(self, node_group: "h5py.Group") -> None:
     """Method to save a node to hdf5.
 
     Args:
@@ -890,7 +893,7 @@ class CopyNode(AbstractNode):
         name='copy_node_dtype', data=np.dtype(self.copy_node_dtype).name)
 
   @classmethod
-  def _load_node(cls, node_data: h5py.Group) -> "CopyNode":
+  def _load_node(cls, node_data: "h5py.Group") -> "CopyNode":
     """Load a node based on hdf5 data.
 
     Args:
@@ -1127,7 +1130,7 @@ class Edge:
       raise TypeError("Edge name should be str type")
     self.name = name
 
-  def _save_edge(self, edge_group: h5py.Group) -> None:
+  def _save_edge(self, edge_group: "h5py.Group") -> None:
     """Method to save an edge to hdf5.
 
     Args:
@@ -1141,7 +1144,7 @@ class Edge:
     edge_group.create_dataset('name', data=self.name)
 
   @classmethod
-  def _load_edge(cls, edge_data: h5py.Group, nodes_dict: Dict[Text,
+  def _load_edge(cls, edge_data: "h5py.Group", nodes_dict: Dict[Text,
                                                               AbstractNode]):
     """load an edge based on hdf5 data.
 
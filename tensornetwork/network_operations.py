@@ -133,6 +133,8 @@ def split_node(
     left_name: Optional[Text] = None,
     right_name: Optional[Text] = None,
     edge_name: Optional[Text] = None,
+    method: Text = 'full',
+    seed: Optional[int] = None,
 ) -> Tuple[AbstractNode, AbstractNode, Tensor]:
   """Split a `node` using Singular Value Decomposition.
 
@@ -176,6 +178,12 @@ def split_node(
     edge_name: The name of the new `Edge` connecting the new left and
       right node. If `None`, a name will be generated automatically.
       The new axis will get the same name as the edge.
+    method: The SVD algorithm, one of `'full'`, `'randomized'` or
+      `'lanczos'`. The truncated methods require `max_singular_values` and
+      avoid the full SVD when few singular values are kept, see
+      `AbstractBackend.svd`.
+    seed: Seed for the random starting matrix of the truncated methods. If
+      `None`, a nondeterministic seed is used.
 
   Returns:
     A tuple containing:
@@ -217,7 +225,9 @@ def split_node(
       len(left_edges),
       max_singular_values,
       max_truncation_err,
-      relative=relative)
+      relative=relative,
+      method=method,
+      seed=seed)
   sqrt_s = backend.sqrt(s)
   u_s = backend.broadcast_right_multiplication(u, sqrt_s)
   vh_s = backend.broadcast_left_multiplication(sqrt_s, vh)
@@ -440,6 +450,8 @@ def split_node_full_svd(
     right_name: Optional[Text] = None,
     left_edge_name: Optional[Text] = None,
     right_edge_name: Optional[Text] = None,
+    method: Text = 'full',
+    seed: Optional[int] = None,
 ) -> Tuple[AbstractNode, AbstractNode, AbstractNode, Tensor]:
   """Split a node by doing a full singular value decomposition.
 
@@ -488,6 +500,12 @@ def split_node_full_svd(
     right_edge_name: The name of the new right `Edge` connecting
       the new central node (:math:`S`) and the new right node (:math:`V*`).
       If `None`, a name will be generated automatically.
+    method: The SVD algorithm, one of `'full'`, `'randomized'` or
+      `'lanczos'`. The truncated methods require `max_singular_values` and
+      avoid the full SVD when few singular values are kept, see
+      `AbstractBackend.svd`.
+    seed: Seed for the random starting matrix of the truncated methods. If
+      `None`, a nondeterministic seed is used.
 
   Returns:
     A tuple containing:
@@ -535,7 +553,9 @@ def split_node_full_svd(
       len(left_edges),
       max_singular_values,
       max_truncation_err,
-      relative=relative)
+      relative=relative,
+      method=method,
+      seed=seed)
   left_node = Node(
       u, name=left_name, axis_names=left_axis_names, backend=backend)
   singular_values_node = Node(
@@ -0,0 +1,182 @@
+# Copyright 2019 The TensorNetwork Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Mixed-precision policies for `ncon` and the `contractors`."""
+
+from typing import Any, List, Optional, Sequence, Text, Type, Union
+import warnings
+import numpy as np
+from tensornetwork.backends.abstract_backend import AbstractBackend
+Tensor = Any
+
+
+def is_complex_dtype(dtype: Any) -> bool:
+  """Whether `dtype` (a numpy, torch or tensorflow dtype) is complex."""
+  # torch and tensorflow dtypes carry an `is_complex` attribute
+  is_complex = getattr(dtype, 'is_complex', None)
+  if is_complex is not None:
+    return bool(is_complex)
+  return np.issubdtype(np.dtype(dtype), np.complexfloating)
+
+
+class PrecisionPolicy:
+  """A mixed-precision policy for tensor network contractions.
+
+  Input tensors are cast to `storage_dtype` (or its complex counterpart
+  for complex inputs) before the contraction, such that all intermediate
+  tensors are stored in reduced precision. Reductions (partial traces,
+  sums over labels appearing on a single tensor, and contractions
+  resulting in a scalar) are accumulated in `accumulate_dtype`, and the
+  final result is returned in `accumulate_dtype`.
+
+  If `num_error_samples > 0`, each contraction is checked against a
+  `numpy` contraction in `accumulate_dtype` of `num_error_samples`
+  randomly chosen slices of the largest output dimension. The relative
+  error of the sampled slices is stored in `error_estimate`, which is
+  overwritten by each contraction using the policy. A policy with
+  `num_error_samples > 0` should therefore not be shared between
+  contractions running concurrently.
+
+  With the `jax` backend, 64 bit dtypes are only available if
+  `jax_enable_x64` is set; otherwise reductions are accumulated in
+  32 bit, and a warning is issued.
+
+  Example:
+
+  .. code-block:: python
+
+    policy = tn.PrecisionPolicy(np.float32, num_error_samples=4)
+    result = tn.ncon([A, B], [(-1, 1), (1, -2)], precision=policy)
+    print(policy.error_estimate)
+
+  Args:
+    storage_dtype: The real dtype used to store tensors, or `'bfloat16'`
+      (`jax` backend only; complex tensors are then stored as
+      `complex64`).
+    accumulate_dtype: The real dtype used for reductions and the result.
+    num_error_samples: The number of sampled slices used to estimate the
+      error. Set to 0 to disable error estimation.
+    seed: An optional seed for choosing the sampled slices.
+  """
+
+  def __init__(self,
+               storage_dtype: Union[Type[np.number], Text] = np.float32,
+               accumulate_dtype: Type[np.number] = np.float64,
+               num_error_samples: int = 0,
+               seed: Optional[int] = None) -> None:
+    if num_error_samples < 0:
+      raise ValueError("num_error_samples = {} has to be non-negative".format(
+          num_error_samples))
+    if storage_dtype != 'bfloat16':
+      storage_dtype = np.dtype(storage_dtype).type
+      if not np.issubdtype(storage_dtype, np.floating):
+        raise ValueError(
+            "storage_dtype = {} has to be a real floating point dtype".format(
+                storage_dtype))
+    accumulate_dtype = np.dtype(accumulate_dtype).type
+    if not np.issubdtype(accumulate_dtype, np.floating):
+      raise ValueError(
+          "accumulate_dtype = {} has to be a real floating point dtype".format(
+              accumulate_dtype))
+    self.storage_dtype = storage_dtype
+    self.accumulate_dtype = accumulate_dtype
+    self.num_error_samples = num_error_samples
+    self.seed = seed
+    self.error_estimate = None
+
+  def get_storage_dtype(self, dtype: Any, backend_obj: AbstractBackend) -> Any:
+    """The dtype used to store tensors of dtype `dtype`."""
+    if self.storage_dtype == 'bfloat16':
+      if backend_obj.name != 'jax':
+        raise ValueError("bfloat16 storage is only supported by the jax "
+                         "backend, got backend '{}'".format(backend_obj.name))
+      if is_complex_dtype(dtype):
+        return np.complex64
+      import jax.numpy as jnp  # pylint: disable=import-outside-toplevel
+      return jnp.bfloat16
+    if is_complex_dtype(dtype):
+      return np.result_type(self.storage_dtype, np.complex64).type
+    return self.storage_dtype
+
+  def get_accumulate_dtype(self, dtype: Any) -> Type[np.number]:
+    """The dtype used for reductions of tensors of dtype `dtype`."""
+    if is_complex_dtype(dtype):
+      return np.result_type(self.accumulate_dtype, np.complex64).type
+    return self.accumulate_dtype
+
+  def to_storage(self, tensors: Sequence[Tensor],
+                 backend_obj: AbstractBackend) -> List[Tensor]:
+    """Cast `tensors` to their storage dtypes."""
+    is_64bit = np.dtype(self.accumulate_dtype).itemsize > 4
+    if backend_obj.name == 'jax' and is_64bit:
+      import jax  # pylint: disable=import-outside-toplevel
+      if not jax.config.jax_enable_x64:
+        warnings.warn("accumulate_dtype = {} requires `jax_enable_x64`; "
+                      "reductions are accumulated in 32 bit".format(
+                          np.dtype(self.accumulate_dtype).name))
+    return [
+        backend_obj.cast(t, self.get_storage_dtype(t.dtype, backend_obj))
+        for t in tensors
+    ]
+
+  def estimate_error(self, tensors: Sequence[Tensor],
+                     network_structure: Sequence[Sequence[int]],
+                     out_order: Sequence[int], result: Tensor) -> float:
+    """Estimate the relative error of `result` by contracting randomly
+    sampled slices of the network in `accumulate_dtype` with `numpy`.
+    The estimate is stored in `error_estimate`.
+
+    Args:
+      tensors: The input tensors (before the cast to `storage_dtype`).
+      network_structure: The canonical `ncon` labels of `tensors`, i.e.
+        positive integers for contracted and negative integers for
+        open labels.
+      out_order: The labels of the axes of `result`.
+      result: The result of the mixed-precision contraction.
+    Returns:
+      float: The relative error of the sampled slices.
+    """
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from tensornetwork.ncon_interface import ncon
+    tensors = [
+        np.asarray(t).astype(self.get_accumulate_dtype(t.dtype))
+        for t in tensors
+    ]
+    result = np.asarray(result)
+    dims = {}
+    for labels, tensor in zip(network_structure, tensors):
+      dims.update(zip(labels, tensor.shape))
+    if len(out_order) > 0:
+      label = max(out_order, key=lambda l: dims[l])
+      num_samples = min(self.num_error_samples, dims[label])
+      samples = np.sort(
+          np.random.RandomState(self.seed).choice(
+              dims[label], num_samples, replace=False))
+      sliced = []
+      for labels, tensor in zip(network_structure, tensors):
+        for axis, l in enumerate(labels):
+          if l == label:
+            tensor = np.take(tensor, samples, axis=axis)
+        sliced.append(tensor)
+      tensors = sliced
+      result = np.take(result, samples, axis=list(out_order).index(label))
+    expected = ncon(
+        tensors,
+        network_structure,
+        out_order=list(out_order),
+        check_network=False,
+        backend='numpy')
+    norm = np.linalg.norm(expected)
+    error = np.linalg.norm(result - expected)
+    self.error_estimate = float(error / norm) if norm > 0 else float(error)
+    return self.error_estimate
@@ -19,6 +19,7 @@ from tensornetwork import ncon_interface
 from tensornetwork.ncon_interface import (_get_cont_out_labels,
                                           _canonicalize_network_structure)
 from tensornetwork.backends.backend_factory import get_backend
+from tensornetwork.backends.numpy.numpy_backend import NumPyBackend
 from tensornetwork.contractors import greedy
 
 
@@ -564,6 +565,24 @@ def test_multiple_batched_matmul_1(backend):
   np.testing.assert_allclose(res, exp)
 
 
+def test_batched_matmul_without_backend_support():
+  np.random.seed(10)
+
+  class UnbatchedNumPyBackend(NumPyBackend):
+    supports_batched_matmul = False
+
+    def matmul(self, tensor1, tensor2):
+      raise NotImplementedError()
+
+  backend = UnbatchedNumPyBackend()
+  a = np.random.randn(2, 4, 4, 10)
+  b = np.random.randn(4, 4, 10, 5)
+  res = ncon_interface.ncon([a, b], [(-1, 1, 2, -2), (1, 2, -2, -3)],
+                            backend=backend)
+  exp = np.einsum('abck,bcke->ake', a, b)
+  np.testing.assert_allclose(res, exp)
+
+
 def test_multiple_batched_matmul_2(backend):
   np.random.seed(10)
   batchsize1 = 10
@@ -92,6 +92,45 @@ def test_split_node_full_svd_relative_tolerance(backend):
   np.testing.assert_almost_equal(trunc_sv_relative, [0.2, 0.1])
 
 
+@pytest.mark.parametrize("method", ['randomized', 'lanczos'])
+def test_split_node_truncated_svd_methods(backend, method):
+  np.random.seed(10)
+  unitary1, _ = np.linalg.qr(np.random.randn(60, 50))
+  unitary2, _ = np.linalg.qr(np.random.randn(50, 50))
+  singular_values = 0.5**np.arange(50)
+  val = unitary1.dot(np.diag(singular_values).dot(unitary2.T))
+  expected = unitary1[:, :4].dot(np.diag(singular_values[:4])).dot(
+      unitary2[:, :4].T)
+
+  a = tn.Node(np.reshape(val, (6, 10, 50)), backend=backend)
+  left, right, _ = tn.split_node(
+      a, [a[0], a[1]], [a[2]], max_singular_values=4, method=method)
+  np.testing.assert_allclose(
+      np.reshape(tn.contract_between(left, right).tensor, (60, 50)),
+      expected, atol=1E-10)
+
+  a = tn.Node(np.reshape(val, (6, 10, 50)), backend=backend)
+  left, middle, right, _ = tn.split_node_full_svd(
+      a, [a[0], a[1]], [a[2]], max_singular_values=4, method=method)
+  np.testing.assert_allclose(middle.tensor, np.diag(singular_values[:4]))
+  result = tn.contract_between(tn.contract_between(left, middle), right)
+  np.testing.assert_allclose(
+      np.reshape(result.tensor, (60, 50)), expected, atol=1E-10)
+
+
+@pytest.mark.parametrize("method", ['randomized', 'lanczos'])
+def test_split_node_truncated_svd_methods_seed(backend, method):
+  val = np.random.rand(6, 10, 50)
+  a = tn.Node(val, backend=backend)
+  left1, right1, _ = tn.split_node(
+      a, [a[0], a[1]], [a[2]], max_singular_values=4, method=method, seed=10)
+  a = tn.Node(val, backend=backend)
+  left2, right2, _ = tn.split_node(
+      a, [a[0], a[1]], [a[2]], max_singular_values=4, method=method, seed=10)
+  np.testing.assert_array_equal(left1.tensor, left2.tensor)
+  np.testing.assert_array_equal(right1.tensor, right2.tensor)
+
+
 def test_split_node_rq_names(backend):
   a = tn.Node(np.zeros((2, 3, 4, 5, 6)), backend=backend)
   left_edges = []
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+import tensornetwork as tn
+from tensornetwork.backends import backend_factory
+from tensornetwork.contractors.opt_einsum_paths import path_contractors
+from tensornetwork.precision import PrecisionPolicy
+
+
+def test_precision_policy_raises():
+  with pytest.raises(ValueError):
+    PrecisionPolicy(num_error_samples=-1)
+  with pytest.raises(ValueError):
+    PrecisionPolicy(storage_dtype=np.int32)
+  with pytest.raises(ValueError):
+    PrecisionPolicy(accumulate_dtype=np.complex128)
+
+
+def test_precision_policy_dtypes():
+  backend = backend_factory.get_backend('numpy')
+  policy = PrecisionPolicy(np.float32, np.float64)
+  assert policy.get_storage_dtype(np.float64, backend) == np.float32
+  assert policy.get_storage_dtype(np.complex128, backend) == np.complex64
+  assert policy.get_accumulate_dtype(np.float32) == np.float64
+  assert policy.get_accumulate_dtype(np.complex64) == np.complex128
+
+
+def test_bfloat16_requires_jax():
+  backend = backend_factory.get_backend('numpy')
+  policy = PrecisionPolicy('bfloat16')
+  with pytest.raises(ValueError):
+    policy.get_storage_dtype(np.float64, backend)
+
+
+def test_ncon_mixed_precision(backend):
+  backend_obj = backend_factory.get_backend(backend)
+  np.random.seed(10)
+  a = np.random.randn(20, 10, 8)
+  b = np.random.randn(8, 10, 15)
+  policy = PrecisionPolicy(np.float32, num_error_samples=4, seed=10)
+  actual = tn.ncon([backend_obj.convert_to_tensor(a),
+                    backend_obj.convert_to_tensor(b)],
+                   [[-1, 1, 2], [2, 1, -2]],
+                   backend=backend,
+                   precision=policy)
+  expected = np.tensordot(a, b, ([1, 2], [1, 0]))
+  np.testing.assert_allclose(actual, expected, rtol=1E-4, atol=1E-4)
+  assert policy.error_estimate < 1E-5
+
+
+def test_ncon_mixed_precision_reductions():
+  np.random.seed(10)
+  a = np.random.randn(6, 6, 5) + 1j * np.random.randn(6, 6, 5)
+  b = np.random.randn(5, 4, 4)
+  policy = PrecisionPolicy(np.float32, num_error_samples=2)
+  actual = tn.ncon([a, b], [[1, 1, 2], [2, 3, 3]], precision=policy)
+  expected = np.einsum('iij,jkk', a, b)
+  assert actual.dtype == np.complex128
+  np.testing.assert_allclose(actual, expected, rtol=1E-5)
+  assert policy.error_estimate < 1E-5
+
+
+def test_ncon_bfloat16_jax():
+  import jax.numpy as jnp  # pylint: disable=import-outside-toplevel
+  np.random.seed(10)
+  a = np.random.randn(20, 10)
+  b = np.random.randn(10, 15)
+  policy = PrecisionPolicy('bfloat16', np.float32, num_error_samples=5)
+  actual = tn.ncon([jnp.array(a), jnp.array(b)], [[-1, 1], [1, -2]],
+                   backend='jax',
+                   precision=policy)
+  assert actual.dtype == np.float32
+  np.testing.assert_allclose(actual, a @ b, rtol=1E-1, atol=1E-1)
+  assert 1E-5 < policy.error_estimate < 1E-1
+
+
+
+def test_jax_accumulate_dtype_without_x64_warns():
+  import jax  # pylint: disable=import-outside-toplevel
+  backend = backend_factory.get_backend('jax')
+  policy = PrecisionPolicy(np.float32, np.float64)
+  enable_x64 = jax.config.jax_enable_x64
+  jax.config.update('jax_enable_x64', False)
+  try:
+    with pytest.warns(UserWarning, match="jax_enable_x64"):
+      policy.to_storage([np.ones(2)], backend)
+  finally:
+    jax.config.update('jax_enable_x64', enable_x64)
+
+
+@pytest.mark.parametrize("algorithm", ["optimal", "branch", "greedy", "auto"])
+def test_contractors_mixed_precision(algorithm):
+  np.random.seed(10)
+  a = tn.Node(np.random.randn(20, 10, 8))
+  b = tn.Node(np.random.randn(8, 10, 15))
+  c = tn.Node(np.random.randn(15, 3, 3))
+  expected = np.einsum('abc,cbd,dee->a', a.tensor, b.tensor, c.tensor)
+  a[2] ^ b[0]
+  a[1] ^ b[1]
+  b[2] ^ c[0]
+  c[1] ^ c[2]
+  policy = PrecisionPolicy(np.float32, num_error_samples=4, seed=10)
+  result = getattr(path_contractors, algorithm)(
+      [a, b, c], output_edge_order=[a[0]], precision=policy)
+  assert result.tensor.dtype == np.float64
+  np.testing.assert_allclose(result.tensor, expected, rtol=1E-4, atol=1E-4)
+  assert policy.error_estimate < 1E-5